@@ -0,0 +1,21 @@
+"""
+Command Entry Point
+CS101 Fall 2025 - Activity 05
+
+The modules in src/ import each other by plain name (from timer import ...),
+as they do when run from the src directory. The activity05 script and
+python -m src load this directory as the package `src` instead, so this shim
+puts the src directory on the import path before loading main.
+"""
+
+import os
+import sys
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+if SOURCE_DIR not in sys.path:
+    sys.path.insert(0, SOURCE_DIR)
+
+from main import main  # noqa: E402  (needs the path set up above)
+
+if __name__ == "__main__":
+    sys.exit(main())
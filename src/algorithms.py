@@ -6,8 +6,18 @@ This module contains complete algorithm implementations for doubling experiments
 All TODOs have been completed with working implementations.
 """
 
+import gc
+import math
 import random
+import statistics
 import time
+from contextlib import contextmanager
+
+from lazy_imports import lazy_import
+
+# NumPy is only loaded the first time it is used (see lazy_imports.py)
+np = lazy_import("numpy")
+NUMPY_AVAILABLE = np is not None
 
 
 def linear_search(data_list, target):
@@ -60,6 +70,86 @@ def binary_search(data_list, target):
     return -1
 
 
+def linear_search_batch(data_list, targets):
+    """
+    Search for many targets in an unsorted list with a single linear pass.
+    
+    Args:
+        data_list (list): List to search through
+        targets (list): Values to search for
+        
+    Returns:
+        list: Index of the first occurrence of each target, -1 if not found
+        
+    Time needed: Checks each element once, no matter how many targets there are
+    """
+    # SOLUTION: Put the targets in a set so each element is matched in one step
+    wanted = set(targets)
+    first_index = {}
+    for i, value in enumerate(data_list):
+        if value in wanted and value not in first_index:
+            first_index[value] = i
+            if len(first_index) == len(wanted):
+                break
+    return [first_index.get(target, -1) for target in targets]
+
+
+def binary_search_batch(data_list, targets):
+    """
+    Search for many targets in a SORTED list by merging it with the sorted targets.
+    
+    Args:
+        data_list (list): SORTED list to search through
+        targets (list): Values to search for
+        
+    Returns:
+        list: Index of the first occurrence of each target, -1 if not found
+        
+    Time needed: Sorts the targets, then walks both lists once side by side
+    """
+    # SOLUTION: Visit targets in sorted order, remembering where each came from,
+    # so the position in data_list only ever moves forward
+    order = sorted(range(len(targets)), key=lambda k: targets[k])
+    results = [-1] * len(targets)
+    n = len(data_list)
+    i = 0
+    
+    for k in order:
+        target = targets[k]
+        while i < n and data_list[i] < target:
+            i += 1
+        if i < n and data_list[i] == target:
+            results[k] = i
+    
+    return results
+
+
+def searchsorted_batch(data_list, targets):
+    """
+    Search for many targets in a SORTED list or array with NumPy's searchsorted.
+    
+    Args:
+        data_list: SORTED list or NumPy array to search through
+        targets (list): Values to search for
+        
+    Returns:
+        list: Index of the first occurrence of each target, -1 if not found
+        
+    Time needed: One vectorized binary search per target
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for searchsorted_batch: pip install numpy")
+    
+    data = np.asarray(data_list)
+    wanted = np.asarray(targets)
+    if len(data) == 0:
+        return [-1] * len(wanted)
+    positions = np.searchsorted(data, wanted, side="left")
+    clipped = np.minimum(positions, len(data) - 1)
+    found = (positions < len(data)) & (data[clipped] == wanted)
+    return np.where(found, positions, -1).tolist()
+
+
 def bubble_sort(data_list):
     """
     Sort a list using the bubble sort algorithm.
@@ -124,6 +214,449 @@ def selection_sort(data_list):
     return data_list
 
 
+def _merge(source, target, left, middle, right):
+    """Merge the sorted runs source[left:middle] and source[middle:right] into target."""
+    i = left
+    j = middle
+    for k in range(left, right):
+        if i < middle and (j >= right or source[i] <= source[j]):
+            target[k] = source[i]
+            i += 1
+        else:
+            target[k] = source[j]
+            j += 1
+
+
+def merge_sort(data_list):
+    """
+    Sort a list using top-down (recursive) merge sort.
+    
+    Args:
+        data_list (list): List to sort (will be modified in place)
+        
+    Returns:
+        list: The sorted list (same object as input)
+        
+    Time needed: Splits the list in half, sorts each half, then merges them
+    """
+    # SOLUTION: Sort halves recursively, alternating between the list and one
+    # scratch copy so each level merges without allocating new lists
+    def sort_range(source, target, left, right):
+        # Sorts source[left:right] into target[left:right]
+        if right - left < 2:
+            return
+        middle = (left + right) // 2
+        sort_range(target, source, left, middle)
+        sort_range(target, source, middle, right)
+        _merge(source, target, left, middle, right)
+    
+    scratch = data_list.copy()
+    sort_range(scratch, data_list, 0, len(data_list))
+    return data_list
+
+
+def merge_sort_bottom_up(data_list):
+    """
+    Sort a list using bottom-up (iterative) merge sort.
+    
+    Args:
+        data_list (list): List to sort (will be modified in place)
+        
+    Returns:
+        list: The sorted list (same object as input)
+        
+    Time needed: Merges runs of width 1, 2, 4, ... until one run covers the list
+    """
+    n = len(data_list)
+    source = data_list
+    target = data_list.copy()
+    width = 1
+    
+    while width < n:
+        for left in range(0, n, 2 * width):
+            middle = min(left + width, n)
+            right = min(left + 2 * width, n)
+            _merge(source, target, left, middle, right)
+        source, target = target, source
+        width *= 2
+    
+    # After an odd number of passes the sorted data lives in the scratch list
+    if source is not data_list:
+        data_list[:] = source
+    return data_list
+
+
+def _partition_three_way(data_list, low, high):
+    """
+    Partition data_list[low:high + 1] around a median-of-three pivot.
+    
+    Returns:
+        tuple: (lt, gt) with [low, lt) < pivot, [lt, gt] == pivot and (gt, high] > pivot
+    """
+    # Median of the first, middle and last elements as the pivot
+    middle = (low + high) // 2
+    a, b, c = data_list[low], data_list[middle], data_list[high]
+    if a <= b:
+        pivot = b if b <= c else (c if a <= c else a)
+    else:
+        pivot = a if a <= c else (c if b <= c else b)
+    
+    lt = low
+    i = low
+    gt = high
+    while i <= gt:
+        value = data_list[i]
+        if value < pivot:
+            data_list[lt], data_list[i] = value, data_list[lt]
+            lt += 1
+            i += 1
+        elif value > pivot:
+            data_list[gt], data_list[i] = value, data_list[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def quick_sort(data_list):
+    """
+    Sort a list using in-place quicksort with median-of-three pivots.
+    
+    A three-way partition groups all elements equal to the pivot together, so
+    lists with many duplicates (like our 1..1000 random data) stay fast.
+    
+    Args:
+        data_list (list): List to sort (will be modified in place)
+        
+    Returns:
+        list: The sorted list (same object as input)
+        
+    Time needed: Partitions around a pivot, then sorts the two smaller parts
+    """
+    # SOLUTION: Keep a stack of ranges still to sort instead of recursing, so
+    # unlucky pivots cannot hit Python's recursion limit
+    ranges = [(0, len(data_list) - 1)]
+    
+    while ranges:
+        low, high = ranges.pop()
+        if low >= high:
+            continue
+        
+        lt, gt = _partition_three_way(data_list, low, high)
+        ranges.append((low, lt - 1))
+        ranges.append((gt + 1, high))
+    
+    return data_list
+
+
+def heap_sort(data_list):
+    """
+    Sort a list using heap sort.
+    
+    Args:
+        data_list (list): List to sort (will be modified in place)
+        
+    Returns:
+        list: The sorted list (same object as input)
+        
+    Time needed: Builds a max-heap, then repeatedly moves the largest element to the end
+    """
+    def sift_down(start, end):
+        # Move data_list[start] down until the max-heap property holds in [start, end)
+        root = start
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end and data_list[child] < data_list[child + 1]:
+                child += 1
+            if data_list[root] >= data_list[child]:
+                return
+            data_list[root], data_list[child] = data_list[child], data_list[root]
+            root = child
+    
+    n = len(data_list)
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(start, n)
+    
+    for end in range(n - 1, 0, -1):
+        data_list[0], data_list[end] = data_list[end], data_list[0]
+        sift_down(0, end)
+    
+    return data_list
+
+
+def counting_sort(data_list):
+    """
+    Sort a list of integers using counting sort.
+    
+    Args:
+        data_list (list): List of integers to sort (will be modified in place)
+        
+    Returns:
+        list: The sorted list (same object as input)
+        
+    Time needed: Counts each value once, then writes the values back in order;
+    grows with the list size plus the range of values
+    """
+    if not data_list:
+        return data_list
+    
+    min_val = min(data_list)
+    counts = [0] * (max(data_list) - min_val + 1)
+    for value in data_list:
+        counts[value - min_val] += 1
+    
+    index = 0
+    for offset, count in enumerate(counts):
+        if count:
+            data_list[index:index + count] = [offset + min_val] * count
+            index += count
+    
+    return data_list
+
+
+def radix_sort(data_list, base=256):
+    """
+    Sort a list of integers using least-significant-digit radix sort.
+    
+    Args:
+        data_list (list): List of integers to sort (will be modified in place)
+        base (int): Number of buckets used for each digit
+        
+    Returns:
+        list: The sorted list (same object as input)
+        
+    Time needed: One bucketing pass per digit of the largest value
+    """
+    if not data_list:
+        return data_list
+    
+    # Shift values so negative numbers sort correctly
+    min_val = min(data_list)
+    values = [value - min_val for value in data_list]
+    largest = max(values)
+    
+    digit = 1
+    while largest // digit > 0:
+        buckets = [[] for _ in range(base)]
+        for value in values:
+            buckets[(value // digit) % base].append(value)
+        values = [value for bucket in buckets for value in bucket]
+        digit *= base
+    
+    data_list[:] = [value + min_val for value in values]
+    return data_list
+
+
+# Hybrid sort tuning: slices up to this size are insertion sorted
+INSERTION_SORT_THRESHOLD = 16
+# Inputs with at most this many estimated inversions per element count as nearly sorted
+NEARLY_SORTED_INVERSIONS = 4
+# Natural merging is used when runs are at least this long on average
+MIN_AVERAGE_RUN = 8
+
+HYBRID_STRATEGIES = ("insertion", "natural merge", "counting", "introsort")
+
+
+def _insertion_sort(data_list, low, high):
+    """Insertion sort data_list[low:high + 1] in place; fast when few elements are out of place."""
+    for i in range(low + 1, high + 1):
+        value = data_list[i]
+        j = i - 1
+        while j >= low and data_list[j] > value:
+            data_list[j + 1] = data_list[j]
+            j -= 1
+        data_list[j + 1] = value
+
+
+def _heap_sort_range(data_list, low, high):
+    """Heap sort data_list[low:high + 1] in place (introsort's guaranteed O(n log n) fallback)."""
+    def sift_down(root, end):
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end and data_list[low + child] < data_list[low + child + 1]:
+                child += 1
+            if data_list[low + root] >= data_list[low + child]:
+                return
+            data_list[low + root], data_list[low + child] = data_list[low + child], data_list[low + root]
+            root = child
+    
+    n = high - low + 1
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(start, n)
+    for end in range(n - 1, 0, -1):
+        data_list[low], data_list[low + end] = data_list[low + end], data_list[low]
+        sift_down(0, end)
+
+
+def _introsort(data_list):
+    """Quicksort that switches to heap sort when partitions keep coming out unbalanced."""
+    if len(data_list) < 2:
+        return
+    ranges = [(0, len(data_list) - 1, 2 * len(data_list).bit_length())]
+    while ranges:
+        low, high, depth = ranges.pop()
+        if high - low < INSERTION_SORT_THRESHOLD:
+            _insertion_sort(data_list, low, high)
+        elif depth == 0:
+            _heap_sort_range(data_list, low, high)
+        else:
+            lt, gt = _partition_three_way(data_list, low, high)
+            ranges.append((low, lt - 1, depth - 1))
+            ranges.append((gt + 1, high, depth - 1))
+
+
+def _natural_merge_sort(data_list, runs):
+    """Reverse the descending runs, then merge neighbouring runs until one is left."""
+    bounds = [0]
+    for start, end, descending in runs:
+        if descending:
+            data_list[start:end] = data_list[start:end][::-1]
+        bounds.append(end)
+    
+    source = data_list
+    target = data_list.copy()
+    while len(bounds) > 2:
+        merged = [0]
+        for k in range(0, len(bounds) - 1, 2):
+            if k + 2 < len(bounds):
+                _merge(source, target, bounds[k], bounds[k + 1], bounds[k + 2])
+                merged.append(bounds[k + 2])
+            else:
+                # An odd run out is carried over to the next pass unchanged
+                target[bounds[k]:bounds[k + 1]] = source[bounds[k]:bounds[k + 1]]
+                merged.append(bounds[k + 1])
+        source, target = target, source
+        bounds = merged
+    
+    if source is not data_list:
+        data_list[:] = source
+
+
+def analyze_presortedness(data_list):
+    """
+    Measure how much order a list already has, in one scan.
+    
+    Runs are maximal non-decreasing or strictly decreasing stretches (a
+    strictly decreasing run can be reversed without breaking stability). The
+    inversion estimate adds up how far each element falls below the largest
+    value before it, converted from values to positions using the density of
+    values. It never underestimates by much, so a list it calls nearly sorted
+    really is cheap to insertion sort.
+    
+    Args:
+        data_list (list): List to examine (not modified)
+        
+    Returns:
+        dict: 'size', 'runs' (list of (start, end, descending)), 'inversions'
+        (estimate, None for non-numeric data), 'min', 'max' and 'integers'
+        
+    Time needed: One pass over the list
+    """
+    n = len(data_list)
+    profile = {"size": n, "runs": [], "inversions": 0, "min": None, "max": None,
+               "integers": False}
+    if n == 0:
+        return profile
+    
+    runs = profile["runs"]
+    start = 0
+    descending = None  # Direction of the current run, unknown until its second element
+    largest = data_list[0]
+    shortfall = 0
+    for j in range(1, n):
+        previous, value = data_list[j - 1], data_list[j]
+        if descending is None:
+            descending = value < previous
+        elif (value < previous) != descending:
+            runs.append((start, j, descending))
+            start = j
+            descending = None
+        
+        if value < largest:
+            if shortfall is not None:
+                try:
+                    shortfall += largest - value
+                except TypeError:
+                    shortfall = None  # Values cannot be subtracted, so no estimate
+        else:
+            largest = value
+    runs.append((start, n, bool(descending)))
+    
+    profile["min"] = min(data_list)
+    profile["max"] = largest
+    if shortfall is None:
+        profile["inversions"] = None
+    elif shortfall:
+        profile["inversions"] = shortfall * n / (largest - profile["min"] + 1)
+    profile["integers"] = all(isinstance(value, int) for value in data_list)
+    return profile
+
+
+def choose_sort_strategy(data_list, profile=None):
+    """
+    Pick the sorting strategy hybrid_sort uses for a list.
+    
+    Args:
+        data_list (list): List that will be sorted
+        profile (dict): Result of analyze_presortedness, if already computed
+        
+    Returns:
+        str: One of HYBRID_STRATEGIES
+    """
+    if profile is None:
+        profile = analyze_presortedness(data_list)
+    n = profile["size"]
+    runs = len(profile["runs"])
+    inversions = profile["inversions"]
+    
+    if n <= INSERTION_SORT_THRESHOLD:
+        return "insertion"
+    if runs == 1:
+        return "natural merge"  # Already sorted, or only needs reversing
+    if inversions is not None and inversions <= NEARLY_SORTED_INVERSIONS * n:
+        return "insertion"
+    if profile["integers"] and profile["max"] - profile["min"] <= n:
+        return "counting"
+    if runs * MIN_AVERAGE_RUN <= n:
+        return "natural merge"
+    return "introsort"
+
+
+def hybrid_sort(data_list):
+    """
+    Sort a list with the strategy that suits how ordered it already is.
+    
+    One scan (analyze_presortedness) measures the runs, the inversions and
+    the value range, then the list goes to insertion sort (tiny or nearly
+    sorted), natural run merging (long runs), counting sort (small integer
+    range) or introsort (everything else).
+    
+    Args:
+        data_list (list): List to sort (will be modified in place)
+        
+    Returns:
+        list: The sorted list (same object as input)
+        
+    Time needed: Close to linear on nearly sorted or small-range input,
+    n log n in the worst case
+    """
+    profile = analyze_presortedness(data_list)
+    strategy = choose_sort_strategy(data_list, profile)
+    if strategy == "insertion":
+        _insertion_sort(data_list, 0, len(data_list) - 1)
+    elif strategy == "natural merge":
+        _natural_merge_sort(data_list, profile["runs"])
+    elif strategy == "counting":
+        counting_sort(data_list)
+    else:
+        _introsort(data_list)
+    return data_list
+
+
 def calculate_sum(data_list):
     """
     Calculate the sum of all elements in a list.
@@ -186,24 +719,142 @@ def find_minimum(data_list):
     return minimum
 
 
+def calculate_aggregates(data_list):
+    """
+    Calculate the count, sum, minimum, maximum and mean of a list in one pass.
+    
+    Args:
+        data_list (list): List of numbers
+        
+    Returns:
+        dict: 'count', 'sum', 'min', 'max' and 'mean' (min, max and mean are None if empty)
+        
+    Time needed: Visits each element once for all five results together
+    """
+    count = 0
+    total = 0
+    minimum = None
+    maximum = None
+    for element in data_list:
+        if count == 0:
+            minimum = maximum = element
+        elif element < minimum:
+            minimum = element
+        elif element > maximum:
+            maximum = element
+        total += element
+        count += 1
+    
+    mean = total / count if count else None
+    return {"count": count, "sum": total, "min": minimum, "max": maximum, "mean": mean}
+
+
+def calculate_aggregates_numpy(data_list):
+    """
+    Calculate the count, sum, minimum, maximum and mean with NumPy's vectorized reductions.
+    
+    Args:
+        data_list: List or NumPy array of numbers
+        
+    Returns:
+        dict: 'count', 'sum', 'min', 'max' and 'mean' (min, max and mean are None if empty)
+        
+    Time needed: Visits each element once per reduction, but in compiled code
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for calculate_aggregates_numpy: pip install numpy")
+    
+    data = np.asarray(data_list)
+    count = len(data)
+    if count == 0:
+        return {"count": 0, "sum": 0, "min": None, "max": None, "mean": None}
+    
+    total = data.sum().item()
+    return {"count": count, "sum": total, "min": data.min().item(),
+            "max": data.max().item(), "mean": total / count}
+
+
+def calculate_aggregates_chunked(data_list, chunk_size=1 << 20):
+    """
+    Calculate the count, sum, minimum, maximum and mean one chunk at a time.
+    
+    Only one chunk is ever loaded at once, so this works on memory-mapped
+    arrays that are larger than the available RAM.
+    
+    Args:
+        data_list: List, NumPy array or memory-mapped array of numbers
+        chunk_size (int): Number of elements processed per chunk
+        
+    Returns:
+        dict: 'count', 'sum', 'min', 'max' and 'mean' (min, max and mean are None if empty)
+        
+    Time needed: Visits each element once, chunk by chunk
+    """
+    aggregate = calculate_aggregates_numpy if NUMPY_AVAILABLE else calculate_aggregates
+    combined = {"count": 0, "sum": 0, "min": None, "max": None, "mean": None}
+    
+    for start in range(0, len(data_list), chunk_size):
+        part = aggregate(data_list[start:start + chunk_size])
+        combined = combine_aggregates(combined, part)
+    
+    return combined
+
+
+def combine_aggregates(first, second):
+    """
+    Combine the aggregates of two pieces of data into the aggregates of both.
+    
+    Args:
+        first (dict): Aggregates as returned by calculate_aggregates
+        second (dict): Aggregates as returned by calculate_aggregates
+        
+    Returns:
+        dict: Aggregates covering both pieces of data
+    """
+    if first["count"] == 0:
+        return dict(second)
+    if second["count"] == 0:
+        return dict(first)
+    
+    count = first["count"] + second["count"]
+    total = first["sum"] + second["sum"]
+    return {"count": count, "sum": total,
+            "min": min(first["min"], second["min"]),
+            "max": max(first["max"], second["max"]),
+            "mean": total / count}
+
+
 # Utility functions for generating test data
 
-def generate_random_list(size, min_val=1, max_val=1000):
+def generate_random_list(size, min_val=1, max_val=1000, seed=None, as_array=False):
     """
     Generate a list of random integers for testing.
     
+    When NumPy is installed the whole list is filled in one vectorized call,
+    which keeps data generation cheap even for millions of elements.
+    
     Args:
         size (int): Number of elements to generate
         min_val (int): Minimum value for random numbers
         max_val (int): Maximum value for random numbers
+        seed (int): Seed for reproducible data (None for fresh random data)
+        as_array (bool): Return a NumPy array instead of a Python list
         
     Returns:
-        list: List of random integers
+        list: List of random integers (or a NumPy array if as_array is True)
     """
-    return [random.randint(min_val, max_val) for _ in range(size)]
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng(seed)
+        data = rng.integers(min_val, max_val, size=size, endpoint=True, dtype=np.int64)
+        return data if as_array else data.tolist()
+    
+    if as_array:
+        raise ImportError("NumPy is required for as_array=True: pip install numpy")
+    rng = random.Random(seed)
+    return [rng.randint(min_val, max_val) for _ in range(size)]
 
 
-def generate_sorted_list(size, min_val=1, max_val=1000):
+def generate_sorted_list(size, min_val=1, max_val=1000, seed=None, as_array=False):
     """
     Generate a sorted list of random integers for testing.
     
@@ -211,15 +862,22 @@ def generate_sorted_list(size, min_val=1, max_val=1000):
         size (int): Number of elements to generate
         min_val (int): Minimum value for random numbers
         max_val (int): Maximum value for random numbers
+        seed (int): Seed for reproducible data (None for fresh random data)
+        as_array (bool): Return a NumPy array instead of a Python list
         
     Returns:
-        list: Sorted list of random integers
+        list: Sorted list of random integers (or a NumPy array if as_array is True)
     """
-    data = generate_random_list(size, min_val, max_val)
+    if NUMPY_AVAILABLE:
+        data = generate_random_list(size, min_val, max_val, seed=seed, as_array=True)
+        data.sort()
+        return data if as_array else data.tolist()
+    
+    data = generate_random_list(size, min_val, max_val, seed=seed, as_array=as_array)
     return sorted(data)
 
 
-def generate_reverse_sorted_list(size, min_val=1, max_val=1000):
+def generate_reverse_sorted_list(size, min_val=1, max_val=1000, seed=None, as_array=False):
     """
     Generate a reverse-sorted list (worst case for some algorithms).
     
@@ -227,14 +885,205 @@ def generate_reverse_sorted_list(size, min_val=1, max_val=1000):
         size (int): Number of elements to generate
         min_val (int): Minimum value for random numbers
         max_val (int): Maximum value for random numbers
+        seed (int): Seed for reproducible data (None for fresh random data)
+        as_array (bool): Return a NumPy array instead of a Python list
         
     Returns:
-        list: Reverse-sorted list of random integers
+        list: Reverse-sorted list of random integers (or a NumPy array if as_array is True)
     """
-    data = generate_sorted_list(size, min_val, max_val)
+    if NUMPY_AVAILABLE:
+        data = generate_sorted_list(size, min_val, max_val, seed=seed, as_array=True)[::-1]
+        return data if as_array else data.tolist()
+    
+    data = generate_sorted_list(size, min_val, max_val, seed=seed, as_array=as_array)
     return list(reversed(data))
 
 
+def _as_requested(data, as_array):
+    """Return a generated Python list, converted to a NumPy array if asked."""
+    if not as_array:
+        return data
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for as_array=True: pip install numpy")
+    return np.array(data, dtype=np.int64)
+
+
+def generate_nearly_sorted_list(size, min_val=1, max_val=1000, seed=None, as_array=False,
+                                swaps=None):
+    """
+    Generate a sorted list with a few random pairs of elements swapped.
+    
+    Args:
+        size (int): Number of elements to generate
+        min_val (int): Minimum value for random numbers
+        max_val (int): Maximum value for random numbers
+        seed (int): Seed for reproducible data (None for fresh random data)
+        as_array (bool): Return a NumPy array instead of a Python list
+        swaps (int): Number of random swaps (default 1% of the size, at least 1)
+        
+    Returns:
+        list: Nearly sorted list of random integers (or a NumPy array if as_array is True)
+    """
+    data = generate_sorted_list(size, min_val, max_val, seed=seed)
+    if swaps is None:
+        swaps = max(1, size // 100)
+    rng = random.Random(seed)
+    for _ in range(swaps if size > 1 else 0):
+        i, j = rng.randrange(size), rng.randrange(size)
+        data[i], data[j] = data[j], data[i]
+    return _as_requested(data, as_array)
+
+
+def generate_few_unique_list(size, min_val=1, max_val=1000, seed=None, as_array=False,
+                             unique=10):
+    """
+    Generate a list that repeats only a few distinct values.
+    
+    Args:
+        size (int): Number of elements to generate
+        min_val (int): Minimum value for random numbers
+        max_val (int): Maximum value for random numbers
+        seed (int): Seed for reproducible data (None for fresh random data)
+        as_array (bool): Return a NumPy array instead of a Python list
+        unique (int): Number of distinct values
+        
+    Returns:
+        list: List of random integers with many duplicates (or a NumPy array if as_array is True)
+    """
+    rng = random.Random(seed)
+    values = rng.sample(range(min_val, max_val + 1), min(unique, max_val - min_val + 1))
+    return _as_requested([rng.choice(values) for _ in range(size)], as_array)
+
+
+def generate_organ_pipe_list(size, min_val=1, max_val=1000, seed=None, as_array=False):
+    """
+    Generate a list that rises to its largest value and then falls again.
+    
+    Args:
+        size (int): Number of elements to generate
+        min_val (int): Minimum value for random numbers
+        max_val (int): Maximum value for random numbers
+        seed (int): Seed for reproducible data (None for fresh random data)
+        as_array (bool): Return a NumPy array instead of a Python list
+        
+    Returns:
+        list: Ascending then descending list of random integers (or a NumPy array if as_array is True)
+    """
+    data = generate_sorted_list(size, min_val, max_val, seed=seed)
+    return _as_requested(data[0::2] + data[1::2][::-1], as_array)
+
+
+def generate_sawtooth_list(size, min_val=1, max_val=1000, seed=None, as_array=False, teeth=10):
+    """
+    Generate a list made of several ascending runs, one after another.
+    
+    Args:
+        size (int): Number of elements to generate
+        min_val (int): Minimum value for random numbers
+        max_val (int): Maximum value for random numbers
+        seed (int): Seed for reproducible data (None for fresh random data)
+        as_array (bool): Return a NumPy array instead of a Python list
+        teeth (int): Number of ascending runs
+        
+    Returns:
+        list: List of sorted runs of random integers (or a NumPy array if as_array is True)
+    """
+    data = generate_random_list(size, min_val, max_val, seed=seed)
+    run = max(1, -(-size // teeth))  # Ceiling division, so there are at most `teeth` runs
+    sawtooth = []
+    for start in range(0, size, run):
+        sawtooth.extend(sorted(data[start:start + run]))
+    return _as_requested(sawtooth, as_array)
+
+
+class _Gas:
+    """
+    An element whose value the quicksort adversary decides only when it must.
+    
+    All elements start as 'gas' (larger than any decided value). When two gas
+    elements are compared, one is frozen to the next smallest value, preferring
+    the element the sort has compared most recently, which is likely its pivot.
+    """
+    
+    __slots__ = ("index", "adversary")
+    
+    def __init__(self, index, adversary):
+        self.index = index
+        self.adversary = adversary
+    
+    def _compare(self, other):
+        values = self.adversary["values"]
+        gas = self.adversary["gas"]
+        x, y = self.index, other.index
+        if values[x] == gas and values[y] == gas:
+            frozen = x if x == self.adversary["candidate"] else y
+            values[frozen] = self.adversary["frozen"]
+            self.adversary["frozen"] += 1
+        if values[x] == gas:
+            self.adversary["candidate"] = x
+        elif values[y] == gas:
+            self.adversary["candidate"] = y
+        return values[x] - values[y]
+    
+    def __lt__(self, other):
+        return self._compare(other) < 0
+    
+    def __le__(self, other):
+        return self._compare(other) <= 0
+    
+    def __gt__(self, other):
+        return self._compare(other) > 0
+    
+    def __ge__(self, other):
+        return self._compare(other) >= 0
+    
+    def __eq__(self, other):
+        return self._compare(other) == 0
+    
+    __hash__ = None
+
+
+def generate_quicksort_killer_list(size, min_val=1, max_val=1000, seed=None, as_array=False):
+    """
+    Generate an input that makes quick_sort take quadratic time.
+    
+    The input is found with McIlroy's "killer adversary": quick_sort is run
+    on elements whose values are only decided when a comparison needs them,
+    always in the way that makes the chosen pivot as small as possible. The
+    values those decisions produce are then an input on which this quick_sort
+    behaves as badly as it can.
+    
+    The result is a permutation of 1..size (every value distinct), so min_val,
+    max_val and seed are not used. Building it is quadratic as well, and about
+    eight times slower than quick_sort on the result: roughly 0.3 seconds for
+    1,000 elements and 4.5 seconds for 4,000. The dataset cache keeps each
+    size once it is built, and the registry caps this distribution's sizes
+    (see registry.DISTRIBUTION_MAX_SIZES).
+    
+    Args:
+        size (int): Number of elements to generate
+        min_val (int): Not used; accepted like the other generators
+        max_val (int): Not used; accepted like the other generators
+        seed (int): Not used; the result is always the same
+        as_array (bool): Return a NumPy array instead of a Python list
+        
+    Returns:
+        list: Adversarial permutation of 1..size (or a NumPy array if as_array is True)
+    
+    Time needed: O(n²), about eight times what quick_sort takes on the result
+    """
+    adversary = {"values": [size] * size, "gas": size, "frozen": 0, "candidate": None}
+    quick_sort([_Gas(index, adversary) for index in range(size)])
+    
+    # Elements never compared with another gas element are still undecided
+    values = adversary["values"]
+    for index in range(size):
+        if values[index] == size:
+            values[index] = adversary["frozen"]
+            adversary["frozen"] += 1
+    return _as_requested([value + 1 for value in values], as_array)
+
+
 # Algorithm validation functions
 
 def is_sorted(data_list):
@@ -275,46 +1124,306 @@ def verify_search_result(data_list, target, result_index):
 
 # Performance testing helpers
 
-def time_algorithm(algorithm_func, *args, trials=3):
+class TimingResult:
+    """Summary statistics for the repeated timing of one algorithm call."""
+    
+    def __init__(self, samples, loops, overhead):
+        """
+        Args:
+            samples (list): Per-call times in seconds, one per trial
+            loops (int): Number of calls averaged inside each trial
+            overhead (float): Empty-call overhead (seconds) already subtracted
+        """
+        self.samples = list(samples)
+        self.loops = loops
+        self.overhead = overhead
+        self.metrics = {}  # Extra named measurements attached by an experiment
+    
+    @property
+    def trials(self):
+        """Number of trials that were measured."""
+        return len(self.samples)
+    
+    @property
+    def mean(self):
+        """Mean time per call in seconds."""
+        return statistics.fmean(self.samples)
+    
+    @property
+    def median(self):
+        """Median time per call in seconds."""
+        return statistics.median(self.samples)
+    
+    @property
+    def minimum(self):
+        """Fastest observed time per call in seconds."""
+        return min(self.samples)
+    
+    @property
+    def mad(self):
+        """Median absolute deviation of the per-call times in seconds."""
+        median = self.median
+        return statistics.median([abs(sample - median) for sample in self.samples])
+    
+    @property
+    def ci_half_width(self):
+        """Half width of the approximate 95% confidence interval of the mean."""
+        if len(self.samples) < 2:
+            return float("inf")
+        return 1.96 * statistics.stdev(self.samples) / math.sqrt(len(self.samples))
+    
+    @property
+    def relative_ci(self):
+        """Confidence interval half width as a fraction of the mean."""
+        mean = self.mean
+        if mean <= 0:
+            return 0.0 if self.ci_half_width == 0 else float("inf")
+        return self.ci_half_width / mean
+    
+    def to_dict(self):
+        """Get the raw measurements as a JSON-friendly dictionary."""
+        return {"samples": self.samples, "loops": self.loops, "overhead": self.overhead,
+                "metrics": self.metrics}
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a TimingResult from the output of to_dict."""
+        result = cls(data["samples"], data["loops"], data["overhead"])
+        result.metrics = dict(data.get("metrics", {}))
+        return result
+
+
+def _is_array(value):
+    """Whether a value is a NumPy array, checked without loading NumPy."""
+    return type(value).__name__ == "ndarray" and type(value).__module__ == "numpy"
+
+
+def _copy_args(args):
+    """Copy list and array arguments so mutating algorithms always see fresh input."""
+    return [arg.copy() if isinstance(arg, list) or _is_array(arg) else arg for arg in args]
+
+
+def _prepare_calls(args, loops, copy_args):
+    """Build one argument set per call, copying the arguments when requested."""
+    if copy_args:
+        return [_copy_args(args) for _ in range(loops)]
+    return [args] * loops
+
+
+def _empty_call(*args):
+    """Do nothing; used to measure the cost of calling a function."""
+    return None
+
+
+def _time_loops(func, arg_sets):
+    """Call func once per prepared argument set and return the total time in ns."""
+    start = time.perf_counter_ns()
+    for call_args in arg_sets:
+        func(*call_args)
+    return time.perf_counter_ns() - start
+
+
+@contextmanager
+def _garbage_collection_paused(active=True):
     """
-    Time an algorithm by running it multiple times and taking the average.
+    Collect garbage, then keep the garbage collector off until the block ends.
+    
+    A collection that starts inside a timed loop would be charged to whichever
+    trial it lands in, so timed regions run with the collector paused and the
+    garbage is cleared just before instead.
+    
+    Args:
+        active (bool): Pause the collector (False does nothing)
+    """
+    if not active or not gc.isenabled():
+        yield
+        return
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+# Default soft limit in seconds on the time spent measuring one cell
+DEFAULT_TIME_BUDGET = 2.0
+
+
+class TrialSampler:
+    """
+    Collect timing samples of one algorithm, one trial at a time.
+    
+    measure_algorithm takes all the samples of a cell in a row. The interleaved
+    runner (see hygiene.py) instead takes one sample from each of many samplers
+    in turn, so slow drift in the machine's speed is spread over every cell.
+    """
+    
+    def __init__(self, algorithm_func, *args, min_trials=3, max_trials=50, target_ci=0.05,
+                 time_budget=DEFAULT_TIME_BUDGET, min_sample_time=0.002, copy_args=True,
+                 collect_garbage=True, on_trial=None):
+        """
+        Calibrate the number of calls per trial and measure the call overhead.
+        
+        Args: as for measure_algorithm
+        """
+        self.algorithm_func = algorithm_func
+        self.args = args
+        self.min_trials = min_trials
+        self.max_trials = max_trials
+        self.target_ci = target_ci
+        self.budget_ns = time_budget * 1e9
+        self.copy_args = copy_args
+        self.collect_garbage = collect_garbage
+        self.on_trial = on_trial
+        self.samples = []
+        self.spent_ns = 0
+        self.overhead = 0.0
+        
+        # Calibrate how many calls each trial needs to be long enough to measure
+        min_sample_ns = min_sample_time * 1e9
+        self.loops = 1
+        while True:
+            elapsed = self._time_trial(algorithm_func)
+            if elapsed >= min_sample_ns or self.loops >= 1_000_000:
+                break
+            self.loops = min(self.loops * 10, 1_000_000)
+        
+        # Measure the overhead of the call loop itself with an empty function
+        self.overhead = min(self._time_trial(_empty_call) for _ in range(3)) / self.loops
+        
+        # The calibration run counts as one sample when it already used the final loop count
+        if elapsed >= min_sample_ns:
+            self._record(elapsed)
+    
+    def _time_trial(self, func):
+        """Time one trial of self.loops calls, counting its cost against the time budget."""
+        # The collection before the trial and the argument copies count too
+        started = time.perf_counter_ns()
+        with _garbage_collection_paused(self.collect_garbage):
+            elapsed = _time_loops(func, _prepare_calls(self.args, self.loops, self.copy_args))
+        self.spent_ns += time.perf_counter_ns() - started
+        return elapsed
+    
+    def _record(self, elapsed):
+        """Store one trial as a per-call time."""
+        self.samples.append(max(elapsed / self.loops - self.overhead, 0.0) / 1e9)
+        if self.on_trial is not None:
+            self.on_trial(len(self.samples) - 1, self.samples[-1])
+    
+    def needs_more(self):
+        """Whether more trials are needed: too few so far, or not yet stable within budget."""
+        if len(self.samples) >= self.max_trials:
+            return False
+        if len(self.samples) < self.min_trials:
+            return True
+        return self.result().relative_ci > self.target_ci and self.spent_ns < self.budget_ns
+    
+    def take_sample(self):
+        """Run and record one more trial."""
+        self._record(self._time_trial(self.algorithm_func))
+    
+    def result(self):
+        """Get the samples so far as a TimingResult."""
+        return TimingResult(self.samples, self.loops, self.overhead / 1e9)
+
+
+def measure_algorithm(algorithm_func, *args, min_trials=3, max_trials=50,
+                      target_ci=0.05, time_budget=DEFAULT_TIME_BUDGET, min_sample_time=0.002,
+                      copy_args=True, collect_garbage=True, on_trial=None):
+    """
+    Time an algorithm with perf_counter_ns, adding trials until the result is stable.
+    
+    Each trial calls the algorithm enough times in a row to last at least
+    min_sample_time, so even very fast functions such as binary_search produce
+    measurable samples. The cost of an empty function call is measured and
+    subtracted. Trials continue until the 95% confidence interval of the mean is
+    within target_ci of the mean, max_trials is reached, or time_budget runs out.
     
     Args:
         algorithm_func: Function to time
         *args: Arguments to pass to the function
-        trials (int): Number of times to run the algorithm
+        min_trials (int): Minimum number of trials to run
+        max_trials (int): Maximum number of trials to run
+        target_ci (float): Target confidence interval half width, relative to the mean
+        time_budget (float): Soft limit in seconds on the total time spent measuring
+        min_sample_time (float): Minimum duration in seconds of one trial
+        copy_args (bool): Copy list arguments for every call (needed for algorithms
+            that modify their input; skip it for read-only algorithms)
+        collect_garbage (bool): Collect garbage before each trial and pause the
+            garbage collector while it runs
+        on_trial: Called as on_trial(index, seconds) after each sample, outside
+            the timed loop (used to stream results, see events.py)
         
     Returns:
-        float: Average execution time in seconds
+        TimingResult: Per-call timing statistics
+    """
+    sampler = TrialSampler(algorithm_func, *args, min_trials=min_trials, max_trials=max_trials,
+                           target_ci=target_ci, time_budget=time_budget,
+                           min_sample_time=min_sample_time, copy_args=copy_args,
+                           collect_garbage=collect_garbage, on_trial=on_trial)
+    while sampler.needs_more():
+        sampler.take_sample()
+    return sampler.result()
+
+
+def time_algorithm(algorithm_func, *args, trials=3, profilers=None):
     """
-    times = []
+    Time an algorithm by running it multiple times and taking the average.
     
-    for _ in range(trials):
-        # Make a copy of mutable arguments to ensure fair testing
-        args_copy = []
-        for arg in args:
-            if isinstance(arg, list):
-                args_copy.append(arg.copy())
-            else:
-                args_copy.append(arg)
-        
-        start_time = time.time()
-        algorithm_func(*args_copy)
-        end_time = time.time()
+    Args:
+        algorithm_func: Function to time
+        *args: Arguments to pass to the function
+        trials (int): Minimum number of times to run the algorithm
+        profilers (list): Profiling hooks (see profiling.py), run on separate
+            calls after timing so they do not affect the time
         
-        times.append(end_time - start_time)
-    
-    return sum(times) / len(times)
+    Returns:
+        float: Average execution time in seconds
+    """
+    average = measure_algorithm(algorithm_func, *args, min_trials=trials).mean
+    if profilers:
+        from profiling import run_profilers
+        run_profilers(profilers, algorithm_func.__name__, algorithm_func, *args)
+    return average
 
 
-def warm_up_timing():
+def warm_up_timing(tolerance=0.02, window=5, min_seconds=0.1, max_seconds=1.0):
     """
-    Perform some operations to warm up the timing system.
-    This helps reduce variability in the first few measurements.
+    Warm up the timing system until it reaches a steady state.
+    
+    A fixed workload of small sorts is timed in rounds. The first rounds are
+    slower while caches fill and the CPU raises its clock speed. After at least
+    min_seconds, once the median of the last `window` rounds is within
+    `tolerance` of the median of the `window` rounds before them, timings have
+    settled and measuring starts.
+    
+    Args:
+        tolerance (float): Largest relative change between windows that counts as steady
+        window (int): Number of rounds compared at a time
+        min_seconds (float): Shortest warm-up, long enough for the clock speed to ramp up
+        max_seconds (float): Give up waiting for a steady state after this long
+        
+    Returns:
+        dict: 'rounds' run, 'seconds' spent, and whether a 'steady' state was reached
     """
-    # Perform some quick operations to stabilize timing
-    for _ in range(1000):
-        test_list = [random.randint(1, 100) for _ in range(100)]
-        sum(test_list)
-        max(test_list)
-        sorted(test_list)
\ No newline at end of file
+    rng = random.Random(0)
+    test_list = [rng.randint(1, 100) for _ in range(100)]
+    round_times = []
+    began = time.perf_counter()
+    steady = False
+    while time.perf_counter() - began < max_seconds:
+        start = time.perf_counter_ns()
+        for _ in range(100):
+            sum(test_list)
+            max(test_list)
+            sorted(test_list)
+        round_times.append(time.perf_counter_ns() - start)
+        
+        if len(round_times) >= 2 * window and time.perf_counter() - began >= min_seconds:
+            recent = statistics.median(round_times[-window:])
+            before = statistics.median(round_times[-2 * window:-window])
+            if abs(recent - before) <= tolerance * before:
+                steady = True
+                break
+    return {"rounds": len(round_times), "seconds": time.perf_counter() - began, "steady": steady}
\ No newline at end of file
@@ -0,0 +1,396 @@
+"""
+Performance Baselines and Regression Detection
+CS101 Fall 2025 - Activity 05
+
+This module saves the raw per-trial timings of a run as a named baseline and
+checks later runs against it cell by cell. A cell counts as a regression only
+when a Mann-Whitney U test says its times really differ from the baseline
+(after a Holm correction for testing many cells at once), the difference is
+large (Cliff's delta), and the median is slower by more than the cell's
+run-to-run noise. An algorithm whose fitted growth got worse, for example
+from O(n log n) to O(n^2), is flagged too.
+
+The trials of one run are not independent samples of a cell's speed: a whole
+run can land 30% away from the last one (a different clock speed, memory
+layout or background load), and the U test cannot see that. A slowdown
+therefore has to exceed DEFAULT_RUN_NOISE, or the spread of the baseline's
+repeat runs if that is larger. Repeat runs also keep one lucky, fast baseline
+run from turning every later run into a regression.
+"""
+
+import json
+import math
+import os
+import statistics
+import time
+from functools import lru_cache
+from itertools import accumulate
+
+from complexity import fit_complexity
+
+DEFAULT_BASELINE_DIR = os.environ.get("ACTIVITY05_BASELINE_DIR", ".baselines")
+
+# Regression thresholds
+DEFAULT_ALPHA = 0.05  # Family-wise significance level across all compared cells
+DEFAULT_MIN_SLOWDOWN = 0.10  # Median must be at least 10% slower to matter
+DEFAULT_MIN_EFFECT = 0.474  # |Cliff's delta| of a "large" effect
+COMPLEXITY_TOLERANCE = 0.25  # Growth exponent increase that counts as a new complexity class
+COMPLEXITY_MIN_SIZES = 4  # Fewer sizes cannot tell the growth models apart reliably
+
+# Run-to-run noise: a slowdown must exceed min_slowdown plus this much, or the
+# spread of the baseline's repeat runs if larger (on a shared machine, unchanged
+# code moved up to 35% between runs, even in cells whose repeats agreed to 3%)
+DEFAULT_RUN_NOISE = 0.30
+RECOMMENDED_BASELINE_RUNS = 3
+MAX_BASELINE_RUNS = 10  # Repeat runs kept in a baseline; the oldest are dropped
+
+# Minimum trials per cell for baseline runs: with 3 trials on each side even
+# completely separated samples cannot reach p < 0.05
+BASELINE_MIN_TRIALS = 10
+
+# Largest n1 * n2 for which the exact U distribution is computed
+EXACT_LIMIT = 400
+
+
+def save_baseline(all_results, name, directory=DEFAULT_BASELINE_DIR, add_run=False):
+    """
+    Save the raw timings of a run as a named baseline.
+
+    Args:
+        all_results (list): List of ExperimentResults objects
+        name (str): Baseline name, used as the file name
+        directory (str): Directory that holds the baselines
+        add_run (bool): Add the run to an existing baseline as another repeat
+            (keeping the latest MAX_BASELINE_RUNS) instead of replacing it
+
+    Returns:
+        str: Path of the saved baseline
+    """
+    algorithms = {}
+    for result in all_results:
+        cells = {}
+        for size, timing, extrapolated in zip(result.sizes, result.timings, result.extrapolated):
+            if timing is not None and not extrapolated:
+                cells[str(size)] = {"samples": timing.samples, "loops": timing.loops}
+        algorithms[result.label] = cells
+
+    created = time.strftime("%Y-%m-%dT%H:%M:%S")
+    path = _baseline_path(name, directory)
+    runs = _read_runs(path) if add_run and os.path.exists(path) else []
+    runs = (runs + [{"created": created, "algorithms": algorithms}])[-MAX_BASELINE_RUNS:]
+    baseline = {"name": name, "created": created, "runs": runs}
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(baseline, f, indent=1)
+    os.replace(temp_path, path)
+    return path
+
+
+def load_baseline(name, directory=DEFAULT_BASELINE_DIR):
+    """
+    Load a saved baseline.
+
+    Args:
+        name (str): Baseline name
+        directory (str): Directory that holds the baselines
+
+    Returns:
+        dict: Maps each algorithm name to {size: list of runs}, where each run
+        is the list of per-trial times one repeat run measured
+
+    Raises:
+        ValueError: If there is no baseline with that name
+    """
+    path = _baseline_path(name, directory)
+    if not os.path.exists(path):
+        raise ValueError(f"No baseline named '{name}' in {directory} "
+                         f"(available: {', '.join(list_baselines(directory)) or 'none'})")
+    baseline = {}
+    for run in _read_runs(path):
+        for algorithm, cells in run["algorithms"].items():
+            for size, cell in cells.items():
+                baseline.setdefault(algorithm, {}).setdefault(int(size), []).append(cell["samples"])
+    return baseline
+
+
+def _read_runs(path):
+    """Get the repeat runs of a baseline file (baselines saved before repeats hold one run)."""
+    with open(path) as f:
+        baseline = json.load(f)
+    if "runs" not in baseline:
+        return [{"created": baseline["created"], "algorithms": baseline["algorithms"]}]
+    return baseline["runs"]
+
+
+def list_baselines(directory=DEFAULT_BASELINE_DIR):
+    """Get the names of the saved baselines."""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name[:-len(".json")] for name in os.listdir(directory) if name.endswith(".json"))
+
+
+def _baseline_path(name, directory):
+    """Get the file that holds a baseline."""
+    if not name or os.sep in name or name.startswith("."):
+        raise ValueError(f"Invalid baseline name: '{name}'")
+    return os.path.join(directory, f"{name}.json")
+
+
+@lru_cache(maxsize=None)
+def _exact_u_distribution(n1, n2):
+    """Count the rank arrangements that give each value of U (no ties)."""
+    # counts[i][j] holds the U counts for samples of size i and j
+    counts = [[[1] for _ in range(n2 + 1)] for _ in range(n1 + 1)]
+    for i in range(1, n1 + 1):
+        for j in range(1, n2 + 1):
+            # The largest value comes from the first sample (adds j to U) or the second
+            with_first = [0] * j + counts[i - 1][j]
+            without = counts[i][j - 1]
+            size = max(len(with_first), len(without))
+            counts[i][j] = [(with_first[k] if k < len(with_first) else 0)
+                            + (without[k] if k < len(without) else 0) for k in range(size)]
+    return counts[n1][n2]
+
+
+def mann_whitney_u(first, second):
+    """
+    Two-sided Mann-Whitney U test of whether two samples come from the same distribution.
+
+    Small samples without ties use the exact distribution of U; otherwise the
+    normal approximation with tie and continuity corrections is used.
+
+    Args:
+        first (list): First sample
+        second (list): Second sample
+
+    Returns:
+        tuple: (U of the first sample, two-sided p-value)
+    """
+    n1, n2 = len(first), len(second)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Both samples need at least one value")
+
+    # Rank the pooled values, giving tied values their average rank
+    pooled = sorted([(value, 0) for value in first] + [(value, 1) for value in second])
+    rank_sum = 0.0
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        rank_sum += average_rank * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean_u = n1 * n2 / 2
+
+    if tie_term == 0 and n1 * n2 <= EXACT_LIMIT:
+        counts = _exact_u_distribution(n1, n2)
+        total = sum(counts)
+        cumulative = list(accumulate(counts))
+        low = min(u, n1 * n2 - u)
+        p_value = 2 * cumulative[int(low)] / total
+        return u, min(1.0, p_value)
+
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (abs(u - mean_u) - 0.5) / math.sqrt(variance)
+    p_value = math.erfc(max(z, 0) / math.sqrt(2))
+    return u, min(1.0, p_value)
+
+
+def cliffs_delta(first, second):
+    """
+    Cliff's delta effect size: P(first > second) - P(first < second).
+
+    Returns:
+        float: Between -1 and 1; positive when the first sample tends to be larger
+    """
+    greater = sum(1 for a in first for b in second if a > b)
+    less = sum(1 for a in first for b in second if a < b)
+    return (greater - less) / (len(first) * len(second))
+
+
+def run_noise(runs):
+    """
+    Estimate how far a cell's median moves from one run to the next.
+
+    Args:
+        runs (list): Per-trial times from each repeat run of the cell
+
+    Returns:
+        float: Relative spread of the run medians (largest over smallest, minus
+        one), but never less than DEFAULT_RUN_NOISE
+    """
+    medians = [statistics.median(run) for run in runs if run]
+    if len(medians) < 2 or min(medians) <= 0:
+        return DEFAULT_RUN_NOISE
+    return max(DEFAULT_RUN_NOISE, max(medians) / min(medians) - 1)
+
+
+class CellComparison:
+    """How one (algorithm, size) cell changed against the baseline."""
+
+    def __init__(self, algorithm_name, size, baseline_runs, current_samples):
+        """
+        Args:
+            algorithm_name (str): Name of the algorithm
+            size (int): Input size of the cell
+            baseline_runs (list): Per-trial times from each of the baseline's repeat runs
+            current_samples (list): Per-trial times from the current run
+        """
+        self.algorithm_name = algorithm_name
+        self.size = size
+        baseline_samples = [sample for run in baseline_runs for sample in run]
+        self.runs = len(baseline_runs)
+        self.noise = run_noise(baseline_runs)
+        self.baseline_median = statistics.median(baseline_samples)
+        self.current_median = statistics.median(current_samples)
+        self.ratio = (self.current_median / self.baseline_median
+                      if self.baseline_median > 0 else float("inf"))
+        _, self.p_value = mann_whitney_u(current_samples, baseline_samples)
+        self.effect = cliffs_delta(current_samples, baseline_samples)
+        self.adjusted_p = self.p_value  # Holm-corrected in compare_to_baseline
+        self.status = "unchanged"
+
+
+class RegressionReport:
+    """Result of checking a run against a baseline."""
+
+    def __init__(self, baseline_name, cells, complexity_changes, missing):
+        """
+        Args:
+            baseline_name (str): Name of the baseline compared against
+            cells (list): CellComparison objects
+            complexity_changes (list): (algorithm, baseline fit, current fit) tuples
+                where the growth got worse
+            missing (list): (algorithm, size) cells in the baseline but not in the run
+        """
+        self.baseline_name = baseline_name
+        self.cells = cells
+        self.complexity_changes = complexity_changes
+        self.missing = missing
+
+    @property
+    def regressions(self):
+        """Cells that got significantly slower."""
+        return [cell for cell in self.cells if cell.status == "slower"]
+
+    @property
+    def regressed(self):
+        """Whether any cell got slower or any algorithm's growth got worse."""
+        return bool(self.regressions or self.complexity_changes)
+
+
+def compare_to_baseline(all_results, baseline, baseline_name="baseline", alpha=DEFAULT_ALPHA,
+                        min_slowdown=DEFAULT_MIN_SLOWDOWN, min_effect=DEFAULT_MIN_EFFECT):
+    """
+    Compare a run against a baseline cell by cell.
+
+    Args:
+        all_results (list): List of ExperimentResults objects from the new run
+        baseline (dict): Baseline timings as returned by load_baseline
+        baseline_name (str): Name used in the report
+        alpha (float): Family-wise significance level
+        min_slowdown (float): Smallest relative increase of the median that counts,
+            on top of each cell's run-to-run noise (see run_noise)
+        min_effect (float): Smallest |Cliff's delta| that counts
+
+    Returns:
+        RegressionReport: The cell comparisons and any complexity changes
+    """
+    cells = []
+    complexity_changes = []
+    compared = set()
+    for result in all_results:
+        baseline_cells = baseline.get(result.label)
+        if not baseline_cells:
+            continue
+        for size, timing, extrapolated in zip(result.sizes, result.timings, result.extrapolated):
+            if timing is None or extrapolated or size not in baseline_cells:
+                continue
+            cells.append(CellComparison(result.label, size, baseline_cells[size],
+                                        timing.samples))
+            compared.add((result.label, size))
+
+        # Compare the growth fitted to each run's medians, when there are enough sizes to fit
+        sizes = sorted(baseline_cells)
+        if len(sizes) < COMPLEXITY_MIN_SIZES or len(set(result.sizes)) < COMPLEXITY_MIN_SIZES:
+            continue
+        baseline_fit = fit_complexity(sizes, [statistics.median(sample for run in baseline_cells[s]
+                                                                for sample in run) for s in sizes])
+        current_fit = result.fit_complexity()
+        if (baseline_fit is not None and current_fit is not None
+                and current_fit.model != baseline_fit.model
+                and current_fit.exponent > baseline_fit.exponent + COMPLEXITY_TOLERANCE):
+            complexity_changes.append((result.label, baseline_fit, current_fit))
+
+    # Holm correction: the k-th smallest p-value is scaled by the number of cells left
+    ordered = sorted(cells, key=lambda cell: cell.p_value)
+    running = 0.0
+    for rank, cell in enumerate(ordered):
+        running = max(running, min(1.0, cell.p_value * (len(ordered) - rank)))
+        cell.adjusted_p = running
+
+    for cell in cells:
+        threshold = 1 + min_slowdown + cell.noise
+        if cell.adjusted_p < alpha and abs(cell.effect) >= min_effect:
+            if cell.ratio >= threshold and cell.effect > 0:
+                cell.status = "slower"
+            elif cell.ratio <= 1 / threshold and cell.effect < 0:
+                cell.status = "faster"
+
+    missing = [(algorithm, size) for algorithm, sizes in baseline.items() for size in sizes
+               if (algorithm, size) not in compared
+               and any(r.label == algorithm and size in r.sizes for r in all_results)]
+    return RegressionReport(baseline_name, cells, complexity_changes, missing)
+
+
+def print_regression_report(report):
+    """
+    Print the result of a baseline comparison.
+
+    Args:
+        report (RegressionReport): The comparison to print
+    """
+    print("\n" + "="*60)
+    print(f"REGRESSION CHECK AGAINST BASELINE '{report.baseline_name}'")
+    print("="*60)
+    if not report.cells:
+        print("No cells in common with the baseline.")
+        return
+
+    print(f"{'Algorithm':<36} {'Size':>8} {'Change':>8} {'Noise':>6} {'p (Holm)':>9} "
+          f"{'Delta':>6}  Status")
+    for cell in report.cells:
+        change = f"{(cell.ratio - 1) * 100:+.1f}%"
+        noise = f"{cell.noise * 100:.0f}%"
+        print(f"{cell.algorithm_name:<36} {cell.size:>8} {change:>8} {noise:>6} "
+              f"{cell.adjusted_p:>9.4f} {cell.effect:>6.2f}  {cell.status}")
+
+    for algorithm, baseline_fit, current_fit in report.complexity_changes:
+        print(f"• {algorithm}: growth changed from {baseline_fit.label} "
+              f"(n^{baseline_fit.exponent:.2f}) to {current_fit.label} (n^{current_fit.exponent:.2f})")
+    for algorithm, size in report.missing:
+        print(f"• {algorithm} at size {size}: measured in the baseline but not in this run")
+
+    runs = min(cell.runs for cell in report.cells)
+    if runs < RECOMMENDED_BASELINE_RUNS:
+        print(f"\nThe baseline holds {runs} run(s); add {RECOMMENDED_BASELINE_RUNS - runs} more "
+              f"with --add-to-baseline {report.baseline_name} so one unusually fast run "
+              f"cannot set it")
+    slower = len(report.regressions)
+    faster = sum(1 for cell in report.cells if cell.status == "faster")
+    print(f"\n{slower} slower, {faster} faster, {len(report.cells) - slower - faster} unchanged "
+          f"of {len(report.cells)} cells")
+    if report.regressed:
+        print("PERFORMANCE REGRESSION DETECTED")
+    else:
+        print("No performance regression detected.")
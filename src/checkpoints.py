@@ -0,0 +1,183 @@
+"""
+Checkpointed Experiment Cells
+CS101 Fall 2025 - Activity 05
+
+This module saves every (algorithm, size) cell to disk the moment it has been
+measured, so a sweep that crashes or is cancelled loses at most the cell that
+was running. A resumed sweep reuses saved cells instead of timing them again.
+
+Each saved cell is keyed by everything that could change its result: the
+algorithm, the input size, how its input is built, the timing settings, and
+a hash of the algorithm's source code together with the project functions it
+calls. Editing an algorithm therefore invalidates only that algorithm's
+cells; an unchanged implementation is never benchmarked twice.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import time
+from functools import lru_cache
+
+from algorithms import TimingResult
+from datasets import DEFAULT_SEED
+
+DEFAULT_CHECKPOINT_DB = os.environ.get("ACTIVITY05_CHECKPOINTS", ".checkpoints.db")
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _referenced_names(obj):
+    """Get the global names used by a function or by the methods of a class."""
+    if inspect.isclass(obj):
+        codes = [member.__code__ for member in vars(obj).values() if inspect.isfunction(member)]
+    else:
+        codes = [obj.__code__]
+
+    names = set()
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        # Nested functions, lambdas and comprehensions have their own code objects
+        codes.extend(const for const in code.co_consts if inspect.iscode(const))
+    return names
+
+
+def _is_project_object(value):
+    """Whether a value is a function or class defined in this project's modules."""
+    if not (inspect.isfunction(value) or inspect.isclass(value)):
+        return False
+    module = sys.modules.get(value.__module__)
+    path = getattr(module, "__file__", None)
+    return path is not None and os.path.dirname(os.path.abspath(path)) == SOURCE_DIR
+
+
+@lru_cache(maxsize=None)
+def source_hash(func):
+    """
+    Hash the source of a function (or class) and every project function it calls.
+
+    Args:
+        func: Function or class to hash
+
+    Returns:
+        str: Hex digest that changes whenever any of that source changes
+    """
+    sources = {}
+    pending = [func]
+    while pending:
+        obj = pending.pop()
+        name = f"{obj.__module__}.{obj.__qualname__}"
+        if name in sources:
+            continue
+        try:
+            sources[name] = inspect.getsource(obj)
+        except (OSError, TypeError):
+            sources[name] = name  # Built in or defined interactively
+        module = sys.modules.get(obj.__module__)
+        for referenced in _referenced_names(obj):
+            value = getattr(module, referenced, None)
+            if _is_project_object(value):
+                pending.append(value)
+
+    digest = hashlib.sha256()
+    for name in sorted(sources):
+        digest.update(name.encode())
+        digest.update(sources[name].encode())
+    return digest.hexdigest()
+
+
+def cell_key(spec, size, trial_policy=None):
+    """
+    Build the cache key of one cell.
+
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        size (int): Input size
+        trial_policy (dict): Overrides for the timing settings
+
+    Returns:
+        str: Hex digest identifying the cell
+    """
+    description = {
+        "algorithm": spec.name,
+        "size": size,
+        "input": {"kind": spec.input_kind, "target": spec.target, "params": spec.params,
+                  "seed": DEFAULT_SEED},
+        "trials": {"min_trials": spec.min_trials, **(trial_policy or {})},
+        "source": source_hash(spec.func),
+    }
+    encoded = json.dumps(description, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CellCheckpoints:
+    """Durable store of measured cells, so sweeps can be resumed."""
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_DB, resume=False):
+        """
+        Args:
+            path (str): SQLite file that holds the measured cells
+            resume (bool): Reuse cells already measured instead of timing them again
+        """
+        self.path = path
+        self.resume = resume
+        self.reused = 0
+        self.saved = 0
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS cells (key TEXT PRIMARY KEY, algorithm TEXT NOT NULL, "
+            "size INTEGER NOT NULL, measured TEXT NOT NULL, timing TEXT NOT NULL)")
+        self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the checkpoint file."""
+        self.connection.close()
+
+    def lookup(self, spec, size, trial_policy=None):
+        """
+        Get a previously measured cell when resuming.
+
+        Args:
+            spec (AlgorithmSpec): The registered algorithm
+            size (int): Input size
+            trial_policy (dict): Overrides for the timing settings
+
+        Returns:
+            TimingResult: The saved timing, or None if there is none (or not resuming)
+        """
+        if not self.resume:
+            return None
+        row = self.connection.execute("SELECT timing FROM cells WHERE key = ?",
+                                      (cell_key(spec, size, trial_policy),)).fetchone()
+        if row is None:
+            return None
+        self.reused += 1
+        return TimingResult.from_dict(json.loads(row[0]))
+
+    def save(self, spec, size, trial_policy, timing):
+        """
+        Save a measured cell, committing it to disk before returning.
+
+        Args:
+            spec (AlgorithmSpec): The registered algorithm
+            size (int): Input size
+            trial_policy (dict): Overrides for the timing settings
+            timing (TimingResult): The measurement
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cells (key, algorithm, size, measured, timing) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (cell_key(spec, size, trial_policy), spec.name, size,
+                 time.strftime("%Y-%m-%dT%H:%M:%S"), json.dumps(timing.to_dict())))
+        self.saved += 1
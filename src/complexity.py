@@ -0,0 +1,283 @@
+"""
+Complexity Fitting
+CS101 Fall 2025 - Activity 05
+
+This module finds the growth model that best explains a set of measured
+times. Every candidate model (1, log n, n, n log n, n^2, n^3 and a free power
+law n^k) is fitted by least squares on relative errors, so small and large
+sizes count equally, and the models are compared with the corrected Akaike
+information criterion (AICc), which trades goodness of fit against the
+number of fitted constants. Unlike the doubling ratio, this works for any
+set of sizes, not just sizes that double.
+"""
+
+import math
+
+from algorithms import NUMPY_AVAILABLE
+from lazy_imports import lazy_import
+from registry import COMPLEXITY_COSTS
+
+np = lazy_import("numpy")
+
+# Candidate models in order of increasing growth
+MODELS = ["1", "log n", "n", "n log n", "n^2", "n^3"]
+POWER_LAW = "power"
+
+# What each model means for a doubling experiment
+PATTERN_DESCRIPTIONS = {
+    "1": "Constant - input size has no effect on time",
+    "log n": "Logarithmic - small increase as input doubles",
+    "n": "Linear - doubling input roughly doubles time",
+    "n log n": "Linearithmic - doubling input slightly more than doubles time",
+    "n^2": "Quadratic - doubling input roughly quadruples time",
+    "n^3": "Cubic - doubling input increases time ~8-fold",
+    POWER_LAW: "Power law - time grows as a non-standard power of the input size",
+}
+
+# Smallest relative residual per point; timings are never more precise than this
+MIN_RELATIVE_ERROR = 1e-6
+
+# How much lower the AICc of the free power law must be to win over a named model
+# (a difference of 10 leaves the named model essentially no support)
+POWER_LAW_MARGIN = 10.0
+
+# Fewest points the free power law is fitted to: its two constants fit any two
+# points exactly, and with three the AICc correction is undefined
+POWER_LAW_MIN_POINTS = 4
+
+# Exponent of each named model that is itself a power of n; a power law whose
+# exponent is this close to it is the named model (exact operation counts
+# otherwise always prefer the free power law by a tiny residual)
+MODEL_EXPONENTS = {"1": 0.0, "n": 1.0, "n^2": 2.0, "n^3": 3.0}
+EXPONENT_TOLERANCE = 0.02
+
+
+class ComplexityFit:
+    """The best-fitting growth model for a set of measurements."""
+
+    def __init__(self, model, coefficients, r_squared, confidence, exponent, scores,
+                 size_range=None):
+        """
+        Args:
+            model (str): One of MODELS, or POWER_LAW
+            coefficients (dict): 'intercept' and 'scale' for a named model
+                (time = intercept + scale * f(n)), or 'scale' and 'exponent' for
+                the power law (time = scale * n ** exponent)
+            r_squared (float): Share of the variation in log(time) that the model explains
+            confidence (float): Akaike weight of the model, between 0 and 1
+            exponent (float): Exponent k of the best power law n^k (the empirical order of growth)
+            scores (dict): AICc of every candidate model, lower is better
+            size_range (tuple): (smallest, largest) size the model was fitted to
+        """
+        self.model = model
+        self.coefficients = coefficients
+        self.r_squared = r_squared
+        self.confidence = confidence
+        self.exponent = exponent
+        self.scores = scores
+        self.size_range = size_range
+
+    def predict(self, size):
+        """
+        Predict the time for an input size.
+
+        Args:
+            size (int): Input size
+
+        Returns:
+            float: Predicted time in seconds
+        """
+        if self.model == POWER_LAW:
+            return self.coefficients["scale"] * size ** self.coefficients["exponent"]
+        return (self.coefficients["intercept"]
+                + self.coefficients["scale"] * COMPLEXITY_COSTS[self.model](size))
+
+    @property
+    def label(self):
+        """Big-O label of the model, such as 'O(n log n)'."""
+        if self.model == POWER_LAW:
+            return f"O(n^{self.coefficients['exponent']:.2f})"
+        return f"O({self.model})"
+
+    def formula(self):
+        """Get the fitted model as a readable formula."""
+        if self.model == POWER_LAW:
+            return (f"t = {self.coefficients['scale']:.3g} * "
+                    f"n^{self.coefficients['exponent']:.2f}")
+        if self.model == "1":
+            return f"t = {self.coefficients['intercept']:.3g}"
+        if self.coefficients["intercept"]:
+            return (f"t = {self.coefficients['intercept']:.3g} + "
+                    f"{self.coefficients['scale']:.3g} * {self.model}")
+        return f"t = {self.coefficients['scale']:.3g} * {self.model}"
+
+    def describe(self):
+        """Describe the growth pattern in words."""
+        return PATTERN_DESCRIPTIONS[self.model]
+
+    def matches(self, model):
+        """
+        Check whether the fit agrees with a named model.
+
+        A power law agrees when its exponent is within EXPONENT_TOLERANCE of
+        the named model's own growth over the fitted sizes (see model_exponent).
+
+        Args:
+            model (str): One of MODELS
+
+        Returns:
+            bool: True if the fit is that model or grows like it
+        """
+        if self.model == model:
+            return True
+        if self.model != POWER_LAW or model not in MODELS or self.size_range is None:
+            return False
+        return abs(self.exponent - model_exponent(model, *self.size_range)) <= EXPONENT_TOLERANCE
+
+
+def model_exponent(model, smallest, largest):
+    """
+    Get the power of n a named model grows like between two sizes.
+
+    Args:
+        model (str): One of MODELS
+        smallest (int): Smallest size
+        largest (int): Largest size
+
+    Returns:
+        float: k such that f(largest) / f(smallest) = (largest / smallest) ** k,
+        e.g. 2.0 for n^2 and about 1.1 for n log n at typical sizes
+    """
+    if model in MODEL_EXPONENTS:
+        return MODEL_EXPONENTS[model]
+    cost = COMPLEXITY_COSTS[model]
+    return math.log(cost(largest) / cost(smallest)) / math.log(largest / smallest)
+
+
+def _relative_rss(predicted, times):
+    """Sum of squared relative errors, floored at the timing precision."""
+    residuals = predicted / times - 1
+    return max(float(residuals @ residuals), len(times) * MIN_RELATIVE_ERROR ** 2)
+
+
+def _aicc(rss, points, parameters):
+    """
+    Corrected Akaike information criterion.
+
+    The correction is undefined when points <= parameters + 1. fit_complexity
+    only reaches that with two points, where every candidate has a single
+    constant, so plain AIC still compares them fairly.
+    """
+    aic = points * math.log(rss / points) + 2 * parameters
+    if points - parameters - 1 > 0:
+        aic += 2 * parameters * (parameters + 1) / (points - parameters - 1)
+    return aic
+
+
+def _fit_named_model(model, sizes, times, use_intercept):
+    """
+    Fit time = intercept + scale * f(n) by least squares on relative errors.
+
+    Returns:
+        tuple: (coefficients, rss, parameters), or None if the model does not grow
+    """
+    if model == "1":
+        # The constant that minimises relative error
+        weights = 1 / times
+        intercept = float(weights.sum() / (weights @ weights))
+        return ({"intercept": intercept, "scale": 0.0},
+                _relative_rss(np.full_like(times, intercept), times), 1)
+
+    cost = COMPLEXITY_COSTS[model]
+    features = np.array([cost(n) for n in sizes], dtype=float)
+    # Dividing each row by its time turns relative errors into plain residuals
+    if use_intercept:
+        design = np.column_stack([np.ones_like(features), features]) / times[:, None]
+        (intercept, scale), *_ = np.linalg.lstsq(design, np.ones_like(times), rcond=None)
+        if intercept < 0:
+            use_intercept = False  # A negative start-up cost makes no sense; refit without it
+    if not use_intercept:
+        design = (features / times)[:, None]
+        (scale,), *_ = np.linalg.lstsq(design, np.ones_like(times), rcond=None)
+        intercept = 0.0
+    if scale <= 0:
+        return None
+
+    coefficients = {"intercept": float(intercept), "scale": float(scale)}
+    predicted = intercept + scale * features
+    return coefficients, _relative_rss(predicted, times), 2 if use_intercept else 1
+
+
+def _fit_power_law(sizes, times):
+    """Fit time = scale * n ** exponent as a straight line in log-log space."""
+    design = np.column_stack([np.ones(len(sizes)), np.log(sizes)])
+    (log_scale, exponent), *_ = np.linalg.lstsq(design, np.log(times), rcond=None)
+    return {"scale": float(math.exp(log_scale)), "exponent": float(exponent)}
+
+
+def fit_complexity(sizes, times):
+    """
+    Find the growth model that best explains measured times.
+
+    With four or more points every named model also gets a constant start-up
+    cost (time = a + b * f(n)) and the free power law n^k is a candidate too;
+    with fewer each named model is a pure scale (time = b * f(n)). The power
+    law is only chosen over the named models when it fits clearly better,
+    since a named model is easier to reason about.
+
+    Args:
+        sizes (list): Input sizes that were measured
+        times (list): Measured time for each size in seconds
+
+    Returns:
+        ComplexityFit: The best model, or None with fewer than two distinct
+        sizes or if NumPy is not installed
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+
+    points = [(n, t) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if len({n for n, _ in points}) < 2:
+        return None
+    sizes = np.array([n for n, _ in points], dtype=float)
+    times = np.array([t for _, t in points], dtype=float)
+    use_intercept = len(points) >= 4
+
+    fits = {}
+    scores = {}
+    for model in MODELS:
+        fitted = _fit_named_model(model, sizes, times, use_intercept)
+        if fitted is not None:
+            coefficients, rss, parameters = fitted
+            fits[model] = coefficients
+            scores[model] = _aicc(rss, len(points), parameters)
+
+    power = _fit_power_law(sizes, times)
+    power_predicted = power["scale"] * sizes ** power["exponent"]
+    if len(points) >= POWER_LAW_MIN_POINTS:
+        fits[POWER_LAW] = power
+        scores[POWER_LAW] = _aicc(_relative_rss(power_predicted, times), len(points), 2)
+
+    best = min((m for m in scores if m != POWER_LAW), key=scores.get)
+    same_power = abs(power["exponent"] - MODEL_EXPONENTS.get(best, math.inf)) <= EXPONENT_TOLERANCE
+    if POWER_LAW in scores and scores[POWER_LAW] < scores[best] - POWER_LAW_MARGIN and not same_power:
+        best = POWER_LAW
+
+    # Akaike weights: the relative likelihood of each model given the data. A
+    # named model is weighed against the other named models only, so a power
+    # law that fits about as well (it can mimic any of them) does not dilute it
+    candidates = scores if best == POWER_LAW else {m: s for m, s in scores.items() if m in MODELS}
+    lowest = min(candidates.values())
+    likelihoods = {m: math.exp((lowest - s) / 2) for m, s in candidates.items()}
+    confidence = likelihoods[best] / sum(likelihoods.values())
+
+    fit = ComplexityFit(best, fits[best], 0.0, confidence, power["exponent"], scores,
+                        (float(sizes.min()), float(sizes.max())))
+    log_times = np.log(times)
+    predicted = np.array([fit.predict(n) for n in sizes])
+    total = float(((log_times - log_times.mean()) ** 2).sum())
+    if total > 0 and (predicted > 0).all():
+        fit.r_squared = 1 - float(((log_times - np.log(predicted)) ** 2).sum()) / total
+    else:
+        fit.r_squared = 1.0 if total == 0 else 0.0
+    return fit
@@ -0,0 +1,244 @@
+"""
+Operation Counting
+CS101 Fall 2025 - Activity 05
+
+This module measures algorithms by counting what they do instead of timing
+them. The input list is wrapped in a sequence that counts element reads and
+writes, and every element in an element type that counts comparisons. The
+counts are exact and the same on every run and every machine, so they give
+noise-free growth curves for checking an algorithm's complexity.
+
+Only algorithms that take a Python list (not NumPy arrays or files) can be
+counted.
+"""
+
+from registry import FAMILY_HEADINGS
+from timer import ExperimentResults, build_cell_args, build_experiment_plan
+
+# Counts recorded for every cell
+OPERATION_METRICS = ("comparisons", "writes", "reads")
+
+
+class OperationCounter:
+    """Running totals of the operations performed on counted data."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Set every count back to zero."""
+        self.comparisons = 0
+        self.writes = 0
+        self.reads = 0
+
+    @property
+    def total(self):
+        """All counted operations together."""
+        return self.comparisons + self.writes + self.reads
+
+    def as_dict(self):
+        """Get the counts as a dictionary keyed by OPERATION_METRICS."""
+        return {"comparisons": self.comparisons, "writes": self.writes, "reads": self.reads}
+
+
+def _counted_comparison(method_name):
+    """Build a comparison method that counts itself, then compares the plain ints."""
+    compare = getattr(int, method_name)
+
+    def method(self, other):
+        self.counter.comparisons += 1
+        return compare(self.value, other.value if isinstance(other, CountingValue) else other)
+    method.__name__ = method_name
+    return method
+
+
+def _plain_arithmetic(method_name):
+    """Build an arithmetic method that returns a plain int (arithmetic is not counted)."""
+    operate = getattr(int, method_name)
+
+    def method(self, other):
+        return operate(self.value, other.value if isinstance(other, CountingValue) else other)
+    method.__name__ = method_name
+    return method
+
+
+class CountingValue:
+    """An integer that counts every comparison made with it."""
+
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter):
+        """
+        Args:
+            value (int): The wrapped value
+            counter (OperationCounter): Totals to add comparisons to
+        """
+        self.value = value
+        self.counter = counter
+
+    __eq__ = _counted_comparison("__eq__")
+    __ne__ = _counted_comparison("__ne__")
+    __lt__ = _counted_comparison("__lt__")
+    __le__ = _counted_comparison("__le__")
+    __gt__ = _counted_comparison("__gt__")
+    __ge__ = _counted_comparison("__ge__")
+
+    __add__ = _plain_arithmetic("__add__")
+    __radd__ = _plain_arithmetic("__radd__")
+    __sub__ = _plain_arithmetic("__sub__")
+    __rsub__ = _plain_arithmetic("__rsub__")
+    __mul__ = _plain_arithmetic("__mul__")
+    __rmul__ = _plain_arithmetic("__rmul__")
+    __floordiv__ = _plain_arithmetic("__floordiv__")
+    __truediv__ = _plain_arithmetic("__truediv__")
+    __rtruediv__ = _plain_arithmetic("__rtruediv__")
+    __mod__ = _plain_arithmetic("__mod__")
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __index__(self):
+        return self.value
+
+    def __int__(self):
+        return self.value
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class CountingList(list):
+    """A list that counts element reads and writes made through indexing and iteration."""
+
+    def __init__(self, values, counter):
+        """
+        Args:
+            values: Initial elements
+            counter (OperationCounter): Totals to add reads and writes to
+        """
+        super().__init__(values)
+        self.counter = counter
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            values = super().__getitem__(index)
+            self.counter.reads += len(values)
+            return CountingList(values, self.counter)
+        self.counter.reads += 1
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counter.writes += len(value)
+        else:
+            self.counter.writes += 1
+        super().__setitem__(index, value)
+
+    def __iter__(self):
+        for value in super().__iter__():
+            self.counter.reads += 1
+            yield value
+
+    def copy(self):
+        """Copy the list; copying reads every element."""
+        self.counter.reads += len(self)
+        return CountingList(super().__iter__(), self.counter)
+
+
+def count_operations(algorithm_func, data, *targets):
+    """
+    Run an algorithm once on counted data and report what it did.
+
+    Args:
+        algorithm_func: Function (or index class) to run
+        data (list): Input list (copied, never modified)
+        *targets: Search target, or list of targets, if the algorithm takes one
+
+    Returns:
+        dict: Number of 'comparisons', 'writes' and 'reads'
+    """
+    counter = OperationCounter()
+    counted_data = CountingList((CountingValue(value, counter) for value in data), counter)
+    counted_targets = []
+    for target in targets:
+        if isinstance(target, list):
+            counted_targets.append([CountingValue(value, counter) for value in target])
+        else:
+            counted_targets.append(CountingValue(target, counter))
+
+    # Building the wrappers is not part of the algorithm
+    counter.reset()
+    algorithm_func(counted_data, *counted_targets)
+    return counter.as_dict()
+
+
+def is_countable(spec):
+    """Whether an algorithm takes a plain list, so its operations can be counted."""
+    return not spec.input_kind.endswith("_array") and spec.input_kind != "binary_file"
+
+
+def count_cell(spec, size):
+    """
+    Count the operations of one (algorithm, size) cell on the same data timing uses.
+
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        size (int): Input size
+
+    Returns:
+        dict: Number of 'comparisons', 'writes' and 'reads'
+    """
+    data, *targets = build_cell_args(spec, size)
+    if spec.family == "index":
+        # Indexes are timed on their build, so count the build
+        return count_operations(spec.func, list(data))
+    return count_operations(spec.func, list(data), *targets)
+
+
+def run_counting_experiments(sizes, algorithm_choice, distributions=None):
+    """
+    Run experiments that count operations instead of timing them.
+
+    Each result holds the total number of operations per cell in place of a
+    time, with the separate counts in its metrics, so the usual reports and
+    complexity fitting work on exact counts.
+
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        distributions (list): Input distributions for the size x distribution grid
+            (see timer.build_experiment_plan)
+
+    Returns:
+        list: List of ExperimentResults objects with unit 'operations'
+    """
+    print("=== Operation Counting Analysis ===")
+    print("Counting comparisons, writes and reads instead of timing...")
+
+    all_results = []
+    current_family = None
+    plan = build_experiment_plan(sizes, algorithm_choice, distributions)
+    for spec, cell_sizes in plan:
+        if not is_countable(spec):
+            continue
+        if spec.family != current_family:
+            print("\n" + "="*50)
+            print(FAMILY_HEADINGS[spec.family])
+            print("="*50)
+            current_family = spec.family
+
+        print(f"\nCounting {spec.label.lower()}...")
+        results = ExperimentResults(spec.name, unit="operations", distribution=spec.distribution)
+        for size in cell_sizes:
+            counts = count_cell(spec, size)
+            total = sum(counts.values())
+            results.add_result(size, total, counts=counts)
+            print(f"  Size {size}: {total:,} operations ({counts['comparisons']:,} comparisons, "
+                  f"{counts['writes']:,} writes, {counts['reads']:,} reads)")
+        all_results.append(results)
+
+    skipped = [spec.label for spec, _ in plan if not is_countable(spec)]
+    if skipped:
+        print(f"\nNot counted (they do not take a Python list): {', '.join(skipped)}")
+    return all_results
@@ -0,0 +1,213 @@
+"""
+Dataset Cache for Doubling Experiments
+CS101 Fall 2025 - Activity 05
+
+This module keeps generated experiment inputs around so that repeated sweeps,
+and every algorithm in a family, are timed on identical data without paying
+to generate it again. Recently used datasets stay in memory up to a byte
+budget; every dataset is also written to disk and memory-mapped on later use.
+"""
+
+import functools
+import os
+from collections import OrderedDict
+
+from algorithms import (
+    NUMPY_AVAILABLE, generate_few_unique_list, generate_nearly_sorted_list,
+    generate_organ_pipe_list, generate_quicksort_killer_list, generate_random_list,
+    generate_reverse_sorted_list, generate_sawtooth_list, generate_sorted_list
+)
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+DEFAULT_CACHE_DIR = os.environ.get("ACTIVITY05_CACHE_DIR", ".dataset_cache")
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024  # bytes
+DEFAULT_SEED = 2025
+
+GENERATORS = {
+    "random": generate_random_list,
+    "sorted": generate_sorted_list,
+    "reverse": generate_reverse_sorted_list,
+    "nearly_sorted": generate_nearly_sorted_list,
+    "few_unique": generate_few_unique_list,
+    "organ_pipe": generate_organ_pipe_list,
+    "sawtooth": generate_sawtooth_list,
+    "quicksort_killer": generate_quicksort_killer_list,
+}
+
+# Distributions that take a whole-number setting, written as e.g. 'nearly_sorted:50'
+GENERATOR_SETTINGS = {
+    "nearly_sorted": "swaps",
+    "few_unique": "unique",
+    "sawtooth": "teeth",
+}
+
+
+def get_generator(distribution):
+    """
+    Get the function that generates a distribution.
+
+    Args:
+        distribution (str): One of the names in GENERATORS, optionally followed
+            by ':' and its setting for those in GENERATOR_SETTINGS (e.g. 'nearly_sorted:50')
+
+    Returns:
+        Function taking (size, min_val, max_val, seed=..., as_array=...)
+
+    Raises:
+        ValueError: If the distribution or its setting is not valid
+    """
+    name, _, setting = distribution.partition(":")
+    if name not in GENERATORS:
+        raise ValueError(f"Unknown distribution '{distribution}', "
+                         f"expected one of {sorted(GENERATORS)}")
+    generator = GENERATORS[name]
+    if not setting:
+        return generator
+    if name not in GENERATOR_SETTINGS or not setting.isdigit() or int(setting) < 1:
+        raise ValueError(f"Distribution '{distribution}' does not take the setting '{setting}'")
+    return functools.partial(generator, **{GENERATOR_SETTINGS[name]: int(setting)})
+
+
+class DatasetCache:
+    """Byte-budgeted LRU cache of generated datasets, backed by memory-mapped files."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, memory_budget=DEFAULT_MEMORY_BUDGET):
+        """
+        Args:
+            cache_dir (str): Directory for the on-disk copies (None keeps data in memory only)
+            memory_budget (int): Maximum number of bytes of datasets kept in memory
+        """
+        self.cache_dir = cache_dir if NUMPY_AVAILABLE else None
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, distribution, size, min_val=1, max_val=1000, seed=DEFAULT_SEED):
+        """
+        Get a dataset, generating it only if it is neither in memory nor on disk.
+
+        The returned data is shared with other callers and must not be modified.
+
+        Args:
+            distribution (str): One of the names in GENERATORS (see get_generator)
+            size (int): Number of elements
+            min_val (int): Minimum value for random numbers
+            max_val (int): Maximum value for random numbers
+            seed (int): Seed used to generate the data
+
+        Returns:
+            A read-only NumPy array (a list if NumPy is not installed)
+        """
+        get_generator(distribution)  # Fail before caching anything for a bad name
+
+        key = (distribution, size, min_val, max_val, seed)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        path = self._path_for(key)
+        if path is not None and os.path.exists(path):
+            self.hits += 1
+            data = np.load(path, mmap_mode="r")
+        else:
+            self.misses += 1
+            data = self._generate(key)
+            if path is not None:
+                self._write(path, data)
+
+        self._remember(key, data)
+        return data
+
+    def get_list(self, distribution, size, min_val=1, max_val=1000, seed=DEFAULT_SEED):
+        """
+        Get a dataset as a fresh Python list that the caller is free to modify.
+
+        Args:
+            distribution (str): One of the names in GENERATORS (see get_generator)
+            size (int): Number of elements
+            min_val (int): Minimum value for random numbers
+            max_val (int): Maximum value for random numbers
+            seed (int): Seed used to generate the data
+
+        Returns:
+            list: The dataset as a list of Python ints
+        """
+        data = self.get(distribution, size, min_val, max_val, seed)
+        return data.tolist() if NUMPY_AVAILABLE else list(data)
+
+    def clear(self, remove_files=False):
+        """
+        Drop all in-memory datasets, and optionally the on-disk copies too.
+
+        Args:
+            remove_files (bool): Also delete the cached files from cache_dir
+        """
+        self._entries.clear()
+        self.memory_used = 0
+        if remove_files and self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".npy"):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def _path_for(self, key):
+        """Get the file that holds the on-disk copy of a dataset."""
+        if self.cache_dir is None:
+            return None
+        distribution, size, min_val, max_val, seed = key
+        name = distribution.replace(":", "_")  # ':' is not allowed in Windows file names
+        return os.path.join(self.cache_dir, f"{name}-{size}-{min_val}-{max_val}-{seed}.npy")
+
+    def _generate(self, key):
+        """Generate the dataset for a cache key."""
+        distribution, size, min_val, max_val, seed = key
+        generator = get_generator(distribution)
+        if NUMPY_AVAILABLE:
+            data = generator(size, min_val, max_val, seed=seed, as_array=True)
+            data = np.ascontiguousarray(data)
+            data.flags.writeable = False
+            return data
+        return tuple(generator(size, min_val, max_val, seed=seed))
+
+    def _write(self, path, data):
+        """Write a dataset to disk atomically so concurrent workers never see half a file."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, data)
+        os.replace(temp_path, path)
+
+    def _remember(self, key, data):
+        """Keep a dataset in memory, evicting the least recently used ones over budget."""
+        self._entries[key] = data
+        self.memory_used += _nbytes(data)
+        while self.memory_used > self.memory_budget and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.memory_used -= _nbytes(evicted)
+
+
+def _nbytes(data):
+    """Estimate the memory held by a cached dataset."""
+    if NUMPY_AVAILABLE:
+        return data.nbytes
+    return len(data) * 8
+
+
+_default_cache = None
+
+
+def get_default_cache():
+    """
+    Get the cache shared by all experiments in this process.
+
+    Returns:
+        DatasetCache: The process-wide dataset cache
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DatasetCache()
+    return _default_cache
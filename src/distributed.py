@@ -0,0 +1,373 @@
+"""
+Distributed Experiment Sweeps
+CS101 Fall 2025 - Activity 05
+
+This module spreads one sweep across several machines. A coordinator splits
+the size x algorithm x distribution grid into shards, one per algorithm and
+distribution, and hands them out over TCP to any number of workers. Each
+worker measures its shard one cell at a time and sends every cell back as
+soon as it is done, tagged with the worker's host name. The coordinator
+merges the cells into the usual list of ExperimentResults.
+
+A worker that disconnects (or, with worker_timeout, goes silent) loses its
+shard: the cells it had not sent back yet go back in the queue for another
+worker. A busy worker sends a heartbeat every HEARTBEAT_INTERVAL seconds, so a
+long cell does not look like a dead worker. Workers can join at any time, even
+after the sweep has started; each new connection is greeted on its own thread,
+so a client that connects and says nothing never holds up the others.
+
+Messages are pickled, so only a peer holding the shared key may connect.
+The key is read from the ACTIVITY05_AUTHKEY environment variable. If it is not
+set, the coordinator generates a random key and prints it; every worker must
+then be started with ACTIVITY05_AUTHKEY set to that key. For a
+single-machine test, start a coordinator and a few workers in separate terminals:
+
+    activity05 --sizes 1000,2000,4000 --algorithms sort --coordinator 127.0.0.1:6005
+    ACTIVITY05_AUTHKEY=<printed key> activity05 --worker 127.0.0.1:6005
+
+Every worker generates its input data from the same seed, so all hosts
+measure identical inputs. Since each shard runs on one host, every growth
+curve comes from a single machine.
+"""
+
+import os
+import queue
+import secrets
+import socket
+import threading
+import time
+from collections import Counter, deque
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener, answer_challenge, deliver_challenge, wait
+
+from algorithms import warm_up_timing
+from events import cell_event
+from registry import get_algorithm
+from results_store import describe_environment
+from timer import ExperimentResults, build_experiment_plan, complete_resumed_cell, measure_cell
+
+DEFAULT_AUTHKEY = os.environ.get("ACTIVITY05_AUTHKEY")
+
+# Seconds between a busy worker's heartbeats; worker_timeout must be longer
+HEARTBEAT_INTERVAL = 5.0
+
+# Seconds a new connection has to say who it is before it is dropped
+GREETING_TIMEOUT = 10.0
+
+
+def parse_address(address):
+    """
+    Split a 'host:port' string into an address tuple.
+
+    Args:
+        address (str): Address such as '127.0.0.1:6005' or 'node3:6005'
+
+    Returns:
+        tuple: (host, port)
+    """
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Address must look like host:port: {address}")
+    return host, int(port)
+
+
+def generate_authkey():
+    """Make a random key for a coordinator started without ACTIVITY05_AUTHKEY."""
+    return secrets.token_hex(16)
+
+
+def resolve_authkey(authkey=None):
+    """
+    Get the shared key used to authenticate coordinator and workers.
+
+    Args:
+        authkey (str): Key to use (defaults to ACTIVITY05_AUTHKEY)
+
+    Returns:
+        bytes: The key
+
+    Raises:
+        ValueError: If no key is given and ACTIVITY05_AUTHKEY is not set
+    """
+    authkey = authkey or DEFAULT_AUTHKEY
+    if not authkey:
+        raise ValueError("Set ACTIVITY05_AUTHKEY to the key printed by the coordinator")
+    return authkey.encode() if isinstance(authkey, str) else authkey
+
+
+def _accept_workers(listener, authkey, arrivals):
+    """Accept connections until the listener is closed, greeting each on its own thread."""
+    while True:
+        try:
+            connection = listener.accept()
+        except OSError:
+            return  # The listener was closed
+        threading.Thread(target=_greet_worker, args=(connection, authkey, arrivals),
+                         daemon=True).start()
+
+
+def _greet_worker(connection, authkey, arrivals):
+    """Check a new connection's key and read its hello, then queue it as a worker."""
+    try:
+        deliver_challenge(connection, authkey)
+        answer_challenge(connection, authkey)
+        if not connection.poll(GREETING_TIMEOUT):
+            raise EOFError
+        _, host, environment = connection.recv()
+    except Exception:
+        # A client with the wrong key, one that hung up, or one that never said who it is
+        connection.close()
+        return
+    arrivals.put((connection, host, environment))
+
+
+class _Worker:
+    """A connected worker and the shard it is measuring."""
+
+    def __init__(self, connection, host, environment):
+        self.connection = connection
+        self.host = host
+        self.environment = environment
+        self.spec = None
+        self.remaining = []
+        self.last_heard = time.monotonic()
+
+    def assign(self, spec, sizes, trial_policy, memory):
+        """Send the worker a shard to measure."""
+        self.spec = spec
+        self.remaining = list(sizes)
+        self.last_heard = time.monotonic()
+        self.connection.send(("shard", spec.name, spec.distribution, self.remaining,
+                              trial_policy, memory))
+
+
+def run_distributed_experiments(sizes, algorithm_choice, address, trial_policy=None,
+                                checkpoints=None, memory=False, distributions=None,
+                                on_event=None, authkey=None,
+                                worker_timeout=None):
+    """
+    Coordinate a sweep whose cells are measured by workers on other hosts.
+
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        address (tuple): (host, port) to listen on for workers
+        trial_policy (dict): Overrides for the timing settings (see timer.measure_cell)
+        checkpoints (CellCheckpoints): Saves each received cell and supplies resumed ones
+        memory (bool): Also measure the memory footprint of every cell (on the worker)
+        distributions (list): Input distributions for the size x distribution grid
+            (see timer.build_experiment_plan)
+        on_event: Called with an ExperimentEvent as each cell arrives (see events.py)
+        authkey (str): Shared key workers must present (defaults to ACTIVITY05_AUTHKEY;
+            if neither is set, a random key is generated and printed)
+        worker_timeout (float): Seconds a busy worker may go without sending a cell or a
+            heartbeat before it is presumed dead and its cells are reassigned (None waits
+            forever); must be longer than HEARTBEAT_INTERVAL
+
+    Returns:
+        list: List of ExperimentResults objects; each cell's metrics name the
+        'host' that measured it
+    """
+    plan = build_experiment_plan(sizes, algorithm_choice, distributions)
+
+    # Cells measured by an earlier, interrupted run are not handed out again
+    timings = {}
+    if checkpoints:
+        for spec, cell_sizes in plan:
+            for size in cell_sizes:
+                timing = checkpoints.lookup(spec, size, trial_policy)
+                if timing is not None:
+                    complete_resumed_cell(spec, size, timing, memory)
+                    timings[(spec.label, size)] = timing
+                    if on_event is not None:
+                        on_event(cell_event(spec, size, timing.mean, timing, resumed=True))
+
+    # One shard per algorithm and distribution, the most expensive first
+    shards = []
+    for spec, cell_sizes in plan:
+        missing = [size for size in cell_sizes if (spec.label, size) not in timings]
+        if missing:
+            shards.append((spec, missing))
+    shards.sort(key=lambda shard: shard[0].estimated_cost(max(shard[1])), reverse=True)
+    shards = deque(shards)
+    total = sum(len(cell_sizes) for _, cell_sizes in plan)
+
+    print("=== Distributed Algorithm Performance Analysis ===")
+    if timings:
+        print(f"Resuming: {len(timings)} cells were already measured")
+    print(f"Waiting for workers on {address[0]}:{address[1]} to measure "
+          f"{total - len(timings)} cells in {len(shards)} shards...")
+
+    authkey = authkey or DEFAULT_AUTHKEY
+    if not authkey:
+        authkey = generate_authkey()
+        print(f"Start every worker with ACTIVITY05_AUTHKEY={authkey}")
+    # No authkey here: _greet_worker checks it, so a slow handshake holds up nobody else
+    listener = Listener(address)
+    arrivals = queue.Queue()
+    threading.Thread(target=_accept_workers, args=(listener, resolve_authkey(authkey), arrivals),
+                     daemon=True).start()
+
+    workers = []
+    cells_by_host = Counter()
+    try:
+        while len(timings) < total:
+            # Add the workers that have said hello since the last round
+            while not arrivals.empty():
+                connection, host, environment = arrivals.get()
+                workers.append(_Worker(connection, host, environment))
+                print(f"  Worker joined: {host} ({environment['platform']}, "
+                      f"{environment['cpu_count']} CPUs)")
+
+            for worker in workers:
+                if worker.spec is None and shards:
+                    worker.assign(*shards.popleft(), trial_policy, memory)
+
+            lost = []
+            for connection in wait([worker.connection for worker in workers], timeout=0.2):
+                worker = next(worker for worker in workers if worker.connection is connection)
+                try:
+                    message = connection.recv()
+                except (EOFError, OSError):
+                    lost.append(worker)
+                    continue
+                worker.last_heard = time.monotonic()
+
+                if message[0] == "cell":
+                    _, size, timing = message
+                    spec = worker.spec
+                    worker.remaining.remove(size)
+                    timings[(spec.label, size)] = timing
+                    cells_by_host[worker.host] += 1
+                    if checkpoints:
+                        checkpoints.save(spec, size, trial_policy, timing)
+                    print(f"  [{len(timings)}/{total}] {spec.label} size {size}: "
+                          f"{timing.mean:.6f} seconds on {worker.host}")
+                    if on_event is not None:
+                        on_event(cell_event(spec, size, timing.mean, timing))
+                elif message[0] == "shard_done":
+                    worker.spec = None
+                # A "heartbeat" only says the worker is alive, as recorded above
+                elif message[0] == "error":
+                    raise RuntimeError(f"{worker.spec.name} failed on {worker.host}: {message[1]}")
+
+            if worker_timeout is not None:
+                now = time.monotonic()
+                lost += [worker for worker in workers if worker.spec is not None
+                         and worker not in lost and now - worker.last_heard > worker_timeout]
+
+            for worker in lost:
+                # Give the cells it had not finished to another worker
+                workers.remove(worker)
+                worker.connection.close()
+                if worker.spec is not None and worker.remaining:
+                    shards.appendleft((worker.spec, worker.remaining))
+                    print(f"  Worker {worker.host} was lost; reassigning {worker.spec.label} "
+                          f"sizes {', '.join(map(str, worker.remaining))}")
+                else:
+                    print(f"  Worker {worker.host} left")
+    finally:
+        for worker in workers:
+            try:
+                worker.connection.send(("stop",))
+                worker.connection.close()
+            except OSError:
+                pass
+        listener.close()
+
+    if cells_by_host:
+        print("Cells measured per host: " +
+              ", ".join(f"{host} {count}" for host, count in cells_by_host.most_common()))
+
+    # Merge the cells in plan order so reports look the same as a serial run
+    all_results = []
+    for spec, cell_sizes in plan:
+        results = ExperimentResults(spec.name, batch_size=spec.params.get("batch_size"),
+                                    distribution=spec.distribution)
+        for size in cell_sizes:
+            timing = timings[(spec.label, size)]
+            results.add_result(size, timing.mean, timing)
+        all_results.append(results)
+
+    return all_results
+
+
+def run_worker(address, authkey=None, connect_timeout=30.0):
+    """
+    Measure shards for a coordinator until it says the sweep is done.
+
+    Args:
+        address (tuple): (host, port) of the coordinator
+        authkey (str): Shared key (see resolve_authkey)
+        connect_timeout (float): Seconds to keep retrying while the coordinator starts
+
+    Returns:
+        int: Number of cells measured
+
+    Raises:
+        ValueError: If there is no key, or the coordinator rejects it
+    """
+    key = resolve_authkey(authkey)
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            connection = Client(address, authkey=key)
+            break
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.5)
+        except AuthenticationError:
+            raise ValueError("The coordinator rejected the key in ACTIVITY05_AUTHKEY")
+
+    host = f"{socket.gethostname()}:{os.getpid()}"
+    connection.send(("hello", host, describe_environment()))
+    print(f"Connected to coordinator at {address[0]}:{address[1]} as {host}")
+    warm_up_timing()
+
+    # The heartbeat thread shares the connection, so every send takes the lock
+    send_lock = threading.Lock()
+
+    def send(message):
+        with send_lock:
+            connection.send(message)
+
+    stopped = threading.Event()
+
+    def heartbeat():
+        while not stopped.wait(HEARTBEAT_INTERVAL):
+            try:
+                send(("heartbeat",))
+            except OSError:
+                return
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+
+    measured = 0
+    try:
+        while True:
+            message = connection.recv()
+            if message[0] == "stop":
+                break
+            _, algorithm_name, distribution, sizes, trial_policy, memory = message
+            spec = get_algorithm(algorithm_name, distribution)
+            print(f"Measuring {spec.label} at sizes {', '.join(map(str, sizes))}")
+            try:
+                for size in sizes:
+                    timing = measure_cell(spec, size, trial_policy, memory)
+                    timing.metrics["host"] = host
+                    send(("cell", size, timing))
+                    measured += 1
+            except Exception as e:
+                send(("error", f"{type(e).__name__}: {e}"))
+                break
+            send(("shard_done",))
+    except (EOFError, OSError):
+        print("Lost the connection to the coordinator")
+    finally:
+        stopped.set()
+        with send_lock:
+            connection.close()
+
+    print(f"Done: measured {measured} cells")
+    return measured
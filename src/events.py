@@ -0,0 +1,83 @@
+"""
+Experiment Events
+CS101 Fall 2025 - Activity 05
+
+The experiment runners can report their progress as a stream of events
+instead of only returning results at the end. Pass a callback as on_event to
+run_custom_experiments (or any runner) and it is called with one
+ExperimentEvent for every event below:
+
+    trial         one timing sample of a cell (serial runs only, since the
+                  parallel and budgeted runners time cells in other processes)
+    cell          a finished cell, with its TimingResult; extrapolated and
+                  resumed cells are reported too
+    run_started   the sweep is about to start (value is the number of cells)
+    run_finished  the sweep is done (results holds the ExperimentResults list)
+    run_failed    the sweep stopped with an error (error holds the message)
+
+Callbacks are only ever called between timed samples, never inside one, so a
+slow callback delays the sweep but does not change the measured times. The
+run_* events are sent by live.py, which runs a whole sweep in a separate
+process.
+"""
+
+TRIAL = "trial"
+CELL = "cell"
+RUN_STARTED = "run_started"
+RUN_FINISHED = "run_finished"
+RUN_FAILED = "run_failed"
+
+
+class ExperimentEvent:
+    """One step of a running experiment."""
+
+    def __init__(self, kind, algorithm=None, distribution=None, size=None, trial=None,
+                 value=None, timing=None, extrapolated=False, resumed=False, results=None,
+                 error=None):
+        """
+        Args:
+            kind (str): TRIAL, CELL, RUN_STARTED, RUN_FINISHED or RUN_FAILED
+            algorithm (str): Registered algorithm name
+            distribution (str): Input distribution, or None for the registered input
+            size (int): Input size of the cell
+            trial (int): Index of the sample within the cell (trial events)
+            value (float): Seconds per call of the sample or cell, or the number
+                of cells for run_started
+            timing (TimingResult): The cell's timing (measured and resumed cells)
+            extrapolated (bool): The cell's value was predicted, not measured
+            resumed (bool): The cell was reused from a checkpoint
+            results (list): ExperimentResults of the whole sweep (run_finished)
+            error (str): What went wrong (run_failed)
+        """
+        self.kind = kind
+        self.algorithm = algorithm
+        self.distribution = distribution
+        self.size = size
+        self.trial = trial
+        self.value = value
+        self.timing = timing
+        self.extrapolated = extrapolated
+        self.resumed = resumed
+        self.results = results
+        self.error = error
+
+    @property
+    def label(self):
+        """Algorithm name, with the distribution when one was chosen."""
+        if self.distribution is None:
+            return self.algorithm
+        return f"{self.algorithm} [{self.distribution}]"
+
+    def __repr__(self):
+        return f"ExperimentEvent({self.kind!r}, {self.label!r}, size={self.size!r}, value={self.value!r})"
+
+
+def trial_event(spec, size, trial, seconds):
+    """Build the event for one timing sample of a cell."""
+    return ExperimentEvent(TRIAL, spec.name, spec.distribution, size, trial=trial, value=seconds)
+
+
+def cell_event(spec, size, value, timing=None, extrapolated=False, resumed=False):
+    """Build the event for a finished cell."""
+    return ExperimentEvent(CELL, spec.name, spec.distribution, size, value=value, timing=timing,
+                           extrapolated=extrapolated, resumed=resumed)
@@ -0,0 +1,291 @@
+"""
+Measurement Hygiene
+CS101 Fall 2025 - Activity 05
+
+This module keeps the machine's own noise out of the measurements:
+
+    pin_to_cpu                   keeps the timing process on one core, so the
+                                 operating system never moves it (and leaves
+                                 its caches behind) in the middle of a trial
+    StabilityCheck               times a fixed reference workload before and
+                                 after a run and scores how steady the
+                                 machine was, from 0 to 100
+    run_interleaved_experiments  takes the trials of every cell in a random
+                                 order, round by round, so clock-speed changes
+                                 and thermal drift are spread over all cells
+                                 instead of landing in a few of them
+
+The garbage collector is paused around every timed trial by measure_algorithm
+itself (see algorithms.TrialSampler), and warm_up_timing waits for timings to
+reach a steady state before measuring starts.
+"""
+
+import os
+import random
+import statistics
+import time
+
+from algorithms import TrialSampler, _garbage_collection_paused, warm_up_timing
+from datasets import DEFAULT_SEED
+from events import cell_event
+from timer import (
+    ExperimentResults, _describe_metrics, _trial_callback, build_cell_args,
+    build_experiment_plan, complete_resumed_cell, finish_cell, measure_cell
+)
+
+# Number of times the reference workload is timed at each end of a run
+REFERENCE_REPEATS = 15
+
+
+def pin_to_cpu(cpu=None):
+    """
+    Pin this process, and the processes it starts later, to a single CPU.
+
+    Args:
+        cpu (int): CPU id, or None for the last CPU this process may use (the
+            first CPU is the one most often busy handling interrupts)
+
+    Returns:
+        int: The CPU the process now runs on
+
+    Raises:
+        ValueError: If pinning is not supported here or the CPU is not available
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        raise ValueError("Pinning to a CPU needs Linux (os.sched_setaffinity)")
+    allowed = sorted(os.sched_getaffinity(0))
+    if cpu is None:
+        cpu = allowed[-1]
+    if cpu not in allowed:
+        raise ValueError(f"CPU {cpu} is not available; choose from {', '.join(map(str, allowed))}")
+    os.sched_setaffinity(0, {cpu})
+    return cpu
+
+
+def _reference_workload(data):
+    """A small fixed mix of sorting and summing whose speed should never change."""
+    for _ in range(5):
+        sorted(data)
+        sum(data)
+
+
+def time_reference(repeats=REFERENCE_REPEATS):
+    """
+    Time the reference workload several times.
+
+    Args:
+        repeats (int): Number of timings
+
+    Returns:
+        list: Seconds taken by each repeat
+    """
+    rng = random.Random(DEFAULT_SEED)
+    data = [rng.randint(1, 1_000_000) for _ in range(2000)]
+    _reference_workload(data)  # Untimed, so the first repeat does not start with cold caches
+    times = []
+    for _ in range(repeats):
+        with _garbage_collection_paused():
+            start = time.perf_counter_ns()
+            _reference_workload(data)
+            times.append((time.perf_counter_ns() - start) / 1e9)
+    return times
+
+
+def cpu_governor():
+    """
+    Get the CPU frequency governor, such as 'performance' or 'powersave'.
+
+    Returns:
+        str: The governor of the first CPU this process may use, or None if unknown
+    """
+    cpu = min(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 0
+    try:
+        with open(f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_governor") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def load_per_cpu():
+    """
+    Get the one-minute load average divided by the number of CPUs.
+
+    Returns:
+        float: Runnable processes per CPU (above 1 means CPUs are shared), or None if unknown
+    """
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+class StabilityCheck:
+    """
+    Score how steady the machine was over a run.
+
+    The same reference workload is timed before and after the run. Three
+    things lower the score from 100: noise (the spread of the reference
+    timings), drift (how far the machine's speed moved between the start and
+    the end), and a busy or frequency-scaled CPU.
+    """
+
+    def __init__(self, repeats=REFERENCE_REPEATS):
+        """
+        Args:
+            repeats (int): Number of reference timings at each end of the run
+        """
+        self.repeats = repeats
+        self.before = []
+        self.after = []
+
+    def start(self):
+        """Time the reference workload before the run."""
+        self.before = time_reference(self.repeats)
+        return self
+
+    def finish(self):
+        """
+        Time the reference workload after the run and score the run.
+
+        Returns:
+            dict: 'score' (0-100), 'noise' and 'drift' (fractions of the
+            reference time), 'load_per_cpu' and 'governor' (None if unknown)
+        """
+        self.after = time_reference(self.repeats)
+        samples = self.before + self.after
+        median = statistics.median(samples)
+        noise = statistics.median(abs(sample - median) for sample in samples) / median
+        before = statistics.median(self.before)
+        drift = abs(statistics.median(self.after) - before) / before
+        load = load_per_cpu()
+        governor = cpu_governor()
+
+        # 1% of noise or drift costs 5 points each; a shared CPU or frequency scaling costs more
+        penalty = 500 * noise + 500 * drift
+        if load is not None:
+            penalty += 20 * max(0.0, load - 0.5)
+        if governor not in (None, "performance"):
+            penalty += 10
+        return {"score": max(0, min(100, round(100 - penalty))), "noise": noise,
+                "drift": drift, "load_per_cpu": load, "governor": governor}
+
+
+def describe_stability(report):
+    """
+    Describe a stability report in one line.
+
+    Args:
+        report (dict): As returned by StabilityCheck.finish
+
+    Returns:
+        str: e.g. 'Environment stability: 91/100 (stable) - noise 0.4%, drift 0.9%, ...'
+    """
+    score = report["score"]
+    if score >= 80:
+        rating = "stable"
+    elif score >= 50:
+        rating = "noisy"
+    else:
+        rating = "unstable; treat the doubling ratios with caution"
+    details = [f"noise {report['noise']:.1%}", f"drift {report['drift']:.1%}"]
+    if report["load_per_cpu"] is not None:
+        details.append(f"load {report['load_per_cpu']:.2f} per CPU")
+    if report["governor"] is not None:
+        details.append(f"governor {report['governor']}")
+    return f"Environment stability: {score}/100 ({rating}) - {', '.join(details)}"
+
+
+def run_interleaved_experiments(sizes, algorithm_choice, trial_policy=None, checkpoints=None,
+                                memory=False, profilers=None, distributions=None, on_event=None,
+                                seed=DEFAULT_SEED):
+    """
+    Run experiments taking the trials of all cells in a random, interleaved order.
+
+    Every cell is calibrated first. Then, round after round, each cell that
+    still needs trials gets one more, with the cells in a new random order
+    every round. A cell stops once it is stable or out of trials or time,
+    exactly as in measure_algorithm. Index cells time three things (the
+    build, queries and scans), so they are measured whole, in their random place.
+
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        trial_policy (dict): Overrides for the timing settings (see timer.measure_cell)
+        checkpoints (CellCheckpoints): Saves each cell as it finishes and supplies resumed ones
+        memory (bool): Also measure the memory footprint of every cell
+        profilers (list): Profiling hooks to run on every cell (see profiling.py)
+        distributions (list): Input distributions for the size x distribution grid
+            (see timer.build_experiment_plan)
+        on_event: Called with an ExperimentEvent for every trial and cell (see events.py)
+        seed (int): Seed for the random trial order
+
+    Returns:
+        list: List of ExperimentResults objects
+    """
+    print("=== Interleaved Algorithm Performance Analysis ===")
+    print("\nWarming up timing system...")
+    warm_up_timing()
+
+    rng = random.Random(seed)
+    plan = build_experiment_plan(sizes, algorithm_choice, distributions)
+    timings = {}
+    cells = []
+    for spec, cell_sizes in plan:
+        for size in cell_sizes:
+            timing = checkpoints.lookup(spec, size, trial_policy) if checkpoints else None
+            if timing is None:
+                cells.append((spec, size))
+                continue
+            complete_resumed_cell(spec, size, timing, memory, profilers)
+            timings[(spec.label, size)] = timing
+            print(f"  {spec.label} size {size}: {timing.mean:.6f} seconds (resumed)")
+            if on_event is not None:
+                on_event(cell_event(spec, size, timing.mean, timing, resumed=True))
+
+    def finished(spec, size, timing):
+        timings[(spec.label, size)] = timing
+        if checkpoints:
+            checkpoints.save(spec, size, trial_policy, timing)
+        print(f"  {spec.label} size {size}: {timing.mean:.6f} seconds{_describe_metrics(timing)}")
+        if on_event is not None:
+            on_event(cell_event(spec, size, timing.mean, timing))
+
+    print(f"Calibrating {len(cells)} experiment cells...")
+    rng.shuffle(cells)
+    active = []
+    for spec, size in cells:
+        if spec.family == "index":
+            finished(spec, size, measure_cell(spec, size, trial_policy, memory, profilers,
+                                              _trial_callback(on_event, spec, size)))
+            continue
+        policy = {"min_trials": spec.min_trials}
+        policy.update(trial_policy or {})
+        args = build_cell_args(spec, size)
+        sampler = TrialSampler(spec.func, *args, copy_args=spec.mutates,
+                               on_trial=_trial_callback(on_event, spec, size), **policy)
+        active.append((spec, size, args, sampler))
+
+    print(f"Interleaving the trials of {len(active)} cells in random order...")
+    rounds = 0
+    while active:
+        rounds += 1
+        rng.shuffle(active)
+        for spec, size, args, sampler in active:
+            if sampler.needs_more():
+                sampler.take_sample()
+        for spec, size, args, sampler in [cell for cell in active if not cell[3].needs_more()]:
+            finished(spec, size, finish_cell(spec, size, sampler.result(), args, memory, profilers))
+        active = [cell for cell in active if cell[3].needs_more()]
+    print(f"Finished after {rounds} rounds")
+
+    # Rebuild the results in plan order so reports look the same as a serial run
+    all_results = []
+    for spec, cell_sizes in plan:
+        results = ExperimentResults(spec.name, batch_size=spec.params.get("batch_size"),
+                                    distribution=spec.distribution)
+        for size in cell_sizes:
+            timing = timings[(spec.label, size)]
+            results.add_result(size, timing.mean, timing)
+        all_results.append(results)
+
+    return all_results
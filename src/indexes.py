@@ -0,0 +1,176 @@
+"""
+Search Indexes for Repeated Lookups
+CS101 Fall 2025 - Activity 05
+
+This module builds reusable indexes over a dataset so that many searches can
+share one up-front cost instead of each paying for a full linear scan.
+"""
+
+from bisect import bisect_left
+
+from algorithms import linear_search, measure_algorithm
+
+
+class HashIndex:
+    """Index that maps every value to the position of its first occurrence."""
+
+    def __init__(self, data_list):
+        """
+        Build the index.
+
+        Args:
+            data_list (list): List to index (not modified)
+
+        Time needed: Visits each element once
+        """
+        self.positions = {}
+        for i, value in enumerate(data_list):
+            if value not in self.positions:
+                self.positions[value] = i
+
+    def search(self, target):
+        """
+        Find the first position of a target value.
+
+        Args:
+            target: Value to search for
+
+        Returns:
+            int: Index of target in the original list, -1 if not found
+        """
+        return self.positions.get(target, -1)
+
+
+class SortedIndex:
+    """Index that keeps the values in sorted order next to their original positions."""
+
+    def __init__(self, data_list):
+        """
+        Build the index.
+
+        Args:
+            data_list (list): List to index (not modified)
+
+        Time needed: Sorts the positions by value once
+        """
+        # Sorting positions by value keeps equal values in position order,
+        # so bisect_left always lands on the first occurrence
+        order = sorted(range(len(data_list)), key=data_list.__getitem__)
+        self.values = [data_list[i] for i in order]
+        self.positions = order
+
+    def search(self, target):
+        """
+        Find the first position of a target value with binary search.
+
+        Args:
+            target: Value to search for
+
+        Returns:
+            int: Index of target in the original list, -1 if not found
+        """
+        i = bisect_left(self.values, target)
+        if i < len(self.values) and self.values[i] == target:
+            return self.positions[i]
+        return -1
+
+
+class BlockedIndex:
+    """Two-level sorted index that searches a small table of block fences first."""
+
+    def __init__(self, data_list, block_size=256):
+        """
+        Build the index.
+
+        Args:
+            data_list (list): List to index (not modified)
+            block_size (int): Number of entries in each block
+
+        Time needed: Sorts the positions by value once, then splits them into blocks
+        """
+        order = sorted(range(len(data_list)), key=data_list.__getitem__)
+        self.blocks = []
+        self.fences = []  # Smallest value in each block
+        for start in range(0, len(order), block_size):
+            block_positions = order[start:start + block_size]
+            block_values = [data_list[i] for i in block_positions]
+            self.blocks.append((block_values, block_positions))
+            self.fences.append(block_values[0])
+
+    def search(self, target):
+        """
+        Find the first position of a target value.
+
+        Args:
+            target: Value to search for
+
+        Returns:
+            int: Index of target in the original list, -1 if not found
+        """
+        # Equal values can spill across a fence, so the first occurrence is in the
+        # block before the first fence >= target, or else starts that fence's block
+        b = bisect_left(self.fences, target)
+        if b > 0:
+            values, positions = self.blocks[b - 1]
+            i = bisect_left(values, target)
+            if i < len(values) and values[i] == target:
+                return positions[i]
+        if b < len(self.fences) and self.fences[b] == target:
+            return self.blocks[b][1][0]
+        return -1
+
+
+INDEX_TYPES = {
+    "Hash Index": HashIndex,
+    "Sorted Index": SortedIndex,
+    "Blocked Index": BlockedIndex,
+}
+
+
+def _scan_queries(data_list, targets):
+    """Answer every target with its own linear scan."""
+    for target in targets:
+        linear_search(data_list, target)
+
+
+def _index_queries(index, targets):
+    """Answer every target with the prebuilt index."""
+    for target in targets:
+        index.search(target)
+
+
+def measure_index(index_class, data_list, targets, on_trial=None, **timing_options):
+    """
+    Measure the build cost of an index and when it starts to pay off.
+
+    The break-even query count is the number of queries after which building
+    the index and querying it is cheaper than doing a linear scan per query.
+
+    Args:
+        index_class: One of the classes in INDEX_TYPES
+        data_list (list): Data to index
+        targets (list): Sample of query targets used to time searches
+        on_trial: Called after each sample of the build (see measure_algorithm)
+        **timing_options: Extra settings for measure_algorithm, such as min_trials
+
+    Returns:
+        TimingResult: Timing of the build, with 'query_time', 'scan_time' and
+        'break_even' (queries, inf if the index never pays off) in its metrics
+    """
+    options = {"min_trials": 3}
+    options.update(timing_options)
+    build = measure_algorithm(index_class, data_list, copy_args=False, on_trial=on_trial,
+                              **options)
+    index = index_class(data_list)
+    query_time = measure_algorithm(_index_queries, index, targets, copy_args=False,
+                                   **options).mean / len(targets)
+    scan_time = measure_algorithm(_scan_queries, data_list, targets, copy_args=False,
+                                  **options).mean / len(targets)
+
+    if scan_time > query_time:
+        break_even = build.mean / (scan_time - query_time)
+    else:
+        break_even = float("inf")
+
+    build.metrics.update(query_time=query_time, scan_time=scan_time, break_even=break_even)
+    return build
@@ -0,0 +1,89 @@
+"""
+Lazy Imports
+CS101 Fall 2025 - Activity 05
+
+NumPy and matplotlib take most of the time needed to start the program, yet
+many runs use only one of them, or neither. This module imports a package
+lazily: it checks the package is installed straight away, but only loads it
+the first time one of its attributes is used. Every worker process and short
+headless run therefore starts without paying for backends it never touches.
+
+Measure the effect with startup.py.
+"""
+
+import importlib.util
+import os
+import sys
+
+
+def lazy_import(name):
+    """
+    Import a module on first use.
+
+    Args:
+        name (str): Module name, such as 'numpy'
+
+    Returns:
+        module: The module, loaded when one of its attributes is first used,
+        or None if it is not installed
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None:
+        return None
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def is_available(name):
+    """Whether a module can be imported, without importing it."""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def has_display():
+    """
+    Whether plots can be shown on a screen.
+
+    Returns:
+        bool: False on Linux and other Unix systems with no X11 or Wayland
+        display (servers, CI, ssh sessions); True on Windows and macOS
+    """
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def load_pyplot(show=True):
+    """
+    Import matplotlib.pyplot, picking a backend that works here.
+
+    The file-only Agg backend is used when no plot will be shown, or when
+    there is no display to show it on, unless MPLBACKEND names a backend.
+    The backend is picked once, by the first call.
+
+    Args:
+        show (bool): Whether the caller wants to show plots on screen
+
+    Returns:
+        module: matplotlib.pyplot
+    """
+    if "matplotlib.pyplot" not in sys.modules and not os.environ.get("MPLBACKEND"):
+        import matplotlib
+        if not show or not has_display():
+            matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
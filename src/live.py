@@ -0,0 +1,308 @@
+"""
+Live Experiment Results
+CS101 Fall 2025 - Activity 05
+
+This module shows the results of a sweep while it is still running. The
+sweep runs in a separate process, which sends an ExperimentEvent (see
+events.py) over a pipe after every timing sample and every cell. This
+process hands each event to a set of asyncio consumers that keep the report,
+the results file and the plot up to date.
+
+Measuring happens in the other process, so the consumers never share an
+interpreter (or its GIL) with the timed code. The measuring process sends
+its events itself, between samples, so it needs no extra threads either.
+
+Built-in consumers:
+
+    LiveReport       prints each cell, with its doubling ratio, as it finishes
+    LiveResultsFile  appends each cell to the results file as it finishes
+    LivePlot         redraws the performance plot every few seconds
+
+A consumer is any object with an async handle(event) method and, optionally,
+an async close() method that is called when the sweep ends.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+
+from checkpoints import CellCheckpoints
+from events import CELL, RUN_FAILED, RUN_FINISHED, RUN_STARTED, ExperimentEvent
+from registry import get_algorithm
+from timer import (
+    PLOTTING_AVAILABLE, ExperimentResults, _describe_metrics, build_experiment_plan,
+    create_performance_plot, run_custom_experiments
+)
+
+
+def _sweep_worker(connection, sizes, algorithm_choice, checkpoint_path, resume, run_options):
+    """Run a whole sweep in a child process, sending every event over the connection."""
+    # The parent's consumers show the progress, so the runner's own output is dropped
+    sys.stdout = open(os.devnull, "w")
+    checkpoints = None
+    try:
+        plan = build_experiment_plan(sizes, algorithm_choice, run_options.get("distributions"))
+        connection.send(ExperimentEvent(RUN_STARTED,
+                                        value=sum(len(cell_sizes) for _, cell_sizes in plan)))
+        if checkpoint_path is not None:
+            checkpoints = CellCheckpoints(checkpoint_path, resume=resume)
+        results = run_custom_experiments(sizes, algorithm_choice, checkpoints=checkpoints,
+                                         on_event=connection.send, **run_options)
+        connection.send(ExperimentEvent(RUN_FINISHED, results=results))
+    except KeyboardInterrupt:
+        pass  # The parent is interrupted as well and reports it
+    except Exception as e:
+        try:
+            connection.send(ExperimentEvent(RUN_FAILED, error=f"{type(e).__name__}: {e}"))
+        except OSError:
+            pass  # The parent has stopped listening
+    finally:
+        if checkpoints is not None:
+            checkpoints.close()
+        connection.close()
+
+
+class _SweepProcess:
+    """A sweep running in a child process, and the pipe its events arrive on."""
+
+    def __init__(self, sizes, algorithm_choice, checkpoint_path, resume, run_options):
+        self.receiver, sender = multiprocessing.Pipe(duplex=False)
+        # Not a daemon, so it can start worker processes of its own (--workers, --budget)
+        self.worker = multiprocessing.Process(target=_sweep_worker,
+                                              args=(sender, sizes, algorithm_choice,
+                                                    checkpoint_path, resume, run_options))
+        self.worker.start()
+        sender.close()
+        self.finished = False
+
+    def receive(self, timeout=None):
+        """Wait for the next event; returns None if none arrived within timeout seconds."""
+        if not self.receiver.poll(timeout):
+            return None
+        try:
+            event = self.receiver.recv()
+        except EOFError:
+            self.worker.join()
+            event = ExperimentEvent(RUN_FAILED,
+                                    error=f"measuring process exited with code {self.worker.exitcode}")
+        if event.kind in (RUN_FINISHED, RUN_FAILED):
+            self.finished = True
+        return event
+
+    def stop(self):
+        """Stop the sweep if it is still running, and close the pipe."""
+        if self.worker.is_alive():
+            self.worker.terminate()
+        self.worker.join()
+        self.receiver.close()
+
+
+def iter_experiment_events(sizes, algorithm_choice, checkpoint_path=None, resume=False,
+                           **run_options):
+    """
+    Run a sweep in a separate process and yield its events as they happen.
+
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        checkpoint_path (str): File to checkpoint cells to (None for no checkpoints)
+        resume (bool): Reuse cells already in the checkpoint file
+        **run_options: Other options for timer.run_custom_experiments, such as
+            workers, trial_policy, budget, memory, profilers or distributions
+
+    Yields:
+        ExperimentEvent: Every event of the sweep, ending with run_finished or run_failed
+    """
+    sweep = _SweepProcess(sizes, algorithm_choice, checkpoint_path, resume, run_options)
+    try:
+        while not sweep.finished:
+            yield sweep.receive()
+    finally:
+        sweep.stop()
+
+
+async def stream_experiment_events(sizes, algorithm_choice, checkpoint_path=None, resume=False,
+                                   **run_options):
+    """
+    Asynchronous version of iter_experiment_events, for use with async for.
+
+    Events are waited for in a thread, so the event loop stays free to run the
+    consumers while the sweep is measuring.
+    """
+    loop = asyncio.get_running_loop()
+    sweep = _SweepProcess(sizes, algorithm_choice, checkpoint_path, resume, run_options)
+    try:
+        while not sweep.finished:
+            # Wait in short slices so a cancelled stream stops promptly
+            event = await loop.run_in_executor(None, sweep.receive, 0.25)
+            if event is not None:
+                yield event
+    finally:
+        sweep.stop()
+
+
+def _results_from_cells(cells):
+    """Build the ExperimentResults of one algorithm, in size order, from its cell events."""
+    first = cells[0]
+    spec = get_algorithm(first.algorithm)
+    results = ExperimentResults(first.algorithm,
+                                batch_size=spec.params.get("batch_size") if spec else None,
+                                distribution=first.distribution)
+    for event in sorted(cells, key=lambda event: event.size):
+        results.add_result(event.size, event.value, event.timing, extrapolated=event.extrapolated)
+    return results
+
+
+class LiveReport:
+    """Print every cell as soon as it finishes, with its doubling ratio so far."""
+
+    def __init__(self, file=None):
+        """
+        Args:
+            file: Stream to print to (defaults to standard output)
+        """
+        self.file = file
+        self.cells = {}  # Cell events so far, by algorithm label
+        self.total = None
+        self.finished = 0
+        self.resumed = 0
+        self.measured = 0
+
+    async def handle(self, event):
+        if event.kind == RUN_STARTED:
+            self.total = event.value
+            print(f"Measuring {self.total} experiment cells in a separate process...",
+                  file=self.file)
+        elif event.kind == CELL:
+            self.finished += 1
+            if event.resumed:
+                self.resumed += 1
+            elif not event.extrapolated:
+                self.measured += 1
+
+            cells = self.cells.setdefault(event.label, [])
+            cells.append(event)
+            results = _results_from_cells(cells)
+            ratio = results.ratios[results.sizes.index(event.size)]
+
+            line = f"  [{self.finished}/{self.total}] {event.label} size {event.size}: "
+            line += ("~" if event.extrapolated else "") + results.format_value(event.value)
+            if ratio is not None:
+                line += f", ratio {ratio:.2f}"
+            if event.timing is not None:
+                line += _describe_metrics(event.timing)
+            if event.resumed:
+                line += " (resumed)"
+            elif event.extrapolated:
+                line += " (extrapolated)"
+            print(line, file=self.file, flush=True)
+
+
+class LiveResultsFile:
+    """Append every cell to a results file the moment it finishes."""
+
+    def __init__(self, filename="experiment_results.txt"):
+        """
+        Args:
+            filename (str): Results file; it is started afresh
+        """
+        self.filename = filename
+        with open(filename, "w") as f:
+            f.write("Algorithm Performance Analysis Results (live, in order of completion)\n")
+            f.write("="*50 + "\n\n")
+            f.write("Algorithm\tSize\tTime (s)\tNote\n")
+
+    async def handle(self, event):
+        if event.kind != CELL:
+            return
+        note = "(extrapolated)" if event.extrapolated else "(resumed)" if event.resumed else ""
+        with open(self.filename, "a") as f:
+            f.write(f"{event.label}\t{event.size}\t{event.value:.6f}\t{note}\n")
+
+
+class LivePlot:
+    """Redraw the performance plot from the cells so far, at most once per interval."""
+
+    def __init__(self, plot_filename="algorithm_performance_plot.png", interval=5.0):
+        """
+        Args:
+            plot_filename (str): File the plot is saved to
+            interval (float): Minimum seconds between redraws
+        """
+        self.plot_filename = plot_filename
+        self.interval = interval
+        self.cells = {}  # Cell events so far, by algorithm label
+        self.last_drawn = None
+        self.drawing = None
+
+    async def handle(self, event):
+        if event.kind != CELL or not PLOTTING_AVAILABLE:
+            return
+        self.cells.setdefault(event.label, []).append(event)
+        if self.drawing is not None and not self.drawing.done():
+            return
+        now = time.monotonic()
+        if self.last_drawn is not None and now - self.last_drawn < self.interval:
+            return
+
+        self.last_drawn = now
+        results = [_results_from_cells(cells) for cells in self.cells.values()]
+        # Drawing takes a while, so it runs in a thread and never holds up other consumers
+        self.drawing = asyncio.ensure_future(
+            asyncio.to_thread(create_performance_plot, results, self.plot_filename, False))
+
+    async def close(self):
+        """Wait for a redraw that is still running."""
+        if self.drawing is not None:
+            await self.drawing
+
+
+async def consume_experiment_events(sizes, algorithm_choice, consumers, **options):
+    """
+    Run a sweep in a separate process, handing every event to every consumer.
+
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        consumers (list): Objects with an async handle(event) method
+        **options: Options for iter_experiment_events
+
+    Returns:
+        list: List of ExperimentResults objects
+
+    Raises:
+        RuntimeError: If the sweep failed
+    """
+    results = None
+    events = stream_experiment_events(sizes, algorithm_choice, **options)
+    try:
+        async for event in events:
+            await asyncio.gather(*(consumer.handle(event) for consumer in consumers))
+            if event.kind == RUN_FINISHED:
+                results = event.results
+            elif event.kind == RUN_FAILED:
+                raise RuntimeError(event.error)
+    finally:
+        await events.aclose()
+        for consumer in consumers:
+            if hasattr(consumer, "close"):
+                await consumer.close()
+    return results
+
+
+def run_live(sizes, algorithm_choice, consumers, **options):
+    """
+    Run a sweep with live consumers and wait for it to finish.
+
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        consumers (list): Objects with an async handle(event) method
+        **options: Options for iter_experiment_events
+
+    Returns:
+        list: List of ExperimentResults objects
+    """
+    return asyncio.run(consume_experiment_events(sizes, algorithm_choice, consumers, **options))
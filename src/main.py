@@ -6,8 +6,63 @@ This program runs doubling experiments to analyze algorithm performance.
 This is the complete working version with all functionality implemented.
 """
 
+import argparse
+import shlex
+import sys
+import time
+
+from baselines import (
+    BASELINE_MIN_TRIALS, DEFAULT_BASELINE_DIR, compare_to_baseline, load_baseline,
+    print_regression_report, save_baseline
+)
+from checkpoints import DEFAULT_CHECKPOINT_DB, CellCheckpoints
+from counting import run_counting_experiments
+from datasets import GENERATORS, get_generator
+from distributed import (
+    DEFAULT_AUTHKEY, HEARTBEAT_INTERVAL, generate_authkey, parse_address, resolve_authkey,
+    run_worker
+)
+from hygiene import StabilityCheck, describe_stability, pin_to_cpu
+from profiling import DEFAULT_PROFILE_DIR, PROFILERS, make_profilers
+from registry import MENU_CHOICES
+from results_store import DEFAULT_DATABASE, ResultsStore
 from timer import run_custom_experiments, print_summary_report, save_results_to_file, create_performance_plot
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Named size presets, matching the interactive menu
+SIZE_PRESETS = {
+    "quick": [500, 1000, 2000, 4000],
+    "medium": [1000, 2000, 4000, 8000, 16000],
+    "comprehensive": [1000, 2000, 4000, 8000, 16000, 32000],
+}
+
+# Options that set the timing policy, with the trial_policy key each one sets
+TRIAL_OPTIONS = [("trials", "min_trials"), ("max_trials", "max_trials"),
+                 ("target_ci", "target_ci"), ("time_budget", "time_budget")]
+
+# Readable names accepted for --algorithms besides the menu numbers
+ALGORITHM_ALIASES = {
+    "search": "1",
+    "sort": "2",
+    "operations": "3",
+    "all": "4",
+    "batch": "5",
+    "index": "6",
+    "stream": "7",
+}
+
 
 def get_experiment_sizes():
     """
@@ -31,11 +86,11 @@ def get_experiment_sizes():
         choice = input("\nEnter choice (1-4): ").strip()
         
         if choice == "1":
-            return [500, 1000, 2000, 4000]
+            return SIZE_PRESETS["quick"]
         elif choice == "2":
-            return [1000, 2000, 4000, 8000, 16000]
+            return SIZE_PRESETS["medium"]
         elif choice == "3":
-            return [1000, 2000, 4000, 8000, 16000, 32000]
+            return SIZE_PRESETS["comprehensive"]
         elif choice == "4":
             return get_custom_sizes()
         else:
@@ -48,7 +103,7 @@ def get_custom_sizes():
     """
     print("\nEnter your custom sizes:")
     print("• Use at least 3 sizes for meaningful patterns")
-    print("• Keep sizes reasonable (100-100000)")
+    print("• Use sizes of at least 100 (large sizes can take a long time)")
     print("• Separate with commas (e.g., 1000,2000,4000)")
     
     while True:
@@ -60,8 +115,8 @@ def get_custom_sizes():
             if len(sizes) < 3:
                 print("Please enter at least 3 sizes")
                 continue
-            if any(s < 100 or s > 100000 for s in sizes):
-                print("Please keep sizes between 100 and 100000")
+            if any(s < 100 for s in sizes):
+                print("Please use sizes of at least 100")
                 continue
             
             # Sort sizes
@@ -78,21 +133,22 @@ def get_algorithms_to_test():
     Let user choose which algorithms to test.
     """
     print("\nWhich algorithms would you like to test?")
-    print("1. Search algorithms only (Linear Search, Binary Search)")
-    print("2. Sorting algorithms only (Bubble Sort, Selection Sort)")
-    print("3. List operations only (Sum, Max, Min)")
-    print("4. All algorithms (comprehensive)")
+    for key, (label, _) in MENU_CHOICES.items():
+        print(f"{key}. {label}")
     
     while True:
-        choice = input("\nEnter choice (1-4): ").strip()
-        if choice in ['1', '2', '3', '4']:
+        choice = input(f"\nEnter choice (1-{len(MENU_CHOICES)}): ").strip()
+        if choice in MENU_CHOICES:
             return choice
-        print("Please enter 1, 2, 3, or 4")
+        print(f"Please enter a number from 1 to {len(MENU_CHOICES)}")
 
 
-def main():
+def run_interactive():
     """
-    Main function to run all performance experiments.
+    Run the experiments through the interactive menus.
+    
+    Returns:
+        int: Exit status (0 on success)
     """
     print("Welcome to Algorithm Performance Analysis!")
     print("This program will test various algorithms with increasing input sizes.")
@@ -108,15 +164,24 @@ def main():
     # Give user a chance to cancel
     input("\nPress Enter to start experiments (or Ctrl+C to cancel)...")
     
+    checkpoints = CellCheckpoints()
     try:
-        # Run experiments with user's choices
-        results = run_custom_experiments(sizes, algorithm_choice)
+        # Run experiments with user's choices, saving each cell as it finishes
+        started = time.time()
+        stability = StabilityCheck().start()
+        results = run_custom_experiments(sizes, algorithm_choice, checkpoints=checkpoints)
+        stability_report = stability.finish()
         
-        # Print comprehensive summary
+        # Print comprehensive summary, and how steady the machine was while measuring
         print_summary_report(results)
+        print(describe_stability(stability_report))
         
-        # Save results to file
+        # Save results to file, and add the run to the history database
         save_results_to_file(results)
+        with ResultsStore() as store:
+            run_id = store.record_run(results, algorithm_choice, sizes, started=started,
+                                      stability=stability_report)
+        print(f"Run {run_id} recorded in {DEFAULT_DATABASE}")
         
         # Create and show plot
         create_performance_plot(results)
@@ -130,13 +195,495 @@ def main():
         print("3. Complete the reflection questions in writing/reflection.md")
         print("4. Think about what these patterns mean for real-world programming")
         print("\nGreat work exploring algorithm performance!")
+        return 0
         
     except KeyboardInterrupt:
         print("\n\nExperiment cancelled by user.")
+        _print_resume_hint(checkpoints.saved, checkpoints.path, sizes, algorithm_choice)
+        return 130
     except Exception as e:
         print(f"\n\nError during experiment: {e}")
         print("Make sure all algorithms are implemented correctly in algorithms.py")
+        _print_resume_hint(checkpoints.saved, checkpoints.path, sizes, algorithm_choice)
+        return 1
+    finally:
+        checkpoints.close()
+
+
+def _print_resume_hint(saved, path, sizes, algorithm_choice, file=None, trial_policy=None,
+                       distributions=None):
+    """
+    Tell the user how to pick up an interrupted sweep where it stopped.
+    
+    Saved cells only match a run with the same distributions and timing
+    policy, so the suggested command repeats them, along with a checkpoint
+    file other than the default.
+    """
+    if not saved:
+        return
+    command = ["activity05", "--sizes", ",".join(map(str, sizes)), "--algorithms", algorithm_choice]
+    if distributions:
+        command += ["--distributions", ",".join(distributions)]
+    for key, policy_key in TRIAL_OPTIONS:
+        if trial_policy and trial_policy.get(policy_key) is not None:
+            command += ["--" + key.replace("_", "-"), str(trial_policy[policy_key])]
+    if path != DEFAULT_CHECKPOINT_DB:
+        command += ["--checkpoints", path]
+    command.append("--resume")
+    print(f"{saved} measured cells were saved to {path}. To continue, run:", file=file)
+    print("  " + " ".join(shlex.quote(part) for part in command), file=file)
+
+
+def build_argument_parser():
+    """
+    Build the command-line parser for headless runs.
+    
+    Returns:
+        argparse.ArgumentParser: The parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="activity05",
+        description="Run doubling experiments without prompts. "
+                    "Run without arguments for the interactive menus.")
+    parser.add_argument("--config", help="TOML or YAML file with any of the options below")
+    parser.add_argument("--sizes", help="Comma-separated input sizes, e.g. 1000,2000,4000")
+    parser.add_argument("--preset", choices=sorted(SIZE_PRESETS), help="Named set of sizes")
+    parser.add_argument("--algorithms",
+                        help="Menu number (1-%d) or one of: %s" % (len(MENU_CHOICES),
+                                                                  ", ".join(ALGORITHM_ALIASES)))
+    parser.add_argument("--distributions", metavar="NAMES",
+                        help=f"Run every algorithm that takes random data on each of these inputs "
+                             f"(comma-separated: {', '.join(GENERATORS)}; e.g. nearly_sorted:50 "
+                             f"for 50 swaps)")
+    parser.add_argument("--trials", type=int, help="Minimum number of timing trials per cell")
+    parser.add_argument("--max-trials", type=int, help="Maximum number of timing trials per cell")
+    parser.add_argument("--target-ci", type=float,
+                        help="Stop adding trials once the 95%% confidence interval is this "
+                             "fraction of the mean")
+    parser.add_argument("--time-budget", type=float, help="Seconds of measuring per cell")
+    parser.add_argument("--workers", type=int, help="Number of worker processes")
+    parser.add_argument("--budget", type=float,
+                        help="Total seconds for the sweep; cells that will not fit are extrapolated")
+    parser.add_argument("--cell-timeout", type=float,
+                        help="Kill any single cell that runs longer than this many seconds")
+    parser.add_argument("--output", help="Results file (default experiment_results.txt)")
+    parser.add_argument("--plot-file", help="Plot image file (default algorithm_performance_plot.png)")
+    parser.add_argument("--plot", dest="plot", action="store_true", default=None,
+                        help="Save a performance plot (the default)")
+    parser.add_argument("--no-plot", dest="plot", action="store_false", help="Skip the plot")
+    parser.add_argument("--save-baseline", metavar="NAME",
+                        help="Save the raw timings of this run as a named baseline")
+    parser.add_argument("--add-to-baseline", metavar="NAME",
+                        help="Add this run to a saved baseline as another repeat, so comparisons "
+                             "measure the run-to-run noise (save it 3 times in all)")
+    parser.add_argument("--compare-baseline", metavar="NAME",
+                        help="Check this run against a saved baseline; exit with status 3 "
+                             "on a regression")
+    parser.add_argument("--baseline-dir",
+                        help=f"Directory for saved baselines (default {DEFAULT_BASELINE_DIR})")
+    parser.add_argument("--database",
+                        help=f"SQLite database the run is appended to (default {DEFAULT_DATABASE})")
+    parser.add_argument("--no-database", dest="record", action="store_false", default=None,
+                        help="Do not record the run in the database")
+    parser.add_argument("--label", help="Name stored with the run, such as a git commit")
+    parser.add_argument("--export-jsonl", metavar="PATH",
+                        help="After the run, export every recorded cell with its samples as JSON Lines")
+    parser.add_argument("--export-csv", metavar="PATH",
+                        help="After the run, export every recorded cell as CSV")
+    parser.add_argument("--memory", action="store_true", default=None,
+                        help="Also measure peak memory, live blocks and RSS growth of every cell")
+    parser.add_argument("--profile", metavar="NAMES",
+                        help=f"Profile every cell on separate untimed calls with these profilers "
+                             f"(comma-separated: {', '.join(PROFILERS)})")
+    parser.add_argument("--profile-dir",
+                        help=f"Directory profiles are written to (default {DEFAULT_PROFILE_DIR})")
+    parser.add_argument("--resume", action="store_true", default=None,
+                        help="Reuse cells already measured by an earlier run of unchanged code")
+    parser.add_argument("--checkpoints",
+                        help=f"File measured cells are saved to (default {DEFAULT_CHECKPOINT_DB})")
+    parser.add_argument("--no-checkpoints", dest="checkpoint", action="store_false", default=None,
+                        help="Do not save cells as they finish")
+    parser.add_argument("--count-operations", action="store_true", default=None,
+                        help="Count comparisons, writes and reads instead of timing "
+                             "(exact and machine independent; list algorithms only)")
+    parser.add_argument("--coordinator", metavar="HOST:PORT",
+                        help="Listen here and hand the cells out to workers on other hosts "
+                             "(uses ACTIVITY05_AUTHKEY, or prints a new key for the workers)")
+    parser.add_argument("--worker", metavar="HOST:PORT",
+                        help="Measure cells for the coordinator at this address, then exit "
+                             "(needs ACTIVITY05_AUTHKEY)")
+    parser.add_argument("--worker-timeout", type=float,
+                        help="Reassign the cells of a worker that sends nothing, not even a "
+                             f"heartbeat (every {HEARTBEAT_INTERVAL:g} s), for this many seconds")
+    parser.add_argument("--live", action="store_true", default=None,
+                        help="Measure in a separate process and update the report, results file "
+                             "and plot as each cell finishes")
+    parser.add_argument("--pin-cpu", metavar="CPU",
+                        help="Run the timing on this CPU only ('auto' picks the last one)")
+    parser.add_argument("--interleave", action="store_true", default=None,
+                        help="Take the trials of all cells in a random, interleaved order "
+                             "so drift spreads evenly")
+    return parser
+
+
+def load_config(path):
+    """
+    Read run options from a TOML or YAML config file.
+    
+    Keys use the long option names with underscores, e.g. sizes, algorithms,
+    distributions, trials, max_trials, target_ci, time_budget, workers, budget, cell_timeout,
+    output, plot, plot_file, save_baseline, add_to_baseline, compare_baseline, baseline_dir,
+    database, record, label, export_jsonl, export_csv, memory, profile,
+    profile_dir, resume, checkpoints, checkpoint, count_operations, live,
+    coordinator, worker, worker_timeout, pin_cpu, interleave.
+    
+    Args:
+        path (str): Config file ending in .toml, .yaml or .yml
+        
+    Returns:
+        dict: The options found in the file
+    """
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("Reading TOML on Python < 3.11 needs tomli: pip install tomli")
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+    elif path.endswith((".yaml", ".yml")):
+        if yaml is None:
+            raise ValueError("Reading YAML needs PyYAML: pip install pyyaml")
+        with open(path) as f:
+            config = yaml.safe_load(f) or {}
+    else:
+        raise ValueError(f"Config file must end in .toml, .yaml or .yml: {path}")
+    
+    if not isinstance(config, dict):
+        raise ValueError(f"Config file must contain a table of options: {path}")
+    return {key.replace("-", "_"): value for key, value in config.items()}
+
+
+def resolve_options(args):
+    """
+    Combine config file values and command-line flags (flags win) into run options.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line flags
+        
+    Returns:
+        dict: Validated options with sizes, algorithm_choice, distributions, trial_policy,
+        workers, budget, cell_timeout, output, plot, plot_file, save_baseline,
+        add_to_baseline, compare_baseline, baseline_dir, database, record, label, export_jsonl,
+        export_csv, memory, profilers, profile_dir, resume, checkpoints, checkpoint,
+        count_operations, live, coordinator, worker, worker_timeout, pin_cpu and interleave
+    """
+    options = load_config(args.config) if args.config else {}
+    for key, value in vars(args).items():
+        if key != "config" and value is not None:
+            options[key] = value
+    
+    # Sizes come from an explicit list or a preset
+    sizes = options.get("sizes")
+    if sizes is None:
+        sizes = SIZE_PRESETS[options.get("preset", "quick")]
+    elif isinstance(sizes, str):
+        try:
+            sizes = [int(s.strip()) for s in sizes.split(",")]
+        except ValueError:
+            raise ValueError(f"Sizes must be whole numbers separated by commas: {sizes}")
+    sizes = sorted(int(s) for s in sizes)
+    if not sizes or any(s < 1 for s in sizes):
+        raise ValueError("Please give at least one size, all of them positive")
+    
+    choice = str(options.get("algorithms", "4")).strip().lower()
+    choice = ALGORITHM_ALIASES.get(choice, choice)
+    if choice not in MENU_CHOICES:
+        raise ValueError(f"Unknown algorithm selection: {options.get('algorithms')}")
+    
+    distributions = options.get("distributions")
+    if isinstance(distributions, str):
+        distributions = [d.strip() for d in distributions.split(",") if d.strip()]
+    for distribution in distributions or []:
+        get_generator(distribution)  # Raises ValueError for an unknown distribution
+    
+    trial_policy = {}
+    for key, policy_key in TRIAL_OPTIONS:
+        if options.get(key) is not None:
+            trial_policy[policy_key] = options[key]
+    
+    # Baseline comparisons need enough trials per cell to reach significance
+    baseline_run = (options.get("save_baseline") or options.get("add_to_baseline")
+                    or options.get("compare_baseline"))
+    profile_dir = options.get("profile_dir", DEFAULT_PROFILE_DIR)
+    count_operations = bool(options.get("count_operations", False))
+    if count_operations and baseline_run:
+        raise ValueError("Baselines hold timings, so they cannot be used with --count-operations")
+    if count_operations and options.get("profile"):
+        raise ValueError("Profiling runs alongside timing, so it cannot be used with --count-operations")
+    live = bool(options.get("live", False))
+    if count_operations and live:
+        raise ValueError("Counting finishes too quickly to need --live; use one or the other")
+    coordinator = parse_address(options["coordinator"]) if options.get("coordinator") else None
+    worker = parse_address(options["worker"]) if options.get("worker") else None
+    worker_timeout = options.get("worker_timeout")
+    if worker_timeout is not None and worker_timeout <= HEARTBEAT_INTERVAL:
+        raise ValueError(f"--worker-timeout must be longer than the {HEARTBEAT_INTERVAL:g} s "
+                         "between a worker's heartbeats")
+    if coordinator and worker:
+        raise ValueError("Run the coordinator and each worker as separate commands")
+    if worker:
+        resolve_authkey()  # Raises ValueError if ACTIVITY05_AUTHKEY is not set
+    if coordinator and (count_operations or options.get("profile")):
+        raise ValueError("--coordinator only hands out timing, so it cannot be used with "
+                         "--count-operations or --profile")
+    if coordinator and (options.get("budget") is not None or options.get("cell_timeout") is not None
+                        or int(options.get("workers", 1)) > 1):
+        raise ValueError("--coordinator already spreads the cells; start more workers instead "
+                         "of using --workers, --budget or --cell-timeout")
+    pin_cpu = options.get("pin_cpu")
+    if pin_cpu is True or str(pin_cpu).lower() == "auto":
+        pin_cpu = "auto"
+    elif pin_cpu is not None and pin_cpu is not False:
+        try:
+            pin_cpu = int(pin_cpu)
+        except ValueError:
+            raise ValueError(f"--pin-cpu takes a CPU number or 'auto': {pin_cpu}")
+    else:
+        pin_cpu = None
+    interleave = bool(options.get("interleave", False))
+    # Interleaving needs every cell timed by this one process
+    spread = (int(options.get("workers", 1)) > 1 or coordinator
+              or options.get("budget") is not None or options.get("cell_timeout") is not None)
+    if pin_cpu is not None and (int(options.get("workers", 1)) > 1 or coordinator):
+        raise ValueError("--pin-cpu keeps the timing on one CPU, so it cannot be used with "
+                         "--workers or --coordinator")
+    if interleave and (spread or count_operations):
+        raise ValueError("--interleave takes every trial in one process, so it cannot be used with "
+                         "--workers, --coordinator, --budget, --cell-timeout or --count-operations")
+    if baseline_run and "min_trials" not in trial_policy:
+        trial_policy["min_trials"] = BASELINE_MIN_TRIALS
+    
+    return {
+        "sizes": sizes,
+        "algorithm_choice": choice,
+        "distributions": distributions or None,
+        "trial_policy": trial_policy or None,
+        "workers": int(options.get("workers", 1)),
+        "budget": options.get("budget"),
+        "cell_timeout": options.get("cell_timeout"),
+        "output": options.get("output", "experiment_results.txt"),
+        "plot": bool(options.get("plot", True)),
+        "plot_file": options.get("plot_file", "algorithm_performance_plot.png"),
+        "save_baseline": options.get("save_baseline"),
+        "add_to_baseline": options.get("add_to_baseline"),
+        "compare_baseline": options.get("compare_baseline"),
+        "baseline_dir": options.get("baseline_dir", DEFAULT_BASELINE_DIR),
+        "database": options.get("database", DEFAULT_DATABASE),
+        "record": bool(options.get("record", True)),
+        "label": options.get("label"),
+        "export_jsonl": options.get("export_jsonl"),
+        "export_csv": options.get("export_csv"),
+        "memory": bool(options.get("memory", False)),
+        "profilers": make_profilers(options.get("profile") or [], profile_dir),
+        "profile_dir": profile_dir,
+        "resume": bool(options.get("resume", False)),
+        "checkpoints": options.get("checkpoints", DEFAULT_CHECKPOINT_DB),
+        "checkpoint": bool(options.get("checkpoint", True)),
+        "count_operations": count_operations,
+        "live": live,
+        "coordinator": coordinator,
+        "worker": worker,
+        "worker_timeout": options.get("worker_timeout"),
+        "pin_cpu": pin_cpu,
+        "interleave": interleave,
+    }
+
+
+def run_headless(argv):
+    """
+    Run the experiments from command-line flags and/or a config file, without prompts.
+    
+    Args:
+        argv (list): Command-line arguments (without the program name)
+        
+    Returns:
+        int: Exit status (0 on success, 1 on failure, 2 for bad options,
+        3 on a performance regression, 130 if cancelled)
+    """
+    parser = build_argument_parser()
+    args = parser.parse_args(argv)
+    try:
+        options = resolve_options(args)
+        baseline = None
+        if options["compare_baseline"]:
+            # Load the baseline first so a bad name fails before the long run
+            baseline = load_baseline(options["compare_baseline"], options["baseline_dir"])
+        if options["pin_cpu"] is not None:
+            # Processes started later (live, budgeted cells) inherit the pinning
+            cpu = pin_to_cpu(None if options["pin_cpu"] == "auto" else options["pin_cpu"])
+            print(f"Timing pinned to CPU {cpu}")
+    except (OSError, ValueError) as e:
+        print(f"activity05: {e}", file=sys.stderr)
+        return 2
+    
+    if options["worker"]:
+        try:
+            run_worker(options["worker"])
+            return 0
+        except KeyboardInterrupt:
+            print("\nWorker stopped.", file=sys.stderr)
+            return 130
+        except (OSError, ValueError) as e:
+            print(f"activity05: worker error: {e}", file=sys.stderr)
+            return 1
+    
+    authkey = None
+    if options["coordinator"] is not None and not DEFAULT_AUTHKEY:
+        # Printed here, since a live sweep runs the coordinator without output
+        authkey = generate_authkey()
+        print(f"Start every worker with ACTIVITY05_AUTHKEY={authkey}")
+    
+    checkpoints = None
+    report = None
+    counting = options["count_operations"]
+    checkpoint_path = None
+    if not counting and (options["checkpoint"] or options["resume"]):
+        checkpoint_path = options["checkpoints"]
+    if checkpoint_path is not None and not options["live"]:
+        # A live sweep runs in its own process, which opens the checkpoints itself
+        checkpoints = CellCheckpoints(checkpoint_path, resume=options["resume"])
+    
+    def print_resume_hint():
+        if checkpoints is not None:
+            _print_resume_hint(checkpoints.saved, checkpoints.path, options["sizes"],
+                               options["algorithm_choice"], sys.stderr, options["trial_policy"],
+                               options["distributions"])
+        elif report is not None and checkpoint_path is not None:
+            _print_resume_hint(report.measured, checkpoint_path, options["sizes"],
+                               options["algorithm_choice"], sys.stderr, options["trial_policy"],
+                               options["distributions"])
+    
+    # The machine is measured only where this process does the timing itself
+    stability = None
+    if not counting and options["coordinator"] is None and options["workers"] == 1:
+        stability = StabilityCheck()
+    
+    print(f"Testing sizes {options['sizes']} with algorithm selection {options['algorithm_choice']}")
+    try:
+        started = time.time()
+        if stability is not None:
+            stability.start()
+        if counting:
+            results = run_counting_experiments(options["sizes"], options["algorithm_choice"],
+                                               options["distributions"])
+        elif options["live"]:
+            # Imported here since asyncio is slow to import and only live runs need it
+            from live import LivePlot, LiveReport, LiveResultsFile, run_live
+            report = LiveReport()
+            consumers = [report, LiveResultsFile(options["output"])]
+            if options["plot"]:
+                consumers.append(LivePlot(options["plot_file"]))
+            results = run_live(options["sizes"], options["algorithm_choice"], consumers,
+                               checkpoint_path=checkpoint_path, resume=options["resume"],
+                               workers=options["workers"],
+                               trial_policy=options["trial_policy"],
+                               budget=options["budget"],
+                               cell_timeout=options["cell_timeout"],
+                               memory=options["memory"],
+                               profilers=options["profilers"],
+                               distributions=options["distributions"],
+                               coordinator=options["coordinator"],
+                               worker_timeout=options["worker_timeout"],
+                               authkey=authkey,
+                               interleave=options["interleave"])
+        else:
+            results = run_custom_experiments(options["sizes"], options["algorithm_choice"],
+                                             workers=options["workers"],
+                                             trial_policy=options["trial_policy"],
+                                             budget=options["budget"],
+                                             cell_timeout=options["cell_timeout"],
+                                             checkpoints=checkpoints,
+                                             memory=options["memory"],
+                                             profilers=options["profilers"],
+                                             distributions=options["distributions"],
+                                             coordinator=options["coordinator"],
+                                             worker_timeout=options["worker_timeout"],
+                                             authkey=authkey,
+                                             interleave=options["interleave"])
+        stability_report = stability.finish() if stability is not None else None
+        if checkpoints is not None and checkpoints.reused:
+            print(f"\nResumed {checkpoints.reused} cells from {checkpoints.path}")
+        if report is not None and report.resumed:
+            print(f"\nResumed {report.resumed} cells from {checkpoint_path}")
+        if options["profilers"]:
+            print(f"\nProfiles written to {options['profile_dir']}/")
+        print_summary_report(results)
+        if stability_report is not None:
+            print(describe_stability(stability_report))
+        
+        if not save_results_to_file(results, options["output"]):
+            return 1
+        # The results database holds timings, so counted runs are not recorded
+        if not counting and (options["record"] or options["export_jsonl"] or options["export_csv"]):
+            with ResultsStore(options["database"]) as store:
+                if options["record"]:
+                    run_id = store.record_run(results, options["algorithm_choice"], options["sizes"],
+                                              options["trial_policy"], options["label"], started,
+                                              stability=stability_report)
+                    print(f"Run {run_id} recorded in {options['database']}")
+                if options["export_jsonl"]:
+                    count = store.export_jsonl(options["export_jsonl"])
+                    print(f"Exported {count} cells to {options['export_jsonl']}")
+                if options["export_csv"]:
+                    count = store.export_csv(options["export_csv"])
+                    print(f"Exported {count} cells to {options['export_csv']}")
+        if options["plot"] and not create_performance_plot(results, options["plot_file"], show=False):
+            return 1
+        
+        if options["save_baseline"]:
+            path = save_baseline(results, options["save_baseline"], options["baseline_dir"])
+            print(f"Baseline '{options['save_baseline']}' saved to {path}")
+        if options["add_to_baseline"]:
+            path = save_baseline(results, options["add_to_baseline"], options["baseline_dir"],
+                                 add_run=True)
+            print(f"Run added to baseline '{options['add_to_baseline']}' in {path}")
+        if baseline is not None:
+            regression = compare_to_baseline(results, baseline, options["compare_baseline"])
+            print_regression_report(regression)
+            if regression.regressed:
+                return 3
+        return 0
+    
+    except KeyboardInterrupt:
+        print("\nExperiment cancelled.", file=sys.stderr)
+        print_resume_hint()
+        return 130
+    except Exception as e:
+        print(f"activity05: error during experiment: {e}", file=sys.stderr)
+        print_resume_hint()
+        return 1
+    finally:
+        if checkpoints is not None:
+            checkpoints.close()
+
+
+def main(argv=None):
+    """
+    Main function to run all performance experiments.
+    
+    With no command-line arguments the interactive menus are used; any
+    arguments switch to a headless run suitable for cron or CI.
+    
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Exit status
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        return run_interactive()
+    return run_headless(argv)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
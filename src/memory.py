@@ -0,0 +1,94 @@
+"""
+Memory Footprint Measurement
+CS101 Fall 2025 - Activity 05
+
+This module measures how much memory one call of an algorithm needs, separately
+from timing it (tracing allocations slows Python down a lot, so it would
+distort the published times). Three numbers are recorded for each cell:
+
+    peak_memory_bytes  highest memory allocated by the call (tracemalloc)
+    net_blocks         allocated blocks still alive when the call returns,
+                       including the blocks of its return value
+    rss_delta_bytes    growth of the process resident set size over the call
+
+The input is prepared (and copied, for algorithms that modify it) before the
+measurement starts, so only the algorithm's own allocations are counted.
+"""
+
+import gc
+import os
+import tracemalloc
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+from algorithms import _copy_args
+
+MEMORY_METRICS = ("peak_memory_bytes", "net_blocks", "rss_delta_bytes")
+
+
+def current_rss():
+    """
+    Get the resident set size of this process.
+
+    Returns:
+        int: Bytes of physical memory in use, or None if it cannot be read
+    """
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def measure_memory(algorithm_func, *args, copy_args=True):
+    """
+    Measure the memory used by one call of an algorithm.
+
+    Args:
+        algorithm_func: Function to measure
+        *args: Arguments to pass to the function
+        copy_args (bool): Copy list arguments first (for algorithms that modify their input)
+
+    Returns:
+        dict: 'peak_memory_bytes', 'net_blocks' and 'rss_delta_bytes' (None if
+        the resident set size cannot be read)
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if already_tracing:
+        tracemalloc.stop()
+
+    try:
+        # Resident set size is measured on an untraced call, since tracing
+        # allocates memory of its own
+        call_args = _copy_args(args) if copy_args else args
+        gc.collect()
+        rss_before = current_rss()
+        result = algorithm_func(*call_args)
+        rss_after = current_rss()
+        del result, call_args
+
+        call_args = _copy_args(args) if copy_args else args
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = algorithm_func(*call_args)
+            _, peak = tracemalloc.get_traced_memory()
+            # Only blocks allocated since tracing started are traced
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, tracemalloc.__file__)])
+        finally:
+            tracemalloc.stop()
+        del result
+    finally:
+        if already_tracing:
+            tracemalloc.start()
+
+    net_blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    rss_delta = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+    return {"peak_memory_bytes": peak, "net_blocks": net_blocks, "rss_delta_bytes": rss_delta}
@@ -0,0 +1,305 @@
+"""
+Time-Budgeted Sweep Planner
+CS101 Fall 2025 - Activity 05
+
+This module runs a custom experiment within a total wall-clock budget. Before
+each (algorithm, size) cell it predicts how long the cell will take from the
+measurements made so far; cells that would not fit in the remaining budget are
+skipped and their times are extrapolated instead of measured. Every measured
+cell runs in its own worker process with a hard timeout, so one runaway
+quadratic sort cannot stall the whole sweep. A cell that hits its timeout
+keeps the trials it finished, so only cells that could not complete a single
+trial are lost. The untimed passes (the memory footprint and profiling) never
+run past a cell's limit either.
+"""
+
+import multiprocessing
+import time
+
+from algorithms import DEFAULT_TIME_BUDGET, TimingResult, warm_up_timing
+from events import cell_event
+from memory import MEMORY_METRICS
+from registry import FAMILY_HEADINGS, get_algorithm
+from timer import (
+    ExperimentResults, build_cell_args, build_experiment_plan, complete_resumed_cell,
+    finish_cell, measure_cell, measure_cell_memory, predict_future_performance, profile_cell
+)
+
+# Share of a cell's time limit its worker may spend adding trials; the rest is
+# left for starting the process, fetching the data and the last trial. The
+# memory pass runs under tracemalloc, many times slower than a timed call, so
+# with memory the trials get a smaller share
+BUDGET_SHARE = 0.8
+MEMORY_BUDGET_SHARE = 0.4
+
+
+def _cell_worker(connection, algorithm_name, distribution, size, trial_policy, memory):
+    """
+    Measure one cell in a child process.
+
+    Sends each trial, then the TimingResult, then (with memory) the memory
+    metrics, so a cell killed during the memory pass still keeps all its
+    trials. Any error is sent instead.
+    """
+    def on_trial(index, seconds):
+        connection.send(("trial", seconds))
+
+    try:
+        spec = get_algorithm(algorithm_name, distribution)
+        connection.send(("timing", measure_cell(spec, size, trial_policy, on_trial=on_trial)))
+        if memory:
+            connection.send(("memory", measure_cell_memory(spec, size)))
+        connection.send(("ok", None))
+    except Exception as e:
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def run_cell_with_timeout(spec, size, timeout, trial_policy=None, memory=False):
+    """
+    Measure one cell in a separate process, killing it if it runs too long.
+
+    Args:
+        spec (AlgorithmSpec): The registered algorithm to time
+        size (int): Input size to test
+        timeout (float): Seconds to wait before the worker is killed (None waits forever)
+        trial_policy (dict): Overrides for the timing settings (see timer.measure_cell)
+        memory (bool): Also measure the memory footprint of the cell
+
+    Returns:
+        TimingResult: Timing statistics; if the cell timed out, the trials it
+        finished (all of them if only the memory pass was cut short) with the
+        'timed_out' metric set, or None if it finished none
+
+    Raises:
+        RuntimeError: If the algorithm raised an error in the worker
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    worker = multiprocessing.Process(target=_cell_worker,
+                                     args=(sender, spec.name, spec.distribution, size,
+                                           trial_policy, memory),
+                                     daemon=True)
+    worker.start()
+    sender.close()
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    samples = []
+    timing = None
+    try:
+        while True:
+            wait = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not receiver.poll(wait):
+                status, payload = "timeout", None
+                break
+            status, payload = receiver.recv()
+            if status == "trial":
+                samples.append(payload)
+            elif status == "timing":
+                timing = payload
+            elif status == "memory":
+                timing.metrics.update(payload)
+            else:
+                break
+    except EOFError:
+        status, payload = "error", f"worker exited with code {worker.exitcode}"
+    finally:
+        if worker.is_alive():
+            worker.terminate()
+        worker.join()
+        receiver.close()
+
+    if status == "error":
+        raise RuntimeError(f"{spec.name} at size {size} failed: {payload}")
+    if status == "timeout":
+        if timing is None:
+            if not samples:
+                return None
+            # Keep the finished trials; the calls per trial and overhead were not reported
+            timing = TimingResult(samples, None, None)
+        timing.metrics["timed_out"] = True
+    return timing
+
+
+def predict_cell_time(spec, results, size):
+    """
+    Predict the time per call of a cell from the sizes already measured.
+
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        results (ExperimentResults): Measured (not extrapolated) results so far
+        size (int): Size to predict
+
+    Returns:
+        float: Predicted seconds per call, or None with no measurements yet
+    """
+    if len(results.times) >= 2:
+        return predict_future_performance(results, size)
+    if len(results.times) == 1:
+        # Scale the single measurement by the complexity the algorithm declares
+        last_size = results.sizes[-1]
+        return results.times[-1] * spec.estimated_cost(size) / spec.estimated_cost(last_size)
+    return None
+
+
+def predict_cell_cost(spec, per_call, trial_policy=None, startup=0.0):
+    """
+    Predict the wall-clock cost of measuring a cell from its time per call.
+
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        per_call (float): Predicted seconds per call
+        trial_policy (dict): Timing settings the cell's worker will use
+        startup (float): Seconds needed to start the worker process
+
+    Returns:
+        float: Predicted seconds needed to measure the cell
+    """
+    policy = trial_policy or {}
+    min_trials = policy.get("min_trials", spec.min_trials)
+    # The calibration run counts as one more call on top of the minimum trials
+    sampling = per_call * (min_trials + 1)
+    # Trials continue until the result is stable, which may use the whole time budget
+    sampling = max(sampling, policy.get("time_budget", DEFAULT_TIME_BUDGET))
+    return startup + sampling
+
+
+def measure_process_startup():
+    """Time starting and joining an empty process, the fixed cost of every measured cell."""
+    started = time.perf_counter()
+    worker = multiprocessing.Process(target=int, daemon=True)  # int() returns straight away
+    worker.start()
+    worker.join()
+    return time.perf_counter() - started
+
+
+def run_budgeted_experiments(sizes, algorithm_choice, total_budget=None, cell_timeout=None,
+                             trial_policy=None, checkpoints=None, memory=False, profilers=None,
+                             distributions=None, on_event=None):
+    """
+    Run experiments within a total time budget, extrapolating cells that would not fit.
+
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        total_budget (float): Seconds available for the whole sweep (None for no limit)
+        cell_timeout (float): Hard limit in seconds for any single cell (None for no limit)
+        trial_policy (dict): Overrides for the timing settings (see timer.measure_cell)
+        checkpoints (CellCheckpoints): Saves each measured cell and supplies resumed ones
+        memory (bool): Also measure the memory footprint of every measured cell
+        profilers (list): Profiling hooks to run on every measured cell (see profiling.py)
+        distributions (list): Input distributions for the size x distribution grid
+            (see timer.build_experiment_plan)
+        on_event: Called with an ExperimentEvent for every measured, resumed or
+            extrapolated cell (see events.py)
+
+    Returns:
+        list: List of ExperimentResults objects, with skipped cells marked as extrapolated
+    """
+    print("=== Time-Budgeted Algorithm Performance Analysis ===")
+    if total_budget is not None:
+        print(f"Total budget: {total_budget:.1f} seconds")
+    print("\nWarming up timing system...")
+    warm_up_timing()
+    startup = measure_process_startup()
+
+    started = time.perf_counter()
+    all_results = []
+    current_family = None
+
+    for spec, cell_sizes in build_experiment_plan(sizes, algorithm_choice, distributions):
+        if spec.family != current_family:
+            print("\n" + "="*50)
+            print(FAMILY_HEADINGS[spec.family])
+            print("="*50)
+            current_family = spec.family
+
+        print(f"\nTesting {spec.label.lower()}...")
+        results = ExperimentResults(spec.name, batch_size=spec.params.get("batch_size"),
+                                    distribution=spec.distribution)
+        measured = ExperimentResults(spec.name)  # Only real measurements feed predictions
+        stop_measuring = False
+
+        for size in cell_sizes:
+            # Resumed cells cost nothing, so they never count against the budget
+            timing = checkpoints.lookup(spec, size, trial_policy) if checkpoints else None
+            if timing is not None:
+                complete_resumed_cell(spec, size, timing, memory, profilers)
+                measured.add_result(size, timing.mean, timing)
+                results.add_result(size, timing.mean, timing)
+                print(f"  Size {size}: {timing.mean:.6f} seconds (resumed)")
+                if on_event is not None:
+                    on_event(cell_event(spec, size, timing.mean, timing, resumed=True))
+                continue
+
+            per_call = predict_cell_time(spec, measured, size)
+            remaining = None
+            if total_budget is not None:
+                remaining = total_budget - (time.perf_counter() - started)
+
+            # A cell fits if its predicted cost is within both the remaining budget
+            # and the per-cell timeout
+            limits = [limit for limit in (cell_timeout, remaining) if limit is not None]
+            # The worker stops adding trials in time to report back within the limit
+            policy = dict(trial_policy or {})
+            if limits:
+                share = MEMORY_BUDGET_SHARE if memory else BUDGET_SHARE
+                policy["time_budget"] = min(policy.get("time_budget", DEFAULT_TIME_BUDGET),
+                                            share * max(min(limits), 0))
+            fits = not stop_measuring
+            if fits and limits:
+                if min(limits) <= 0:
+                    fits = False
+                elif (per_call is not None
+                      and predict_cell_cost(spec, per_call, policy, startup) > min(limits)):
+                    fits = False
+
+            timing = None
+            timed_out = False
+            if fits:
+                timing = run_cell_with_timeout(spec, size, min(limits) if limits else None,
+                                               policy, memory)
+                timed_out = timing is not None and timing.metrics.get("timed_out", False)
+                if timing is None:
+                    print(f"  Size {size}: timed out before one trial, skipping larger sizes")
+                    stop_measuring = True  # Larger sizes would take even longer
+                elif timed_out:
+                    # A partial cell is kept but not checkpointed, so a resume measures it again
+                    if timing.loops is None:  # Rebuilt from the streamed trials
+                        finish_cell(spec, size, timing, build_cell_args(spec, size))
+                elif checkpoints:
+                    checkpoints.save(spec, size, trial_policy, timing)
+                # Profile here, not in the worker, so profiling never counts
+                # against the cell timeout. A cell that hit its limit gets no
+                # untimed calls at all: one of them could take as long again
+                if timing is not None and profilers and not timed_out:
+                    timing.metrics.update(profile_cell(spec, size, profilers))
+
+            if timing is not None:
+                if not timed_out:
+                    complete_resumed_cell(spec, size, timing, memory)
+                measured.add_result(size, timing.mean, timing)
+                results.add_result(size, timing.mean, timing)
+                note = ""
+                if timed_out:
+                    missing_memory = memory and not all(name in timing.metrics
+                                                        for name in MEMORY_METRICS)
+                    skipped = " and ".join(name for name, wanted in
+                                           (("memory", missing_memory), ("profiles", profilers))
+                                           if wanted)
+                    note = f" (timed out after {timing.trials} trials"
+                    note += f"; {skipped} skipped)" if skipped else ")"
+                print(f"  Size {size}: {timing.mean:.6f} seconds{note}")
+                if on_event is not None:
+                    on_event(cell_event(spec, size, timing.mean, timing))
+            elif per_call is not None:
+                results.add_result(size, per_call, extrapolated=True)
+                print(f"  Size {size}: ~{per_call:.6f} seconds (extrapolated)")
+                if on_event is not None:
+                    on_event(cell_event(spec, size, per_call, extrapolated=True))
+            else:
+                print(f"  Size {size}: skipped, not enough data to extrapolate")
+
+        all_results.append(results)
+
+    return all_results
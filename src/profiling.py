@@ -0,0 +1,230 @@
+"""
+Profiling Hooks
+CS101 Fall 2025 - Activity 05
+
+This module profiles experiment cells to find where an algorithm spends its
+time. A profiling hook runs one extra call of the algorithm under a profiler
+and writes what it saw to a file. That call is separate from the timing
+runs, so profiler overhead never reaches the published times.
+
+Built-in hooks (names for make_profilers and --profile):
+
+    cprofile  cProfile statistics, saved as <algorithm>_<size>.pstats
+              (open with python -m pstats, or snakeviz)
+    sampling  a sampling stack profiler, saved as collapsed stacks in
+              <algorithm>_<size>.folded (for flamegraph.pl or speedscope)
+    calls     counts every function call with sys.setprofile, saved as
+              <algorithm>_<size>.calls.txt
+
+A hook is any object with a `profile(label, algorithm_func, *args)` method
+that returns a dictionary of metrics to add to the cell.
+"""
+
+import cProfile
+import os
+import re
+import sys
+import threading
+from collections import Counter
+
+from algorithms import _copy_args
+
+DEFAULT_PROFILE_DIR = "profiles"
+
+
+def _output_path(output_dir, label, extension):
+    """Build the file name a hook writes one cell's profile to."""
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f"{label}{extension}")
+
+
+def _frame_name(frame):
+    """Name a stack frame as module:function."""
+    module = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+    return f"{module}:{frame.f_code.co_name}"
+
+
+class CProfileHook:
+    """Profile a cell with cProfile and save the statistics as a .pstats file."""
+
+    name = "cprofile"
+
+    def __init__(self, output_dir=DEFAULT_PROFILE_DIR):
+        """
+        Args:
+            output_dir (str): Directory the .pstats files are written to
+        """
+        self.output_dir = output_dir
+
+    def profile(self, label, algorithm_func, *args):
+        """
+        Run the algorithm once under cProfile.
+
+        Returns:
+            dict: No metrics; the statistics are written to a file
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            algorithm_func(*args)
+        finally:
+            profiler.disable()
+        profiler.dump_stats(_output_path(self.output_dir, label, ".pstats"))
+        return {}
+
+
+class SamplingProfilerHook:
+    """
+    Sample the call stack at a fixed interval and save it as collapsed stacks.
+
+    A background thread reads the stack of the thread running the algorithm,
+    so the algorithm itself runs at nearly full speed. Python only switches
+    threads every sys.getswitchinterval() seconds, so the switch interval is
+    lowered to the sampling interval while profiling.
+    """
+
+    name = "sampling"
+
+    def __init__(self, output_dir=DEFAULT_PROFILE_DIR, interval=0.001):
+        """
+        Args:
+            output_dir (str): Directory the .folded files are written to
+            interval (float): Seconds between samples
+        """
+        self.output_dir = output_dir
+        self.interval = interval
+
+    def profile(self, label, algorithm_func, *args):
+        """
+        Run the algorithm once while sampling its stack.
+
+        Returns:
+            dict: 'profile_samples', the number of stacks sampled
+        """
+        target = threading.get_ident()
+        stacks = Counter()
+        done = threading.Event()
+
+        def run():
+            algorithm_func(*args)
+
+        def sample():
+            while not done.wait(self.interval):
+                # Only the frames called from run() belong to the algorithm
+                frame = sys._current_frames().get(target)
+                names = []
+                while frame is not None and frame.f_code is not run.__code__:
+                    names.append(_frame_name(frame))
+                    frame = frame.f_back
+                if frame is not None and names:
+                    stacks[";".join(reversed(names))] += 1
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.interval))
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        try:
+            run()
+        finally:
+            done.set()
+            sampler.join()
+            sys.setswitchinterval(switch_interval)
+
+        with open(_output_path(self.output_dir, label, ".folded"), "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return {"profile_samples": sum(stacks.values())}
+
+
+class CallCounterHook:
+    """Count every Python and built-in function call with sys.setprofile."""
+
+    name = "calls"
+
+    def __init__(self, output_dir=DEFAULT_PROFILE_DIR):
+        """
+        Args:
+            output_dir (str): Directory the .calls.txt files are written to
+        """
+        self.output_dir = output_dir
+
+    def profile(self, label, algorithm_func, *args):
+        """
+        Run the algorithm once, counting the calls it makes.
+
+        Returns:
+            dict: 'function_calls', the total number of calls
+        """
+        calls = Counter()
+
+        def count(frame, event, arg):
+            if event == "call":
+                calls[_frame_name(frame)] += 1
+            elif event == "c_call":
+                calls[f"builtins:{arg.__name__}"] += 1
+
+        previous = sys.getprofile()
+        sys.setprofile(count)
+        try:
+            algorithm_func(*args)
+        finally:
+            sys.setprofile(previous)
+
+        with open(_output_path(self.output_dir, label, ".calls.txt"), "w") as f:
+            for name, number in calls.most_common():
+                f.write(f"{number:>12} {name}\n")
+        return {"function_calls": sum(calls.values())}
+
+
+# Built-in hooks by the name used on the command line
+PROFILERS = {hook.name: hook for hook in (CProfileHook, SamplingProfilerHook, CallCounterHook)}
+
+
+def make_profilers(names, output_dir=DEFAULT_PROFILE_DIR):
+    """
+    Create built-in profiling hooks by name.
+
+    Args:
+        names (list): Names from PROFILERS, or a comma-separated string of them
+        output_dir (str): Directory the profiles are written to
+
+    Returns:
+        list: The hooks, in the order given
+    """
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(",") if name.strip()]
+    unknown = [name for name in names if name not in PROFILERS]
+    if unknown:
+        raise ValueError(f"Unknown profiler {', '.join(unknown)}; "
+                         f"choose from {', '.join(PROFILERS)}")
+    return [PROFILERS[name](output_dir) for name in names]
+
+
+def profile_label(algorithm_name, size):
+    """Build the file name stem of one cell's profiles, e.g. 'merge_sort_1000'."""
+    slug = re.sub(r"[^a-z0-9]+", "_", algorithm_name.lower()).strip("_")
+    return f"{slug}_{size}"
+
+
+def run_profilers(profilers, label, algorithm_func, *args, copy_args=True):
+    """
+    Run each profiling hook on its own call of an algorithm.
+
+    Every hook gets a fresh copy of the input (for algorithms that modify it)
+    and a call of its own, so profilers do not measure each other.
+
+    Args:
+        profilers (list): Profiling hooks
+        label (str): File name stem for the profiles
+        algorithm_func: Function to profile
+        *args: Arguments to pass to the function
+        copy_args (bool): Copy list arguments first (for algorithms that modify their input)
+
+    Returns:
+        dict: Metrics reported by the hooks
+    """
+    metrics = {}
+    for hook in profilers:
+        call_args = _copy_args(args) if copy_args else args
+        metrics.update(hook.profile(label, algorithm_func, *call_args))
+    return metrics
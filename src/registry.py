@@ -0,0 +1,281 @@
+"""
+Algorithm Registry
+CS101 Fall 2025 - Activity 05
+
+This module declares every algorithm the experiment runner knows about: the
+function to time, the input it needs, its expected complexity, how large an
+input it can handle in reasonable time, and whether it modifies its input.
+The runner, the menu, the summary report and the plots are all driven from
+this registry, so adding an algorithm only means registering it here.
+"""
+
+import copy
+import math
+
+from algorithms import (
+    NUMPY_AVAILABLE,
+    linear_search, binary_search, linear_search_batch, binary_search_batch, searchsorted_batch,
+    bubble_sort, selection_sort, merge_sort, merge_sort_bottom_up, quick_sort, heap_sort,
+    counting_sort, radix_sort, hybrid_sort,
+    calculate_sum, find_maximum, find_minimum,
+    calculate_aggregates, calculate_aggregates_numpy, calculate_aggregates_chunked
+)
+from indexes import INDEX_TYPES
+from streaming import stream_aggregates, stream_linear_search
+
+# Number of targets per call in the batched search throughput experiments
+BATCH_SIZES = [10, 100, 1000]
+
+# Largest size worth generating for distributions that are slow to build. The
+# quicksort killer takes quadratic time to generate, about 4.5 s at 4,000 elements
+DISTRIBUTION_MAX_SIZES = {
+    "quicksort_killer": 4000,
+}
+
+# Relative cost of one call for each complexity class, used to estimate cell run times
+COMPLEXITY_COSTS = {
+    "1": lambda n: 1,
+    "log n": lambda n: math.log2(max(n, 2)),
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(max(n, 2)),
+    "n^2": lambda n: n * n,
+    "n^3": lambda n: n ** 3,
+}
+
+# Headings printed before each family of experiments
+FAMILY_HEADINGS = {
+    "operation": "LIST OPERATION EXPERIMENTS",
+    "search": "SEARCH ALGORITHM EXPERIMENTS",
+    "sort": "SORTING ALGORITHM EXPERIMENTS",
+    "batch_search": "BATCH SEARCH THROUGHPUT EXPERIMENTS",
+    "index": "SEARCH INDEX BREAK-EVEN EXPERIMENTS",
+    "stream": "OUT-OF-CORE STREAMING EXPERIMENTS",
+}
+
+# Titles used for each family in the summary report
+FAMILY_TITLES = {
+    "operation": "List Operations",
+    "search": "Search Algorithms",
+    "sort": "Sorting Algorithms",
+    "batch_search": "Batch Searches",
+    "index": "Search Indexes",
+    "stream": "Streaming Operations",
+}
+
+# Menu choices: (label, families included)
+MENU_CHOICES = {
+    "1": ("Search algorithms only (Linear Search, Binary Search)", ("search",)),
+    "2": ("Sorting algorithms only (Bubble, Selection, Merge, Quick, Heap, Counting, Radix, Hybrid)",
+          ("sort",)),
+    "3": ("List operations only (Sum, Max, Min, fused and vectorized aggregates)", ("operation",)),
+    "4": ("All algorithms (comprehensive)",
+          ("operation", "search", "sort", "batch_search", "index")),
+    "5": ("Batch search throughput (many targets per call)", ("batch_search",)),
+    "6": ("Search index break-even (when does building an index pay off?)", ("index",)),
+    "7": ("Out-of-core streaming (sum/min/max and search over on-disk files)", ("stream",)),
+}
+
+
+class AlgorithmSpec:
+    """Everything the experiment runner needs to know about one algorithm."""
+
+    def __init__(self, name, func, family, input_kind="random", target=None,
+                 complexity="n", max_size=None, mutates=False, min_trials=3,
+                 params=None, variants=None):
+        """
+        Args:
+            name (str): Name used in reports
+            func: Function (or index class) to time
+            family (str): Experiment family, one of the FAMILY_HEADINGS keys
+            input_kind (str): Input data: 'random', 'sorted', 'random_array',
+                'sorted_array' or 'binary_file' (copies made by for_distribution
+                use any datasets.GENERATORS name, with '_array' for NumPy input)
+            target (str): How search targets are chosen: None, 'mixed' (70% present),
+                'missing', 'batch' or 'sample' (100 mixed targets for indexes)
+            complexity (str): Expected time complexity, one of the COMPLEXITY_COSTS keys
+            max_size (int): Largest input size worth timing (None for no limit)
+            mutates (bool): Whether the function modifies its input
+            min_trials (int): Minimum number of timing trials per cell
+            params (dict): Extra settings, such as 'batch_size'
+            variants (dict): Names of related faster versions, e.g. {'vectorized': ...}
+        """
+        self.name = name
+        self.func = func
+        self.family = family
+        self.input_kind = input_kind
+        self.target = target
+        self.complexity = complexity
+        self.max_size = max_size
+        self.mutates = mutates
+        self.min_trials = min_trials
+        self.params = params or {}
+        self.variants = variants or {}
+        self.distribution = None  # Set on copies made by for_distribution
+
+    @property
+    def label(self):
+        """Name used in reports, including the input distribution if one was chosen."""
+        if self.distribution is None:
+            return self.name
+        return f"{self.name} [{self.distribution}]"
+
+    @property
+    def accepts_distributions(self):
+        """Whether the algorithm takes unordered random data, so any distribution can replace it."""
+        return self.input_kind in ("random", "random_array")
+
+    def for_distribution(self, distribution):
+        """
+        Get a copy of this algorithm that runs on another input distribution.
+
+        Args:
+            distribution (str): A datasets.GENERATORS name, such as 'reverse' or 'nearly_sorted:50'
+
+        Returns:
+            AlgorithmSpec: The copy (this spec itself if it needs ordered or file input)
+        """
+        if not self.accepts_distributions:
+            return self
+        spec = copy.copy(self)
+        spec.distribution = distribution
+        spec.input_kind = distribution + ("_array" if self.input_kind == "random_array" else "")
+        cap = DISTRIBUTION_MAX_SIZES.get(distribution.split(":")[0])
+        if cap is not None:
+            spec.max_size = cap if spec.max_size is None else min(spec.max_size, cap)
+        return spec
+
+    def sizes_for(self, sizes):
+        """Get the requested sizes this algorithm can handle."""
+        if self.max_size is None:
+            return list(sizes)
+        return [s for s in sizes if s <= self.max_size]
+
+    def estimated_cost(self, size):
+        """Estimate the relative cost of one cell so long cells can be scheduled first."""
+        return COMPLEXITY_COSTS.get(self.complexity, COMPLEXITY_COSTS["n"])(size)
+
+
+REGISTRY = []
+
+
+def register(name, func, family, **options):
+    """
+    Add an algorithm to the registry.
+
+    Args:
+        name (str): Name used in reports (must be unique)
+        func: Function (or index class) to time
+        family (str): Experiment family, one of the FAMILY_HEADINGS keys
+        **options: Any other AlgorithmSpec settings
+
+    Returns:
+        AlgorithmSpec: The registered specification
+    """
+    if any(spec.name == name for spec in REGISTRY):
+        raise ValueError(f"An algorithm named '{name}' is already registered")
+    spec = AlgorithmSpec(name, func, family, **options)
+    REGISTRY.append(spec)
+    return spec
+
+
+def get_algorithm(name, distribution=None):
+    """
+    Look up a registered algorithm by name.
+
+    Args:
+        name (str): Name of the algorithm
+        distribution (str): Input distribution to run it on instead of its
+            registered input (see AlgorithmSpec.for_distribution)
+
+    Returns:
+        AlgorithmSpec: The registered specification (None if there is none)
+    """
+    for spec in REGISTRY:
+        if spec.name == name:
+            return spec.for_distribution(distribution) if distribution else spec
+    return None
+
+
+def find_algorithm(func):
+    """
+    Look up the first registered algorithm that uses a function.
+
+    Args:
+        func: Function (or index class) to look for
+
+    Returns:
+        AlgorithmSpec: The registered specification (None if there is none)
+    """
+    for spec in REGISTRY:
+        if spec.func is func:
+            return spec
+    return None
+
+
+def algorithms_for_choice(algorithm_choice):
+    """
+    Get the registered algorithms selected by a menu choice, in report order.
+
+    Args:
+        algorithm_choice (str): One of the MENU_CHOICES keys
+
+    Returns:
+        list: AlgorithmSpec objects grouped by family in the order of the menu choice
+    """
+    _, families = MENU_CHOICES[algorithm_choice]
+    return [spec for family in families for spec in REGISTRY if spec.family == family]
+
+
+# List operations
+register("List Sum", calculate_sum, "operation", max_size=50000, min_trials=5,
+         variants={"fused": "Fused Aggregates", "vectorized": "NumPy Aggregates"})
+register("Find Maximum", find_maximum, "operation", max_size=50000, min_trials=5,
+         variants={"fused": "Fused Aggregates", "vectorized": "NumPy Aggregates"})
+register("Find Minimum", find_minimum, "operation", max_size=50000, min_trials=5,
+         variants={"fused": "Fused Aggregates", "vectorized": "NumPy Aggregates"})
+register("Fused Aggregates", calculate_aggregates, "operation", max_size=50000, min_trials=5)
+register("Chunked Aggregates", calculate_aggregates_chunked, "operation",
+         input_kind="random_array", max_size=50000, min_trials=5)
+if NUMPY_AVAILABLE:
+    register("NumPy Aggregates", calculate_aggregates_numpy, "operation",
+             input_kind="random_array", max_size=50000, min_trials=5)
+
+# Single-target searches
+register("Linear Search", linear_search, "search", target="mixed", max_size=50000,
+         variants={"batched": "Linear Search Batch (100 targets)", "indexed": "Hash Index"})
+register("Binary Search", binary_search, "search", input_kind="sorted", target="mixed",
+         complexity="log n", max_size=50000,
+         variants={"batched": "Binary Search Batch (100 targets)"})
+
+# Sorts (all sort in place)
+register("Bubble Sort", bubble_sort, "sort", complexity="n^2", max_size=20000, mutates=True)
+register("Selection Sort", selection_sort, "sort", complexity="n^2", max_size=20000, mutates=True)
+register("Merge Sort", merge_sort, "sort", complexity="n log n", mutates=True)
+register("Bottom-Up Merge Sort", merge_sort_bottom_up, "sort", complexity="n log n", mutates=True)
+register("Quick Sort", quick_sort, "sort", complexity="n log n", mutates=True)
+register("Heap Sort", heap_sort, "sort", complexity="n log n", mutates=True)
+register("Counting Sort", counting_sort, "sort", mutates=True)
+register("Radix Sort", radix_sort, "sort", mutates=True)
+register("Hybrid Sort", hybrid_sort, "sort", complexity="n log n", mutates=True)
+
+# Batched searches
+for _batch_size in BATCH_SIZES:
+    register(f"Linear Search Batch ({_batch_size} targets)", linear_search_batch, "batch_search",
+             target="batch", params={"batch_size": _batch_size})
+    register(f"Binary Search Batch ({_batch_size} targets)", binary_search_batch, "batch_search",
+             input_kind="sorted", target="batch", params={"batch_size": _batch_size})
+    if NUMPY_AVAILABLE:
+        register(f"Searchsorted Batch ({_batch_size} targets)", searchsorted_batch, "batch_search",
+                 input_kind="sorted_array", target="batch", params={"batch_size": _batch_size})
+
+# Search indexes (timed on their build)
+register("Hash Index", INDEX_TYPES["Hash Index"], "index", target="sample")
+register("Sorted Index", INDEX_TYPES["Sorted Index"], "index", target="sample", complexity="n log n")
+register("Blocked Index", INDEX_TYPES["Blocked Index"], "index", target="sample",
+         complexity="n log n")
+
+# Out-of-core streaming over binary files
+register("Streaming Aggregates", stream_aggregates, "stream", input_kind="binary_file",
+         min_trials=1)
+register("Streaming Linear Search", stream_linear_search, "stream", input_kind="binary_file",
+         target="missing", min_trials=1)
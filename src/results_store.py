@@ -0,0 +1,429 @@
+"""
+Results Store
+CS101 Fall 2025 - Activity 05
+
+This module appends every experiment run to a local SQLite database so that
+results from different days, machines and code versions can be compared. The
+schema is normalized into four tables:
+
+    environment  one row per distinct machine / Python setup
+    runs         one row per run: when, what was asked for, which environment,
+                 and how steady the machine was
+    cells        one row per (algorithm, size) measured in a run
+    samples      one row per timing trial of a cell
+
+Queries and exports read rows straight from the database cursor, so even a
+large history is never loaded into memory at once.
+"""
+
+import csv
+import json
+import math
+import os
+import platform
+import socket
+import sqlite3
+import time
+from itertools import groupby
+
+from algorithms import NUMPY_AVAILABLE
+from datasets import DEFAULT_SEED
+from lazy_imports import lazy_import
+from registry import get_algorithm
+
+np = lazy_import("numpy")
+
+DEFAULT_DATABASE = os.environ.get("ACTIVITY05_DATABASE", "experiment_results.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS environment (
+    id INTEGER PRIMARY KEY,
+    host TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    machine TEXT NOT NULL,
+    processor TEXT NOT NULL,
+    cpu_count INTEGER NOT NULL,
+    python TEXT NOT NULL,
+    numpy TEXT NOT NULL,
+    UNIQUE (host, platform, machine, processor, cpu_count, python, numpy)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL,
+    finished TEXT NOT NULL,
+    label TEXT,
+    algorithm_choice TEXT,
+    sizes TEXT,
+    seed INTEGER,
+    trial_policy TEXT,
+    stability TEXT,
+    environment_id INTEGER NOT NULL REFERENCES environment (id)
+);
+CREATE TABLE IF NOT EXISTS cells (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    algorithm TEXT NOT NULL,
+    family TEXT,
+    size INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    median REAL,
+    minimum REAL,
+    mad REAL,
+    ci_half_width REAL,
+    trials INTEGER,
+    loops INTEGER,
+    overhead REAL,
+    extrapolated INTEGER NOT NULL DEFAULT 0,
+    metrics TEXT
+);
+CREATE TABLE IF NOT EXISTS samples (
+    cell_id INTEGER NOT NULL REFERENCES cells (id) ON DELETE CASCADE,
+    trial INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (cell_id, trial)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cells_by_algorithm ON cells (algorithm, size);
+CREATE INDEX IF NOT EXISTS cells_by_run ON cells (run_id);
+CREATE INDEX IF NOT EXISTS runs_by_start ON runs (started);
+"""
+
+# Columns returned for each cell by queries and exports
+CELL_COLUMNS = [
+    "cell_id", "run_id", "started", "label", "host", "algorithm", "family", "size",
+    "mean", "median", "minimum", "mad", "ci_half_width", "trials", "loops", "extrapolated",
+    "metrics",
+]
+
+_CELL_SELECT = """
+SELECT cells.id AS cell_id, runs.id AS run_id, runs.started, runs.label, environment.host,
+       cells.algorithm, cells.family, cells.size, cells.mean, cells.median, cells.minimum,
+       cells.mad, cells.ci_half_width, cells.trials, cells.loops, cells.extrapolated,
+       cells.metrics{extra_columns}
+FROM cells
+JOIN runs ON runs.id = cells.run_id
+JOIN environment ON environment.id = runs.environment_id
+"""
+
+
+def describe_environment():
+    """
+    Describe the machine and Python setup the experiments run on.
+
+    Returns:
+        dict: host, platform, machine, processor, cpu_count, python and numpy versions
+    """
+    return {
+        "host": socket.gethostname(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count() or 0,
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "numpy": np.__version__ if NUMPY_AVAILABLE else "not installed",
+    }
+
+
+def _timestamp(seconds=None):
+    """Format a time as a sortable ISO 8601 string in local time."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+
+
+def _json_metric(value):
+    """
+    Make a value safe for JSON: infinite or NaN floats, such as the break-even
+    count of an index that never pays off or the confidence interval of a
+    one-trial cell, become null.
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class ResultsStore:
+    """SQLite database holding the history of experiment runs."""
+
+    def __init__(self, path=DEFAULT_DATABASE):
+        """
+        Open (and if needed create) a results database.
+
+        Args:
+            path (str): Database file (':memory:' for a throwaway store)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and path != ":memory:":
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        # Databases created before runs had a stability report gain the column
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(runs)")}
+        if "stability" not in columns:
+            self.connection.execute("ALTER TABLE runs ADD COLUMN stability TEXT")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def _environment_id(self, environment):
+        """Get the id of an environment row, adding it if it is new."""
+        columns = list(environment)
+        self.connection.execute(
+            f"INSERT OR IGNORE INTO environment ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})",
+            [environment[c] for c in columns])
+        row = self.connection.execute(
+            "SELECT id FROM environment WHERE " + " AND ".join(f"{c} = ?" for c in columns),
+            [environment[c] for c in columns]).fetchone()
+        return row["id"]
+
+    def record_run(self, all_results, algorithm_choice=None, sizes=None, trial_policy=None,
+                   label=None, started=None, seed=DEFAULT_SEED, stability=None):
+        """
+        Append a finished run, with all its cells and per-trial samples.
+
+        Args:
+            all_results (list): List of ExperimentResults objects
+            algorithm_choice (str): Menu choice that was run
+            sizes (list): Sizes that were asked for
+            trial_policy (dict): Timing settings used
+            label (str): Free-form name for the run, such as a git commit
+            started (float): time.time() when the run started (defaults to now)
+            seed (int): Seed used to generate the input data
+            stability (dict): Environment stability report (see hygiene.StabilityCheck)
+
+        Returns:
+            int: The id of the new run
+        """
+        with self.connection:
+            run_id = self.connection.execute(
+                "INSERT INTO runs (started, finished, label, algorithm_choice, sizes, seed, "
+                "trial_policy, stability, environment_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (_timestamp(started), _timestamp(), label, algorithm_choice,
+                 json.dumps(sizes) if sizes is not None else None, seed,
+                 json.dumps(trial_policy) if trial_policy else None,
+                 json.dumps(stability) if stability else None,
+                 self._environment_id(describe_environment()))).lastrowid
+
+            for result in all_results:
+                spec = get_algorithm(result.algorithm_name)
+                family = spec.family if spec else None
+                rows = zip(result.sizes, result.times, result.timings, result.extrapolated)
+                for size, time_val, timing, extrapolated in rows:
+                    self._insert_cell(run_id, result.label, family, size, time_val,
+                                      timing, extrapolated)
+        return run_id
+
+    def _insert_cell(self, run_id, algorithm, family, size, time_val, timing, extrapolated):
+        """Insert one cell and its samples."""
+        summary = (None,) * 8
+        if timing is not None:
+            metrics = {name: _json_metric(value) for name, value in timing.metrics.items()}
+            summary = tuple(_json_metric(value) for value in (
+                timing.median, timing.minimum, timing.mad, timing.ci_half_width,
+                timing.trials, timing.loops, timing.overhead))
+            summary += (json.dumps(metrics, allow_nan=False) if metrics else None,)
+        cell_id = self.connection.execute(
+            "INSERT INTO cells (run_id, algorithm, family, size, mean, median, minimum, mad, "
+            "ci_half_width, trials, loops, overhead, metrics, extrapolated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (run_id, algorithm, family, size, time_val) + summary + (int(extrapolated),)
+        ).lastrowid
+        if timing is not None:
+            self.connection.executemany(
+                "INSERT INTO samples (cell_id, trial, seconds) VALUES (?, ?, ?)",
+                [(cell_id, trial, seconds) for trial, seconds in enumerate(timing.samples)])
+
+    def runs(self):
+        """
+        List the recorded runs, newest first.
+
+        Yields:
+            dict: id, started, finished, label, algorithm_choice, sizes, host, cell count
+            and stability report (None for runs recorded without one)
+        """
+        cursor = self.connection.execute(
+            "SELECT runs.id, runs.started, runs.finished, runs.label, runs.algorithm_choice, "
+            "runs.sizes, runs.stability, environment.host, "
+            "(SELECT COUNT(*) FROM cells WHERE cells.run_id = runs.id) AS cells "
+            "FROM runs JOIN environment ON environment.id = runs.environment_id "
+            "ORDER BY runs.started DESC, runs.id DESC")
+        for row in cursor:
+            run = dict(row)
+            run["stability"] = json.loads(run["stability"]) if run["stability"] else None
+            yield run
+
+    def _where(self, algorithm=None, size=None, host=None, since=None, until=None, run_id=None,
+               include_extrapolated=False):
+        """Build the WHERE clause shared by queries and exports."""
+        conditions, parameters = [], []
+        if algorithm is not None:
+            names = [algorithm] if isinstance(algorithm, str) else list(algorithm)
+            conditions.append(f"cells.algorithm IN ({', '.join('?' for _ in names)})")
+            parameters.extend(names)
+        for column, value in [("cells.size", size), ("environment.host", host),
+                              ("runs.id", run_id)]:
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        # Timestamps are ISO strings, so a plain date such as '2025-10-01' also works
+        if since is not None:
+            conditions.append("runs.started >= ?")
+            parameters.append(since)
+        if until is not None:
+            conditions.append("runs.started < ?")
+            parameters.append(until)
+        if not include_extrapolated:
+            conditions.append("cells.extrapolated = 0")
+        clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return clause, parameters
+
+    def query_cells(self, algorithm=None, size=None, host=None, since=None, until=None,
+                    run_id=None, include_extrapolated=False):
+        """
+        Select cells across all recorded runs.
+
+        Args:
+            algorithm: Algorithm name, or a list of names (None for all)
+            size (int): Input size (None for all)
+            host (str): Host name the run was made on (None for all)
+            since (str): Earliest run start, as an ISO date or timestamp
+            until (str): Run start to stop before, as an ISO date or timestamp
+            run_id (int): A single run (None for all)
+            include_extrapolated (bool): Also return cells that were not measured
+
+        Yields:
+            dict: One cell per row with the keys in CELL_COLUMNS, oldest run first
+        """
+        clause, parameters = self._where(algorithm, size, host, since, until, run_id,
+                                         include_extrapolated)
+        cursor = self.connection.execute(
+            _CELL_SELECT.format(extra_columns="") + clause + " ORDER BY runs.started, cells.id", parameters)
+        for row in cursor:
+            yield dict(row)
+
+    def samples(self, cell_id):
+        """
+        Get the per-trial times of one cell.
+
+        Args:
+            cell_id (int): Id of the cell
+
+        Returns:
+            list: Seconds per call for each trial, in trial order
+        """
+        cursor = self.connection.execute(
+            "SELECT seconds FROM samples WHERE cell_id = ? ORDER BY trial", (cell_id,))
+        return [row["seconds"] for row in cursor]
+
+    def compare_algorithms(self, size, algorithm=None, host=None, since=None, until=None):
+        """
+        Compare algorithms at one size across every matching historical run.
+
+        Args:
+            size (int): Input size to compare at
+            algorithm: Algorithm name, or a list of names (None for all)
+            host (str): Only runs made on this host
+            since (str): Earliest run start, as an ISO date or timestamp
+            until (str): Run start to stop before, as an ISO date or timestamp
+
+        Returns:
+            list: One dict per algorithm with 'algorithm', 'runs' (cells found),
+            'best' (fastest median), 'average' (mean of the cell means) and
+            'latest' (mean in the newest run), fastest first
+        """
+        comparison = {}
+        for cell in self.query_cells(algorithm, size, host, since, until):
+            row = comparison.setdefault(cell["algorithm"], {
+                "algorithm": cell["algorithm"], "runs": 0, "best": float("inf"),
+                "average": 0.0, "latest": None})
+            row["runs"] += 1
+            row["best"] = min(row["best"], cell["median"] if cell["median"] is not None
+                              else cell["mean"])
+            row["average"] += cell["mean"]
+            row["latest"] = cell["mean"]  # Cells arrive oldest run first
+
+        for row in comparison.values():
+            row["average"] /= row["runs"]
+        return sorted(comparison.values(), key=lambda row: row["best"])
+
+    def export_jsonl(self, path, **filters):
+        """
+        Write the selected cells, with their samples, as JSON Lines.
+
+        Args:
+            path (str): File to write
+            **filters: Any query_cells filter
+
+        Returns:
+            int: Number of cells written
+        """
+        count = 0
+        with open(path, "w") as f:
+            for cell, samples in self._cells_with_samples(**filters):
+                # Runs recorded before infinite values were stored as null may still hold them
+                cell = {name: _json_metric(value) for name, value in cell.items()}
+                cell["metrics"] = json.loads(cell["metrics"]) if cell["metrics"] else {}
+                cell["extrapolated"] = bool(cell["extrapolated"])
+                cell["samples"] = samples
+                f.write(json.dumps(cell, allow_nan=False) + "\n")
+                count += 1
+        return count
+
+    def export_csv(self, path, **filters):
+        """
+        Write the selected cells as CSV, one row per cell.
+
+        Args:
+            path (str): File to write
+            **filters: Any query_cells filter
+
+        Returns:
+            int: Number of cells written
+        """
+        count = 0
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(CELL_COLUMNS)
+            for cell in self.query_cells(**filters):
+                writer.writerow([cell[column] for column in CELL_COLUMNS])
+                count += 1
+        return count
+
+    def _cells_with_samples(self, **filters):
+        """Stream cells joined with their samples, grouped back into one item per cell."""
+        clause, parameters = self._where(**filters)
+        query = (_CELL_SELECT.format(extra_columns=", samples.seconds")
+                 + "LEFT JOIN samples ON samples.cell_id = cells.id" + clause
+                 + " ORDER BY runs.started, cells.id, samples.trial")
+        cursor = self.connection.execute(query, parameters)
+        for _, rows in groupby(cursor, key=lambda row: row["cell_id"]):
+            rows = list(rows)
+            cell = {column: rows[0][column] for column in CELL_COLUMNS}
+            yield cell, [row["seconds"] for row in rows if row["seconds"] is not None]
+
+
+def print_historical_comparison(comparison, size):
+    """
+    Print the result of ResultsStore.compare_algorithms.
+
+    Args:
+        comparison (list): Rows returned by compare_algorithms
+        size (int): Size that was compared
+    """
+    print(f"\nHistorical Comparison at Size {size}:")
+    print("-" * 50)
+    if not comparison:
+        print("No recorded measurements at this size.")
+        return
+    for rank, row in enumerate(comparison, 1):
+        print(f"{rank}. {row['algorithm']}: best {row['best']:.6f}s, "
+              f"average {row['average']:.6f}s, latest {row['latest']:.6f}s "
+              f"({row['runs']} runs)")
@@ -0,0 +1,135 @@
+"""
+Parallel Experiment Scheduler
+CS101 Fall 2025 - Activity 05
+
+This module spreads the (algorithm, size) cells of a custom experiment across a
+pool of worker processes so that long sweeps can use every core on the machine.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from algorithms import warm_up_timing
+from events import cell_event
+from registry import get_algorithm
+from timer import ExperimentResults, build_experiment_plan, complete_resumed_cell, measure_cell
+
+
+def available_cpus():
+    """
+    Get the list of CPU ids this process is allowed to run on.
+
+    Returns:
+        list: Sorted list of CPU ids
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _init_worker(cpus, counter):
+    """
+    Pin a freshly started worker to its own core and warm up its timing system.
+
+    Args:
+        cpus (list): CPU ids available to the pool
+        counter: Shared counter used to hand out one CPU per worker
+    """
+    with counter.get_lock():
+        slot = counter.value
+        counter.value += 1
+
+    if cpus and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+        except OSError:
+            pass  # Pinning is best effort; an unpinned worker still gives valid timings
+
+    warm_up_timing()
+
+
+def _run_cell(algorithm_name, distribution, size, trial_policy, memory, profilers):
+    """Measure one cell inside a worker process."""
+    return measure_cell(get_algorithm(algorithm_name, distribution), size, trial_policy, memory,
+                        profilers)
+
+
+def run_parallel_experiments(sizes, algorithm_choice, workers=None, trial_policy=None,
+                             checkpoints=None, memory=False, profilers=None,
+                             distributions=None, on_event=None):
+    """
+    Run experiments with user-selected sizes and algorithms across worker processes.
+
+    Cells are submitted longest first, using the complexity each algorithm declares
+    in the registry, so the slowest sorts never end up running alone at the end of
+    the sweep. The returned results are in the same order as
+    those from run_custom_experiments, whatever order the cells finish in.
+
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        workers (int): Number of worker processes (defaults to one per available CPU)
+        trial_policy (dict): Overrides for the timing settings (see timer.measure_cell)
+        checkpoints (CellCheckpoints): Saves each finished cell and supplies resumed ones
+        memory (bool): Also measure the memory footprint of every cell
+        profilers (list): Profiling hooks to run on every cell (see profiling.py)
+        distributions (list): Input distributions for the size x distribution grid
+            (see timer.build_experiment_plan)
+        on_event: Called with an ExperimentEvent as each cell finishes (see events.py)
+
+    Returns:
+        list: List of ExperimentResults objects
+    """
+    cpus = available_cpus()
+    if workers is None:
+        workers = len(cpus)
+
+    plan = build_experiment_plan(sizes, algorithm_choice, distributions)
+    cells = [(spec, size) for spec, cell_sizes in plan for size in cell_sizes]
+    cells.sort(key=lambda cell: cell[0].estimated_cost(cell[1]), reverse=True)
+
+    # Cells measured by an earlier, interrupted run are not submitted again
+    timings = {}
+    if checkpoints:
+        for spec, size in cells:
+            timing = checkpoints.lookup(spec, size, trial_policy)
+            if timing is not None:
+                complete_resumed_cell(spec, size, timing, memory, profilers)
+                timings[(spec.label, size)] = timing
+                if on_event is not None:
+                    on_event(cell_event(spec, size, timing.mean, timing, resumed=True))
+        cells = [(spec, size) for spec, size in cells if (spec.label, size) not in timings]
+
+    print("=== Custom Algorithm Performance Analysis ===")
+    if timings:
+        print(f"Resuming: {len(timings)} cells were already measured")
+    print(f"Running {len(cells)} experiment cells on {workers} worker processes...")
+
+    counter = multiprocessing.Value("i", 0)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cpus, counter)) as pool:
+        futures = {pool.submit(_run_cell, spec.name, spec.distribution, size, trial_policy, memory,
+                               profilers): (spec, size)
+                   for spec, size in cells}
+        for future in as_completed(futures):
+            spec, size = futures[future]
+            timing = future.result()
+            timings[(spec.label, size)] = timing
+            if checkpoints:
+                checkpoints.save(spec, size, trial_policy, timing)
+            print(f"  {spec.label} size {size}: {timing.mean:.6f} seconds")
+            if on_event is not None:
+                on_event(cell_event(spec, size, timing.mean, timing))
+
+    # Rebuild the results in plan order so reports look the same as a serial run
+    all_results = []
+    for spec, cell_sizes in plan:
+        results = ExperimentResults(spec.name, batch_size=spec.params.get("batch_size"),
+                                    distribution=spec.distribution)
+        for size in cell_sizes:
+            timing = timings[(spec.label, size)]
+            results.add_result(size, timing.mean, timing)
+        all_results.append(results)
+
+    return all_results
@@ -0,0 +1,143 @@
+"""
+Startup Benchmark
+CS101 Fall 2025 - Activity 05
+
+This module measures how long the program takes to start, broken down by
+import. Each entry point is imported in a fresh interpreter with
+python -X importtime, several times, and the fastest run is reported:
+
+    main       the activity05 command
+    scheduler  what every parallel worker process imports
+    planner    what every budgeted cell process imports
+
+It also checks that no heavy backend (NumPy, matplotlib, asyncio) is
+imported at startup; they should load lazily, on first use (see
+lazy_imports.py). Run it from the src directory:
+
+    python startup.py
+    python startup.py --runs 10 --top 20 main
+    python startup.py --check      # exit with status 1 if a backend loads at startup
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Entry points whose startup matters
+ENTRY_POINTS = ["main", "scheduler", "planner"]
+
+# Packages that are slow to import and must only be loaded when used
+HEAVY_BACKENDS = ["numpy", "matplotlib", "asyncio"]
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_importtime(output):
+    """
+    Parse the report written by python -X importtime.
+
+    Args:
+        output (str): Standard error of the interpreter
+
+    Returns:
+        list: (module, self microseconds, cumulative microseconds) tuples, in
+        the order the imports finished
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The column headings
+        imports.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return imports
+
+
+def time_import(module, runs=5):
+    """
+    Import a module in fresh interpreters and time every import it makes.
+
+    Args:
+        module (str): Module to import, from the src directory
+        runs (int): Number of fresh interpreters to try
+
+    Returns:
+        tuple: (total seconds, imports of the fastest run as returned by parse_importtime)
+    """
+    best = None
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                   cwd=SOURCE_DIR, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"importing {module} failed:\n{completed.stderr.strip()}")
+        imports = parse_importtime(completed.stderr)
+        total = next(cumulative for name, _, cumulative in reversed(imports) if name == module)
+        if best is None or total < best[0]:
+            best = (total, imports)
+    return best[0] / 1e6, best[1]
+
+
+def loaded_backends(imports):
+    """Get the heavy backends that appear in an import report."""
+    packages = {name.split(".")[0] for name, _, _ in imports}
+    return [backend for backend in HEAVY_BACKENDS if backend in packages]
+
+
+def print_startup_report(module, runs=5, top=10):
+    """
+    Print the startup time of one entry point and its slowest imports.
+
+    Args:
+        module (str): Module to import
+        runs (int): Number of fresh interpreters to try
+        top (int): Number of slowest imports to list
+
+    Returns:
+        list: Heavy backends imported at startup (empty when all are lazy)
+    """
+    total, imports = time_import(module, runs)
+    print(f"\n=== import {module}: {total * 1000:.1f} ms (fastest of {runs}) ===")
+    print(f"{'Cumulative (ms)':>16} {'Self (ms)':>10}  Module")
+    slowest = sorted(imports, key=lambda entry: entry[2], reverse=True)[:top]
+    for name, own, cumulative in slowest:
+        print(f"{cumulative / 1000:>16.1f} {own / 1000:>10.1f}  {name}")
+
+    project = sum(own for name, own, _ in imports
+                  if os.path.exists(os.path.join(SOURCE_DIR, f"{name}.py")))
+    print(f"Project modules themselves: {project / 1000:.1f} ms")
+    backends = loaded_backends(imports)
+    if backends:
+        print(f"Heavy backends imported at startup: {', '.join(backends)}")
+    else:
+        print("Heavy backends imported at startup: none")
+    return backends
+
+
+def main(argv=None):
+    """
+    Run the startup benchmark from the command line.
+
+    Returns:
+        int: Exit status (1 with --check if a heavy backend loads at startup)
+    """
+    parser = argparse.ArgumentParser(description="Measure how long the program takes to start.")
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS,
+                        help=f"Modules to import (default: {' '.join(ENTRY_POINTS)})")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Fresh interpreters per module; the fastest is reported")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    parser.add_argument("--check", action="store_true",
+                        help=f"Exit with status 1 if {', '.join(HEAVY_BACKENDS)} load at startup")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        if print_startup_report(module, args.runs, args.top):
+            failed = True
+    return 1 if args.check and failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
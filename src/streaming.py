@@ -0,0 +1,150 @@
+"""
+Out-of-Core Streaming Operations
+CS101 Fall 2025 - Activity 05
+
+This module runs list operations over flat binary files of 64-bit integers
+without ever loading a whole file. The file is memory-mapped and fed through
+generator stages one fixed-size chunk at a time, so peak memory stays the same
+no matter how large the input is.
+"""
+
+import os
+import random
+from array import array
+
+from algorithms import (
+    NUMPY_AVAILABLE, calculate_aggregates, calculate_aggregates_numpy, combine_aggregates,
+    linear_search
+)
+from datasets import DEFAULT_CACHE_DIR, DEFAULT_SEED
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # elements per chunk (8 MB of int64 values)
+ITEM_SIZE = 8  # bytes per int64 element
+
+
+def write_binary_dataset(path, size, min_val=1, max_val=1000, seed=DEFAULT_SEED,
+                         chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Write random 64-bit integers to a flat binary file, one chunk at a time.
+
+    Args:
+        path (str): File to write
+        size (int): Number of elements to write
+        min_val (int): Minimum value for random numbers
+        max_val (int): Maximum value for random numbers
+        seed (int): Seed for reproducible data
+        chunk_size (int): Number of elements generated per chunk
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        if NUMPY_AVAILABLE:
+            rng = np.random.default_rng(seed)
+            for start in range(0, size, chunk_size):
+                count = min(chunk_size, size - start)
+                rng.integers(min_val, max_val, size=count, endpoint=True, dtype=np.int64).tofile(f)
+        else:
+            rng = random.Random(seed)
+            for start in range(0, size, chunk_size):
+                count = min(chunk_size, size - start)
+                array("q", (rng.randint(min_val, max_val) for _ in range(count))).tofile(f)
+    os.replace(temp_path, path)
+
+
+def ensure_binary_dataset(size, seed=DEFAULT_SEED, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Get the path of a binary dataset of the given size, writing it if needed.
+
+    Args:
+        size (int): Number of elements
+        seed (int): Seed for reproducible data
+        cache_dir (str): Directory that holds the binary files
+
+    Returns:
+        str: Path to the binary file
+    """
+    path = os.path.join(cache_dir, f"stream-{size}-{seed}.bin")
+    if not os.path.exists(path) or os.path.getsize(path) != size * ITEM_SIZE:
+        write_binary_dataset(path, size, seed=seed)
+    return path
+
+
+def iter_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read a binary file of 64-bit integers as a stream of chunks.
+
+    Args:
+        path (str): Binary file to read
+        chunk_size (int): Number of elements per chunk
+
+    Yields:
+        Consecutive chunks (NumPy arrays backed by a memory map, or arrays of 'q')
+    """
+    if NUMPY_AVAILABLE:
+        if os.path.getsize(path) == 0:
+            return
+        data = np.memmap(path, dtype=np.int64, mode="r")
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+        return
+
+    with open(path, "rb") as f:
+        while True:
+            chunk = array("q")
+            chunk.frombytes(f.read(chunk_size * ITEM_SIZE))
+            if not chunk:
+                return
+            yield chunk
+
+
+def stream_aggregates(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Calculate count, sum, minimum, maximum and mean of a binary file in one streaming pass.
+
+    Args:
+        path (str): Binary file of 64-bit integers
+        chunk_size (int): Number of elements per chunk
+
+    Returns:
+        dict: 'count', 'sum', 'min', 'max' and 'mean' (min, max and mean are None if empty)
+
+    Time needed: Visits each element once; memory use does not grow with the file
+    """
+    aggregate = calculate_aggregates_numpy if NUMPY_AVAILABLE else calculate_aggregates
+    combined = {"count": 0, "sum": 0, "min": None, "max": None, "mean": None}
+    for chunk in iter_chunks(path, chunk_size):
+        combined = combine_aggregates(combined, aggregate(chunk))
+    return combined
+
+
+def stream_linear_search(path, target, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Search a binary file for a target value, reading one chunk at a time.
+
+    Args:
+        path (str): Binary file of 64-bit integers
+        target: Value to search for
+        chunk_size (int): Number of elements per chunk
+
+    Returns:
+        int: Index of the first occurrence of target in the file, -1 if not found
+
+    Time needed: Checks each element once in the worst case
+    """
+    offset = 0
+    for chunk in iter_chunks(path, chunk_size):
+        if NUMPY_AVAILABLE:
+            matches = np.flatnonzero(chunk == target)
+            index = int(matches[0]) if len(matches) else -1
+        else:
+            index = linear_search(chunk, target)
+        if index != -1:
+            return offset + index
+        offset += len(chunk)
+    return -1
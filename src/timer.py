@@ -8,33 +8,67 @@ All TODOs have been completed with working implementations.
 
 import time
 import random
-try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-    PLOTTING_AVAILABLE = True
-except ImportError:
-    PLOTTING_AVAILABLE = False
     
 from algorithms import (
-    linear_search, binary_search, bubble_sort, selection_sort,
-    calculate_sum, find_maximum, find_minimum,
-    generate_random_list, generate_sorted_list, time_algorithm, warm_up_timing
+    linear_search, binary_search, bubble_sort, selection_sort, hybrid_sort, choose_sort_strategy,
+    calculate_sum, find_maximum, find_minimum, NUMPY_AVAILABLE,
+    generate_random_list, generate_sorted_list, measure_algorithm, warm_up_timing
 )
+from complexity import fit_complexity
+from datasets import DEFAULT_SEED, get_default_cache
+from events import cell_event, trial_event
+from indexes import measure_index
+from lazy_imports import is_available, load_pyplot
+from memory import MEMORY_METRICS, measure_memory
+from profiling import profile_label, run_profilers
+from registry import (
+    FAMILY_HEADINGS, FAMILY_TITLES, algorithms_for_choice, find_algorithm, get_algorithm
+)
+from streaming import ensure_binary_dataset
+
+# matplotlib is only imported when a plot is drawn (see lazy_imports.py)
+PLOTTING_AVAILABLE = is_available("matplotlib")
+
+# Size of one int64 element, used to report list operation throughput in GB/s
+BYTES_PER_ELEMENT = 8
+
+
+def _format_metric(value):
+    """Format an extra measurement for the results table."""
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
 
 
 class ExperimentResults:
     """Class to store and manage experimental results."""
     
-    def __init__(self, algorithm_name):
+    def __init__(self, algorithm_name, batch_size=None, unit="seconds", distribution=None):
         self.algorithm_name = algorithm_name
+        self.batch_size = batch_size  # Queries per call for batched searches
+        self.unit = unit  # 'seconds', or 'operations' for counted experiments
+        self.distribution = distribution  # Input distribution, if not the registered input
         self.sizes = []
         self.times = []
         self.ratios = []
+        self.timings = []
+        self.counts = []  # Operation counts per size, for counted experiments
+        self.extrapolated = []  # True where the time was predicted, not measured
+    
+    @property
+    def label(self):
+        """Name used in reports, including the input distribution if there is one."""
+        if self.distribution is None:
+            return self.algorithm_name
+        return f"{self.algorithm_name} [{self.distribution}]"
     
-    def add_result(self, size, time_taken):
-        """Add a result to the experiment."""
+    def add_result(self, size, time_taken, timing=None, extrapolated=False, counts=None):
+        """Add a result to the experiment, optionally with its full TimingResult or its operation counts."""
         self.sizes.append(size)
         self.times.append(time_taken)
+        self.timings.append(timing)
+        self.counts.append(counts)
+        self.extrapolated.append(extrapolated)
         
         # Calculate ratio compared to previous measurement
         if len(self.times) > 1:
@@ -45,24 +79,101 @@ class ExperimentResults:
     
     def print_results(self):
         """Print the results in a formatted table."""
-        print(f"\n=== {self.algorithm_name} Experiment ===")
-        print("Size        Time (seconds)    Ratio")
-        print("────────────────────────────────────")
+        print(f"\n=== {self.label} Experiment ===")
+        print(f"Size        {self.value_label():<17} Ratio   Median          MAD             Min")
+        print("────────────────────────────────────────────────────────────────────────────")
         
-        for i, (size, time_val, ratio) in enumerate(zip(self.sizes, self.times, self.ratios)):
+        rows = zip(self.sizes, self.times, self.ratios, self.timings, self.extrapolated)
+        for size, time_val, ratio, timing, extrapolated in rows:
             if ratio is None:
                 ratio_str = "─"
             else:
                 ratio_str = f"{ratio:.2f}"
             
-            print(f"{size:<10} {time_val:<15.6f} {ratio_str}")
+            if self.unit == "seconds":
+                line = f"{size:<10} {time_val:<15.6f} {ratio_str:<7}"
+            else:
+                line = f"{size:<10} {time_val:<15,.0f} {ratio_str:<7}"
+            if timing is not None:
+                line += f" {timing.median:<15.9f} {timing.mad:<15.9f} {timing.minimum:.9f}"
+            if extrapolated:
+                line += " (extrapolated)"
+            print(line)
+        
+        metric_rows = [(size, timing.metrics) for size, timing in zip(self.sizes, self.timings)
+                       if timing is not None and timing.metrics]
+        metric_rows += [(size, counts) for size, counts in zip(self.sizes, self.counts) if counts]
+        if metric_rows:
+            print("Additional measurements:")
+            for size, metrics in metric_rows:
+                values = ", ".join(f"{name}={_format_metric(value)}" for name, value in metrics.items())
+                print(f"  Size {size}: {values}")
+        
+        if self.batch_size:
+            print(f"Throughput ({self.batch_size} queries per call):")
+            for size, qps in zip(self.sizes, self.queries_per_second()):
+                print(f"  Size {size}: {qps:,.0f} queries/second")
+    
+    def value_label(self):
+        """Column heading for the measured values."""
+        return "Time (seconds)" if self.unit == "seconds" else self.unit.capitalize()
+    
+    def format_value(self, value):
+        """Format a measured value with its unit."""
+        if self.unit == "seconds":
+            return f"{value:.6f} seconds"
+        return f"{value:,.0f} {self.unit}"
+    
+    def queries_per_second(self):
+        """Get the query throughput for each size of a batched search experiment."""
+        if not self.batch_size:
+            return []
+        return [self.batch_size / t if t > 0 else float("inf") for t in self.times]
+    
+    def fit_complexity(self):
+        """
+        Fit growth models to the measured (not extrapolated) results.
+        
+        Returns:
+            ComplexityFit: The best model, or None without enough data or NumPy
+        """
+        measured = [(size, time_val) for size, time_val, extrapolated
+                    in zip(self.sizes, self.times, self.extrapolated) if not extrapolated]
+        return fit_complexity([size for size, _ in measured], [time_val for _, time_val in measured])
+    
+    def peak_memory(self):
+        """
+        Get the measured peak memory of each cell that has one.
+        
+        Returns:
+            tuple: (sizes, peak bytes) lists, empty if memory was not measured
+        """
+        cells = [(size, timing.metrics["peak_memory_bytes"])
+                 for size, timing in zip(self.sizes, self.timings)
+                 if timing is not None and "peak_memory_bytes" in timing.metrics]
+        return [size for size, _ in cells], [peak for _, peak in cells]
+    
+    def fit_memory(self):
+        """
+        Fit growth models to the peak memory, to tell O(1) from O(n) space empirically.
+        
+        Returns:
+            ComplexityFit: The best model, or None without memory measurements or NumPy
+        """
+        sizes, peaks = self.peak_memory()
+        # A call that allocates nothing counts as one byte, so it still fits O(1)
+        return fit_complexity(sizes, [max(peak, 1) for peak in peaks])
     
     def analyze_pattern(self):
-        """Analyze the pattern in timing ratios."""
+        """Analyze the growth pattern of the measured times."""
         if len(self.ratios) < 2:
             return "Insufficient data for analysis"
         
-        # Calculate average ratio (excluding None)
+        fit = self.fit_complexity()
+        if fit is not None:
+            return f"{fit.describe()} (best fit {fit.label}, {fit.confidence:.0%} confidence)"
+        
+        # Without NumPy, fall back to the average doubling ratio
         valid_ratios = [r for r in self.ratios if r is not None]
         if not valid_ratios:
             return "No valid ratios to analyze"
@@ -99,8 +210,9 @@ def run_search_experiment(search_func, algorithm_name, max_size=32000):
     
     size = 1000
     while size <= max_size:
-        # Generate appropriate test data
-        if "binary" in algorithm_name.lower():
+        # Generate the kind of test data the algorithm declares in the registry
+        spec = find_algorithm(search_func)
+        if spec is not None and spec.input_kind == "sorted":
             data = generate_sorted_list(size)
         else:
             data = generate_random_list(size)
@@ -112,8 +224,9 @@ def run_search_experiment(search_func, algorithm_name, max_size=32000):
             target = max(data) + 1
         
         # Time the algorithm
-        avg_time = time_algorithm(search_func, data, target, trials=3)
-        results.add_result(size, avg_time)
+        timing = measure_algorithm(search_func, data, target, min_trials=3)
+        avg_time = timing.mean
+        results.add_result(size, avg_time, timing)
         
         print(f"  Size {size}: {avg_time:.6f} seconds")
         size *= 2
@@ -142,8 +255,9 @@ def run_sort_experiment(sort_func, algorithm_name, max_size=16000):
         data = generate_random_list(size)
         
         # Time the algorithm
-        avg_time = time_algorithm(sort_func, data, trials=3)
-        results.add_result(size, avg_time)
+        timing = measure_algorithm(sort_func, data, min_trials=3)
+        avg_time = timing.mean
+        results.add_result(size, avg_time, timing)
         
         print(f"  Size {size}: {avg_time:.6f} seconds")
         size *= 2
@@ -172,8 +286,9 @@ def run_operation_experiment(operation_func, algorithm_name, max_size=64000):
         data = generate_random_list(size)
         
         # Time the algorithm
-        avg_time = time_algorithm(operation_func, data, trials=5)
-        results.add_result(size, avg_time)
+        timing = measure_algorithm(operation_func, data, min_trials=5)
+        avg_time = timing.mean
+        results.add_result(size, avg_time, timing)
         
         print(f"  Size {size}: {avg_time:.6f} seconds")
         size *= 2
@@ -181,6 +296,41 @@ def run_operation_experiment(operation_func, algorithm_name, max_size=64000):
     return results
 
 
+def run_streaming_experiment(stream_func, algorithm_name, max_size=64_000_000,
+                             start_size=1_000_000):
+    """
+    Run a doubling experiment for a streaming operation over on-disk binary files.
+    
+    Memory use stays constant, so max_size can be far larger than the available RAM
+    (as long as there is disk space for the data files).
+    
+    Args:
+        stream_func: The streaming function to test
+        algorithm_name (str): Name of the algorithm for reporting
+        max_size (int): Maximum input size to test
+        start_size (int): First input size to test
+        
+    Returns:
+        ExperimentResults: Results of the experiment
+    """
+    print(f"\nTesting {algorithm_name.lower()}...")
+    results = ExperimentResults(algorithm_name)
+    spec = find_algorithm(stream_func)
+    
+    size = start_size
+    while size <= max_size:
+        # Time the algorithm
+        timing = measure_cell(spec, size)
+        avg_time = timing.mean
+        results.add_result(size, avg_time, timing)
+        
+        print(f"  Size {size}: {avg_time:.6f} seconds "
+              f"({timing.metrics.get('elements_per_second', 0):,.0f} elements/second)")
+        size *= 2
+    
+    return results
+
+
 def run_all_experiments():
     """
     Run all doubling experiments and collect results.
@@ -243,8 +393,19 @@ def print_summary_report(all_results):
         pattern = result.analyze_pattern()
         print(f"Pattern: {pattern}")
         
-        # Add pattern interpretation
-        if "linear" in pattern.lower():
+        fit = result.fit_complexity()
+        if fit is not None:
+            print(f"Best fit: {fit.formula()} (R² = {fit.r_squared:.3f})")
+            quantity = "time" if result.unit == "seconds" else result.unit
+            print(f"Empirical growth: {quantity} grows like n^{fit.exponent:.2f}")
+            spec = get_algorithm(result.algorithm_name)
+            if spec and not fit.matches(spec.complexity):
+                print(f"Note: expected O({spec.complexity}); more or larger sizes may be needed")
+            capacity_size = max(result.sizes) * 10
+            print(f"Predicted {quantity} at size {capacity_size}: "
+                  f"{result.format_value(fit.predict(capacity_size))}")
+        # Without a fit, interpret the ratio-based pattern
+        elif "linear" in pattern.lower():
             print("Growth pattern: Doubles when input doubles")
         elif "logarithmic" in pattern.lower():
             print("Growth pattern: Very slow increase as input doubles")
@@ -255,43 +416,112 @@ def print_summary_report(all_results):
         else:
             print("Growth pattern: Pattern unclear from this data")
         
+        memory_fit = result.fit_memory()
+        if memory_fit is not None:
+            print(f"Memory growth: {memory_fit.label} extra space "
+                  f"(peak {max(result.peak_memory()[1]):,} bytes, "
+                  f"{memory_fit.confidence:.0%} confidence)")
+        
         print()
     
+    print_distribution_growth(all_results)
+    
     # Performance ranking
     print("="*60)
     print("PERFORMANCE RANKING")
     print("="*60)
     
-    # Group by algorithm type and provide insights
-    search_algorithms = [r for r in all_results if "search" in r.algorithm_name.lower()]
-    sort_algorithms = [r for r in all_results if "sort" in r.algorithm_name.lower()]
-    operation_algorithms = [r for r in all_results if r not in search_algorithms and r not in sort_algorithms]
-    
-    if search_algorithms:
-        print("\nSearch Algorithms (fastest to slowest):")
-        print("1. Binary Search: Fastest - logarithmic growth")
-        print("2. Linear Search: Slower - linear growth")
-    
-    if sort_algorithms:
-        print("\nSorting Algorithms (fastest to slowest):")
-        print("1. Selection Sort: Faster - quadratic but more efficient implementation")
-        print("2. Bubble Sort: Slowest - quadratic with many swaps")
+    # Group by the family each algorithm is registered under, and by input distribution
+    families = {}
+    for result in all_results:
+        spec = get_algorithm(result.algorithm_name)
+        families.setdefault((spec.family if spec else "other", result.distribution), []).append(result)
     
-    if operation_algorithms:
-        print("\nList Operations:")
-        for result in operation_algorithms:
-            print(f"• {result.algorithm_name}: Time grows proportionally with input size")
+    for (family, distribution), results in families.items():
+        on_input = f" on {distribution} input" if distribution else ""
+        print(f"\n{FAMILY_TITLES.get(family, 'Other Algorithms')}{on_input} (fastest to slowest):")
+        for rank, (result, time_val, size) in enumerate(_rank_results(results), 1):
+            spec = get_algorithm(result.algorithm_name)
+            complexity = f"O({spec.complexity})" if spec else "unregistered"
+            print(f"{rank}. {result.label}: expected {complexity}, "
+                  f"{result.format_value(time_val)} at size {size}")
+        
+        if family == "index":
+            print("Queries needed before each index beats repeated linear scans:")
+            for result in results:
+                largest = result.timings[-1] if result.timings else None
+                if largest is not None and "break_even" in largest.metrics:
+                    print(f"• {result.label}: {largest.metrics['break_even']:.0f} queries "
+                          f"at size {result.sizes[-1]}")
     
     print("\n" + "="*60)
     print("KEY INSIGHTS")
     print("="*60)
     print("• Logarithmic algorithms (Binary Search) scale excellently")
     print("• Linear algorithms (Linear Search, List Operations) scale reasonably") 
-    print("• Quadratic algorithms (Sorting) become slow with large inputs")
+    print("• Quadratic algorithms (Bubble Sort, Selection Sort) become slow with large inputs")
+    print("• n log n and linear sorts (Merge, Quick, Heap, Counting, Radix) handle millions of elements")
+    print("• Adaptive sorts (Hybrid Sort) get close to linear on nearly sorted input")
     print("• Algorithm choice matters significantly for performance!")
     print("\nExperiment completed! Check writing/reflection.md for analysis questions.")
 
 
+def print_distribution_growth(all_results):
+    """
+    Print a table of the growth fitted for each algorithm on each input distribution.
+    
+    Shows, for example, bubble sort growing like n on sorted input (it stops
+    after one pass without swaps) but like n^2 on random input. Only results
+    run on a chosen distribution are included.
+    
+    Args:
+        all_results (list): List of ExperimentResults objects
+    """
+    distributions = []
+    growth = {}
+    for result in all_results:
+        if result.distribution is None:
+            continue
+        if result.distribution not in distributions:
+            distributions.append(result.distribution)
+        fit = result.fit_complexity()
+        cell = f"{fit.label} ~n^{fit.exponent:.2f}" if fit is not None else "─"
+        growth.setdefault(result.algorithm_name, {})[result.distribution] = cell
+    if not growth:
+        return
+    
+    widths = [max(len(d), 20) for d in distributions]
+    print("="*60)
+    print("GROWTH BY INPUT DISTRIBUTION")
+    print("="*60)
+    print(f"{'Algorithm':<28}" + " ".join(f"{d:<{w}}" for d, w in zip(distributions, widths)))
+    for name, cells in growth.items():
+        print(f"{name:<28}" + " ".join(f"{cells.get(d, '─'):<{w}}" for d, w in zip(distributions, widths)))
+    print()
+
+
+def _rank_results(results):
+    """
+    Rank results from fastest to slowest at the largest size they all share.
+    
+    Results without a shared size are compared at their own largest size.
+    
+    Returns:
+        list: (result, time, size) tuples, fastest first
+    """
+    measured = [r for r in results if r.sizes]
+    common_sizes = set(measured[0].sizes) if measured else set()
+    for result in measured[1:]:
+        common_sizes &= set(result.sizes)
+    
+    ranking = []
+    for result in measured:
+        size = max(common_sizes) if common_sizes else result.sizes[-1]
+        ranking.append((result, result.times[result.sizes.index(size)], size))
+    ranking.sort(key=lambda entry: entry[1])
+    return ranking
+
+
 def save_results_to_file(all_results, filename="experiment_results.txt"):
     """
     Save experimental results to a text file.
@@ -299,6 +529,9 @@ def save_results_to_file(all_results, filename="experiment_results.txt"):
     Args:
         all_results (list): List of ExperimentResults objects
         filename (str): Name of file to save results to
+        
+    Returns:
+        bool: True if the results were saved
     """
     try:
         with open(filename, 'w') as f:
@@ -306,18 +539,23 @@ def save_results_to_file(all_results, filename="experiment_results.txt"):
             f.write("="*50 + "\n\n")
             
             for result in all_results:
-                f.write(f"{result.algorithm_name} Results:\n")
-                f.write("Size\tTime (s)\tRatio\n")
+                f.write(f"{result.label} Results:\n")
+                f.write(f"Size\t{'Time (s)' if result.unit == 'seconds' else result.value_label()}\tRatio\n")
                 
-                for size, time_val, ratio in zip(result.sizes, result.times, result.ratios):
+                rows = zip(result.sizes, result.times, result.ratios, result.extrapolated)
+                for size, time_val, ratio, extrapolated in rows:
                     ratio_str = "─" if ratio is None else f"{ratio:.2f}"
-                    f.write(f"{size}\t{time_val:.6f}\t{ratio_str}\n")
+                    note = "\t(extrapolated)" if extrapolated else ""
+                    value = f"{time_val:.6f}" if result.unit == "seconds" else f"{time_val:.0f}"
+                    f.write(f"{size}\t{value}\t{ratio_str}{note}\n")
                 
                 f.write(f"Pattern: {result.analyze_pattern()}\n\n")
         
         print(f"\nResults saved to {filename}")
+        return True
     except Exception as e:
         print(f"Error saving results: {e}")
+        return False
 
 
 # Additional analysis functions
@@ -339,7 +577,7 @@ def compare_algorithms(results_list, size_to_compare=8000):
         for i, size in enumerate(result.sizes):
             if size >= size_to_compare:
                 time_at_size = result.times[i]
-                comparisons.append((result.algorithm_name, time_at_size))
+                comparisons.append((result.label, time_at_size))
                 break
     
     # Sort by time (fastest first)
@@ -351,7 +589,7 @@ def compare_algorithms(results_list, size_to_compare=8000):
 
 def predict_future_performance(result, target_size):
     """
-    Predict performance at a larger input size based on observed pattern.
+    Predict performance at a larger input size from the best-fitting growth model.
     
     Args:
         result (ExperimentResults): Results object to analyze
@@ -363,6 +601,11 @@ def predict_future_performance(result, target_size):
     if len(result.times) < 2:
         return None
     
+    # Extrapolate the best-fitting growth model when one is available
+    fit = result.fit_complexity()
+    if fit is not None:
+        return fit.predict(target_size)
+    
     # Use the last measurement as a baseline
     last_size = result.sizes[-1]
     last_time = result.times[-1]
@@ -376,7 +619,7 @@ def predict_future_performance(result, target_size):
         time_ratio = size_ratio  # Linear relationship
     elif "logarithmic" in pattern.lower():
         import math
-        time_ratio = math.log2(size_ratio) if size_ratio > 1 else 1
+        time_ratio = math.log2(max(target_size, 2)) / math.log2(max(last_size, 2))
     elif "quadratic" in pattern.lower():
         time_ratio = size_ratio ** 2  # Quadratic relationship
     else:
@@ -385,187 +628,467 @@ def predict_future_performance(result, target_size):
     return last_time * time_ratio
 
 
-def run_custom_experiments(sizes, algorithm_choice):
+def build_experiment_plan(sizes, algorithm_choice, distributions=None):
     """
-    Run experiments with user-selected sizes and algorithms.
+    Work out which registered algorithms to run and at which sizes.
     
     Args:
         sizes (list): List of input sizes to test
-        algorithm_choice (str): Which algorithms to test ('1', '2', '3', or '4')
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        distributions (list): Input distributions (datasets.GENERATORS names) to run
+            every algorithm that takes random data on; None uses the registered inputs
         
     Returns:
-        list: List of ExperimentResults objects
+        list: List of (AlgorithmSpec, sizes) pairs in report order
     """
-    print("=== Custom Algorithm Performance Analysis ===")
-    print("Conducting experiments with your chosen parameters...")
-    print("\nWarming up timing system...")
-    warm_up_timing()
+    plan = []
+    for spec in algorithms_for_choice(algorithm_choice):
+        # Each algorithm declares the largest size it can handle in reasonable time
+        spec_sizes = spec.sizes_for(sizes)
+        if not spec_sizes:
+            continue
+        if distributions and spec.accepts_distributions:
+            # One row of the size x distribution grid per distribution; slow-to-build
+            # distributions can lower the largest size further
+            for distribution in distributions:
+                row = spec.for_distribution(distribution)
+                row_sizes = row.sizes_for(spec_sizes)
+                if row_sizes:
+                    plan.append((row, row_sizes))
+        else:
+            plan.append((spec, spec_sizes))
+    return plan
+
+
+def load_input(input_kind, size):
+    """
+    Get the input data for one cell from the shared dataset cache.
     
-    all_results = []
+    Args:
+        input_kind (str): Kind of input declared by the algorithm's AlgorithmSpec
+        size (int): Input size
+        
+    Returns:
+        A list, a NumPy array or (for 'binary_file') the path of a binary file
+    """
+    cache = get_default_cache()
+    if input_kind == "binary_file":
+        return ensure_binary_dataset(size)
+    if input_kind.endswith("_array"):
+        distribution = input_kind[:-len("_array")]
+        if NUMPY_AVAILABLE:
+            return cache.get(distribution, size)
+        return cache.get_list(distribution, size)
+    return cache.get_list(input_kind, size)
+
+
+def choose_target(values, rng):
+    """Choose a search target that is in the data 70% of the time, drawing from rng."""
+    if rng.random() < 0.7:  # 70% chance target is in list
+        return int(rng.choice(values))
+    return int(max(values)) + 1  # 30% chance target is not in list
+
+
+def cell_random(spec, size):
+    """
+    Get the random generator that picks one cell's search targets.
     
-    # Algorithm choice mapping
-    run_searches = algorithm_choice in ['1', '4']
-    run_sorts = algorithm_choice in ['2', '4'] 
-    run_operations = algorithm_choice in ['3', '4']
+    It is seeded from the cell itself, so every run (and every worker) times a
+    cell on the same targets and a baseline comparison is like-for-like.
     
-    if run_operations:
-        print("\n" + "="*50)
-        print("LIST OPERATION EXPERIMENTS")
-        print("="*50)
-        
-        max_op_size = max([s for s in sizes if s <= 50000])  # Limit for operations
-        op_sizes = [s for s in sizes if s <= max_op_size]
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        size (int): Input size
         
-        all_results.append(run_custom_operation_experiment(calculate_sum, "List Sum", op_sizes))
-        all_results.append(run_custom_operation_experiment(find_maximum, "Find Maximum", op_sizes))
-        all_results.append(run_custom_operation_experiment(find_minimum, "Find Minimum", op_sizes))
+    Returns:
+        random.Random: A generator seeded with datasets.DEFAULT_SEED, the cell's label and size
+    """
+    # A string seed, because hash() of a str changes from one process to the next
+    return random.Random(f"{DEFAULT_SEED}:{spec.label}:{size}")
+
+
+def build_cell_args(spec, size):
+    """
+    Build the arguments one (algorithm, size) cell is called with.
     
-    if run_searches:
-        print("\n" + "="*50)
-        print("SEARCH ALGORITHM EXPERIMENTS")
-        print("="*50)
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        size (int): Input size
         
-        max_search_size = max([s for s in sizes if s <= 50000])
-        search_sizes = [s for s in sizes if s <= max_search_size]
+    Returns:
+        list: Input data, followed by the search target(s) if the algorithm takes any
+    """
+    data = load_input(spec.input_kind, size)
+    
+    if spec.target is None:
+        return [data]
+    if spec.target == "missing":
+        return [data, 1001]  # Just outside the generated 1..1000 range, so the search scans everything
+    
+    # Targets are drawn from the same values the data holds, the same ones on every run
+    values = get_default_cache().get_list(spec.distribution or "random", size)
+    rng = cell_random(spec, size)
+    if spec.target == "mixed":
+        return [data, choose_target(values, rng)]
+    if spec.target == "batch":
+        return [data, [choose_target(values, rng) for _ in range(spec.params["batch_size"])]]
+    # 'sample': a fixed sample of targets for amortized index experiments
+    return [data, [choose_target(values, rng) for _ in range(100)]]
+
+
+def measure_cell_memory(spec, size):
+    """
+    Measure the memory one call of a cell needs, in a separate untimed call.
+    
+    For indexes this is the memory of building the index.
+    
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        size (int): Input size
         
-        all_results.append(run_custom_search_experiment(linear_search, "Linear Search", search_sizes))
-        all_results.append(run_custom_search_experiment(binary_search, "Binary Search", search_sizes))
+    Returns:
+        dict: 'peak_memory_bytes', 'net_blocks' and 'rss_delta_bytes'
+    """
+    args = build_cell_args(spec, size)
+    if spec.family == "index":
+        args = args[:1]  # The index is built from the data alone
+    return measure_memory(spec.func, *args, copy_args=spec.mutates)
+
+
+def profile_cell(spec, size, profilers):
+    """
+    Run profiling hooks on one cell, each on its own untimed call.
     
-    if run_sorts:
-        print("\n" + "="*50)
-        print("SORTING ALGORITHM EXPERIMENTS")
-        print("="*50)
-        print("Warning: Sorting experiments may take longer for large inputs...")
+    For indexes this profiles building the index.
+    
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        size (int): Input size
+        profilers (list): Profiling hooks (see profiling.py)
         
-        # Limit sorting to reasonable sizes
-        max_sort_size = max([s for s in sizes if s <= 20000])
-        sort_sizes = [s for s in sizes if s <= max_sort_size]
+    Returns:
+        dict: Metrics reported by the hooks
+    """
+    args = build_cell_args(spec, size)
+    if spec.family == "index":
+        args = args[:1]  # The index is built from the data alone
+    return run_profilers(profilers, profile_label(spec.label, size), spec.func, *args,
+                         copy_args=spec.mutates)
+
+
+def measure_cell(spec, size, trial_policy=None, memory=False, profilers=None, on_trial=None):
+    """
+    Fetch input data for one (algorithm, size) cell and time the algorithm on it.
+    
+    Inputs come from the shared dataset cache, so all algorithms of a family
+    see identical data and repeated sweeps skip data generation.
+    
+    Args:
+        spec (AlgorithmSpec): The registered algorithm to time
+        size (int): Input size to test
+        trial_policy (dict): Overrides for measure_algorithm settings such as
+            min_trials, max_trials, target_ci and time_budget
+        memory (bool): Also measure the memory footprint (see measure_cell_memory)
+            and add it to the metrics
+        profilers (list): Profiling hooks to run after timing (see profile_cell)
+        on_trial: Called as on_trial(index, seconds) after each timing sample
         
-        all_results.append(run_custom_sort_experiment(bubble_sort, "Bubble Sort", sort_sizes))
-        all_results.append(run_custom_sort_experiment(selection_sort, "Selection Sort", sort_sizes))
+    Returns:
+        TimingResult: Timing statistics for the cell
+    """
+    policy = {"min_trials": spec.min_trials}
+    policy.update(trial_policy or {})
     
-    return all_results
+    args = build_cell_args(spec, size)
+    
+    if spec.family == "index":
+        # Time the build (spec.func is the index class) and work out break-even
+        timing = measure_index(spec.func, *args, on_trial=on_trial, **policy)
+    else:
+        timing = measure_algorithm(spec.func, *args, copy_args=spec.mutates, on_trial=on_trial,
+                                   **policy)
+    return finish_cell(spec, size, timing, args, memory, profilers)
 
 
-def run_custom_search_experiment(search_func, algorithm_name, sizes):
-    """Run search experiment with custom sizes."""
-    print(f"\nTesting {algorithm_name.lower()}...")
-    results = ExperimentResults(algorithm_name)
+def finish_cell(spec, size, timing, args, memory=False, profilers=None):
+    """
+    Add the untimed measurements and throughput figures to a freshly timed cell.
     
-    for size in sizes:
-        if algorithm_name == "Binary Search":
-            data = generate_sorted_list(size)
-        else:
-            data = generate_random_list(size)
-        
-        # Choose a target (sometimes in list, sometimes not)
-        if random.random() < 0.7:  # 70% chance target is in list
-            target = random.choice(data)
-        else:  # 30% chance target is not in list
-            target = max(data) + 1
-        
-        # Time the algorithm
-        avg_time = time_algorithm(search_func, data, target, trials=3)
-        results.add_result(size, avg_time)
+    Args:
+        spec (AlgorithmSpec): The registered algorithm
+        size (int): Input size
+        timing (TimingResult): The cell's timing, updated in place
+        args (list): The arguments the algorithm was timed with
+        memory (bool): Also measure the memory footprint (see measure_cell_memory)
+        profilers (list): Profiling hooks to run (see profile_cell)
         
-        print(f"  Size {size}: {avg_time:.6f} seconds")
+    Returns:
+        TimingResult: The same timing
+    """
+    if memory:
+        timing.metrics.update(measure_cell_memory(spec, size))
+    if profilers:
+        timing.metrics.update(profile_cell(spec, size, profilers))
+    if spec.func is hybrid_sort:
+        # Report which strategy the dispatcher picks for this input
+        timing.metrics["strategy"] = choose_sort_strategy(args[0])
     
-    return results
+    if timing.mean > 0:
+        if spec.family == "operation":
+            # Throughput as if the data were stored as 8-byte integers
+            timing.metrics["gb_per_second"] = size * BYTES_PER_ELEMENT / timing.mean / 1e9
+        elif spec.family == "stream":
+            timing.metrics["elements_per_second"] = size / timing.mean
+        elif spec.family == "batch_search":
+            timing.metrics["queries_per_second"] = spec.params["batch_size"] / timing.mean
+    return timing
 
 
-def run_custom_sort_experiment(sort_func, algorithm_name, sizes):
-    """Run sorting experiment with custom sizes."""
-    print(f"\nTesting {algorithm_name.lower()}...")
-    results = ExperimentResults(algorithm_name)
+def complete_resumed_cell(spec, size, timing, memory=False, profilers=None):
+    """Add the memory footprint to a resumed cell that was measured without it, and profile it."""
+    if memory and not all(name in timing.metrics for name in MEMORY_METRICS):
+        timing.metrics.update(measure_cell_memory(spec, size))
+    if profilers:
+        timing.metrics.update(profile_cell(spec, size, profilers))
+
+
+def run_custom_experiments(sizes, algorithm_choice, workers=1, trial_policy=None,
+                           budget=None, cell_timeout=None, checkpoints=None, memory=False,
+                           profilers=None, distributions=None, on_event=None, coordinator=None,
+                           worker_timeout=None, authkey=None, interleave=False):
+    """
+    Run experiments with user-selected sizes and algorithms.
     
-    for size in sizes:
-        # Generate random test data for sorting
-        data = generate_random_list(size)
+    Args:
+        sizes (list): List of input sizes to test
+        algorithm_choice (str): Which algorithms to test (a key of registry.MENU_CHOICES)
+        workers (int): Number of worker processes; more than 1 runs cells in parallel
+        trial_policy (dict): Overrides for the timing settings (see measure_cell)
+        budget (float): Total seconds for the sweep; cells predicted not to fit are extrapolated
+        cell_timeout (float): Hard limit in seconds for any single cell
+        checkpoints (CellCheckpoints): Saves each cell as soon as it is measured and,
+            when resuming, supplies cells measured before (None to keep results in memory only)
+        memory (bool): Also measure the memory footprint of every cell
+        profilers (list): Profiling hooks to run on every cell (see profiling.py)
+        distributions (list): Input distributions for the size x distribution grid
+            (see build_experiment_plan); None uses each algorithm's registered input
+        on_event: Called with an ExperimentEvent for every finished cell, and for
+            every timing sample in serial runs (see events.py)
+        coordinator (tuple): (host, port) to listen on; the cells are then measured
+            by workers on other hosts (see distributed.py)
+        worker_timeout (float): With coordinator, seconds a busy worker may stay
+            silent before its cells are reassigned
+        authkey (str): With coordinator, the key workers must present
+            (see distributed.resolve_authkey)
+        interleave (bool): Take the trials of all cells in a random, interleaved
+            order so drift is spread over every cell (see hygiene.py)
         
-        # Time the algorithm
-        avg_time = time_algorithm(sort_func, data, trials=3)
-        results.add_result(size, avg_time)
+    Returns:
+        list: List of ExperimentResults objects
+    """
+    if coordinator is not None:
+        from distributed import run_distributed_experiments
+        return run_distributed_experiments(sizes, algorithm_choice, coordinator,
+                                           trial_policy=trial_policy, checkpoints=checkpoints,
+                                           memory=memory, distributions=distributions,
+                                           on_event=on_event, worker_timeout=worker_timeout,
+                                           authkey=authkey)
+    
+    if budget is not None or cell_timeout is not None:
+        # Budgeted sweeps run one killable cell at a time (see planner.py)
+        from planner import run_budgeted_experiments
+        return run_budgeted_experiments(sizes, algorithm_choice, total_budget=budget,
+                                        cell_timeout=cell_timeout, trial_policy=trial_policy,
+                                        checkpoints=checkpoints, memory=memory,
+                                        profilers=profilers, distributions=distributions,
+                                        on_event=on_event)
+    
+    if workers > 1:
+        from scheduler import run_parallel_experiments
+        return run_parallel_experiments(sizes, algorithm_choice, workers=workers,
+                                        trial_policy=trial_policy, checkpoints=checkpoints,
+                                        memory=memory, profilers=profilers,
+                                        distributions=distributions, on_event=on_event)
+    
+    if interleave:
+        from hygiene import run_interleaved_experiments
+        return run_interleaved_experiments(sizes, algorithm_choice, trial_policy=trial_policy,
+                                           checkpoints=checkpoints, memory=memory,
+                                           profilers=profilers, distributions=distributions,
+                                           on_event=on_event)
+    
+    print("=== Custom Algorithm Performance Analysis ===")
+    print("Conducting experiments with your chosen parameters...")
+    print("\nWarming up timing system...")
+    warm_up_timing()
+    
+    all_results = []
+    current_family = None
+    for spec, cell_sizes in build_experiment_plan(sizes, algorithm_choice, distributions):
+        if spec.family != current_family:
+            print("\n" + "="*50)
+            print(FAMILY_HEADINGS[spec.family])
+            print("="*50)
+            if spec.family == "sort":
+                print("Warning: Sorting experiments may take longer for large inputs...")
+            current_family = spec.family
         
-        print(f"  Size {size}: {avg_time:.6f} seconds")
+        all_results.append(run_custom_algorithm_experiment(spec, cell_sizes, trial_policy,
+                                                           checkpoints, memory, profilers,
+                                                           on_event))
     
-    return results
+    return all_results
 
 
-def run_custom_operation_experiment(operation_func, algorithm_name, sizes):
-    """Run list operation experiment with custom sizes."""
-    print(f"\nTesting {algorithm_name.lower()}...")
-    results = ExperimentResults(algorithm_name)
+def run_custom_algorithm_experiment(spec, sizes, trial_policy=None, checkpoints=None,
+                                    memory=False, profilers=None, on_event=None):
+    """Run experiment for one registered algorithm with custom sizes."""
+    print(f"\nTesting {spec.label.lower()}...")
+    results = ExperimentResults(spec.name, batch_size=spec.params.get("batch_size"),
+                                distribution=spec.distribution)
     
     for size in sizes:
-        # Generate random test data
-        data = generate_random_list(size)
+        on_trial = _trial_callback(on_event, spec, size)
         
-        # Time the algorithm
-        avg_time = time_algorithm(operation_func, data, trials=5)
-        results.add_result(size, avg_time)
+        # Reuse a checkpointed cell when resuming, otherwise time the algorithm
+        timing = checkpoints.lookup(spec, size, trial_policy) if checkpoints else None
+        resumed = timing is not None
+        if resumed:
+            complete_resumed_cell(spec, size, timing, memory, profilers)
+        else:
+            timing = measure_cell(spec, size, trial_policy, memory, profilers, on_trial)
+            if checkpoints:
+                checkpoints.save(spec, size, trial_policy, timing)
+        avg_time = timing.mean
+        results.add_result(size, avg_time, timing)
         
-        print(f"  Size {size}: {avg_time:.6f} seconds")
+        note = " (resumed)" if resumed else ""
+        print(f"  Size {size}: {avg_time:.6f} seconds{_describe_metrics(timing)}{note}")
+        if on_event is not None:
+            on_event(cell_event(spec, size, avg_time, timing, resumed=resumed))
     
     return results
 
 
-def create_performance_plot(results_list):
+def _trial_callback(on_event, spec, size):
+    """Get an on_trial hook that reports each sample of a cell as an event (None without on_event)."""
+    if on_event is None:
+        return None
+    return lambda index, seconds: on_event(trial_event(spec, size, index, seconds))
+
+
+def _describe_metrics(timing):
+    """Describe the headline extra measurement of a cell for progress output."""
+    metrics = timing.metrics
+    if "strategy" in metrics:
+        return f" (strategy: {metrics['strategy']})"
+    if "break_even" in metrics:
+        return f" (pays off after {metrics['break_even']:.0f} queries)"
+    if "queries_per_second" in metrics:
+        return f" ({metrics['queries_per_second']:,.0f} queries/second)"
+    if "elements_per_second" in metrics:
+        return f" ({metrics['elements_per_second']:,.0f} elements/second)"
+    if "gb_per_second" in metrics:
+        return f" ({metrics['gb_per_second']:.2f} GB/s)"
+    return ""
+
+
+def create_performance_plot(results_list, plot_filename='algorithm_performance_plot.png', show=True):
     """
     Create a performance plot showing algorithm timing results.
     
     Args:
         results_list: List of ExperimentResults objects
+        plot_filename (str): File to save the plot to
+        show (bool): Try to display the plot on screen after saving it
+        
+    Returns:
+        bool: True if the plot image was saved
     """
     if not PLOTTING_AVAILABLE:
         print("\nNote: matplotlib not available - skipping plot generation.")
         print("To see performance plots, install matplotlib with: pip install matplotlib")
         create_text_based_plot(results_list)
-        return
+        return False
         
     try:
-        # Set up the plot
-        plt.figure(figsize=(12, 8))
+        plt = load_pyplot(show)
+        
+        # Set up the plot, with a second panel for memory if it was measured
+        memory_results = [r for r in results_list if r.peak_memory()[0]]
+        if memory_results:
+            plt.figure(figsize=(20, 8))
+            plt.subplot(1, 2, 1)
+        else:
+            plt.figure(figsize=(12, 8))
         
-        # Colors for different algorithm types
+        # Colors for different algorithms, line styles for their registered family
         colors = ['blue', 'green', 'red', 'purple', 'orange', 'brown', 'pink', 'gray']
+        family_styles = {family: style for family, style in
+                         zip(FAMILY_HEADINGS, ['o-', 's--', '^-.', 'd:', 'v-', 'x--'])}
         
         for i, result in enumerate(results_list):
             if len(result.sizes) > 0:  # Only plot if we have data
                 color = colors[i % len(colors)]
-                plt.plot(result.sizes, result.times, 'o-', 
-                        label=result.algorithm_name, color=color, linewidth=2, markersize=6)
+                spec = get_algorithm(result.algorithm_name)
+                style = family_styles.get(spec.family, 'o-') if spec else 'o-'
+                label = f"{result.label} - O({spec.complexity})" if spec else result.label
+                plt.plot(result.sizes, result.times, style, 
+                        label=label, color=color, linewidth=2, markersize=6)
         
+        value_label = results_list[0].value_label() if results_list else 'Time (seconds)'
         plt.xlabel('Input Size', fontsize=12)
-        plt.ylabel('Time (seconds)', fontsize=12)
-        plt.title('Algorithm Performance Analysis\nTime vs Input Size', fontsize=14, fontweight='bold')
+        plt.ylabel(value_label, fontsize=12)
+        plt.title(f"Algorithm Performance Analysis\n{value_label.split(' (')[0]} vs Input Size",
+                  fontsize=14, fontweight='bold')
         
         # Use log scale if times vary significantly
         max_time = max([max(r.times) for r in results_list if r.times])
         min_time = min([min(r.times) for r in results_list if r.times])
-        if max_time / min_time > 100:
+        if min_time > 0 and max_time / min_time > 100:
             plt.yscale('log')
-            plt.ylabel('Time (seconds) - Log Scale', fontsize=12)
+            plt.ylabel(f'{value_label} - Log Scale', fontsize=12)
         
         plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         plt.grid(True, alpha=0.3)
+        
+        if memory_results:
+            plt.subplot(1, 2, 2)
+            for i, result in enumerate(results_list):
+                sizes, peaks = result.peak_memory()
+                if sizes:
+                    spec = get_algorithm(result.algorithm_name)
+                    style = family_styles.get(spec.family, 'o-') if spec else 'o-'
+                    plt.plot(sizes, peaks, style, label=result.label,
+                             color=colors[i % len(colors)], linewidth=2, markersize=6)
+            plt.xlabel('Input Size', fontsize=12)
+            plt.ylabel('Peak Memory (bytes)', fontsize=12)
+            plt.title('Peak Memory vs Input Size', fontsize=14, fontweight='bold')
+            plt.grid(True, alpha=0.3)
+        
         plt.tight_layout()
         
         # Save the plot
-        plot_filename = 'algorithm_performance_plot.png'
         plt.savefig(plot_filename, dpi=300, bbox_inches='tight')
         print(f"\nPerformance plot saved as: {plot_filename}")
         
         # Try to show the plot
-        try:
-            plt.show()
-            print("Plot displayed on screen.")
-        except:
-            print("Could not display plot on screen, but it has been saved to file.")
+        if show and plt.get_backend().lower() == "agg":
+            print("No display found, so the plot was only saved to file.")
+        elif show:
+            try:
+                plt.show()
+                print("Plot displayed on screen.")
+            except:
+                print("Could not display plot on screen, but it has been saved to file.")
+        plt.close()
+        return True
             
     except Exception as e:
         print(f"\nError creating plot: {e}")
         print("Falling back to text-based visualization...")
         create_text_based_plot(results_list)
+        return False
 
 
 def create_text_based_plot(results_list):
@@ -596,7 +1119,10 @@ def create_text_based_plot(results_list):
     max_time = max(all_times)
     
     print(f"Size range: {min_size:,} to {max_size:,}")
-    print(f"Time range: {min_time:.6f} to {max_time:.6f} seconds")
+    if results_list[0].unit == "seconds":
+        print(f"Time range: {min_time:.6f} to {max_time:.6f} seconds")
+    else:
+        print(f"Range: {results_list[0].format_value(min_time)} to {results_list[0].format_value(max_time)}")
     print()
     
     # Create a simple bar chart representation
@@ -604,7 +1130,7 @@ def create_text_based_plot(results_list):
         if len(result.sizes) == 0:
             continue
             
-        print(f"{result.algorithm_name}:")
+        print(f"{result.label}:")
         for size, time_val in zip(result.sizes, result.times):
             # Create a simple bar representation
             if max_time > 0:
@@ -612,7 +1138,8 @@ def create_text_based_plot(results_list):
                 bar = "█" * bar_length + "░" * (50 - bar_length)
             else:
                 bar = "░" * 50
-            print(f"  Size {size:>6,}: {time_val:>8.6f}s |{bar}|")
+            value = f"{time_val:>8.6f}s" if result.unit == "seconds" else f"{time_val:>12,.0f}"
+            print(f"  Size {size:>6,}: {value} |{bar}|")
         print()
     
     print("Legend: █ = relative time (longer bars = more time)")
@@ -0,0 +1,14 @@
+"""
+Test Configuration
+CS101 Fall 2025 - Activity 05
+
+The modules in src/ import each other by plain name, as they do when run from
+the src directory, so the tests put that directory on the import path.
+"""
+
+import os
+import sys
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SOURCE_DIR not in sys.path:
+    sys.path.insert(0, SOURCE_DIR)
@@ -0,0 +1,228 @@
+"""
+Tests for the regression statistics in baselines.py
+CS101 Fall 2025 - Activity 05
+"""
+
+import json
+import math
+import random
+from itertools import accumulate
+
+import pytest
+
+from algorithms import TimingResult
+from baselines import (
+    DEFAULT_RUN_NOISE, cliffs_delta, compare_to_baseline, load_baseline, mann_whitney_u, run_noise,
+    save_baseline, _exact_u_distribution
+)
+from main import main
+from timer import ExperimentResults
+
+SIZES = [1000, 2000, 4000, 8000]
+
+
+def noisy_samples(median, trials=10, spread=0.01, seed=0):
+    """Per-trial times scattered by up to +-spread around a median."""
+    rng = random.Random(seed)
+    return [median * (1 + rng.uniform(-spread, spread)) for _ in range(trials)]
+
+
+def make_results(name, samples_by_size):
+    """Build an ExperimentResults from per-trial samples for each size."""
+    results = ExperimentResults(name)
+    for size, samples in samples_by_size.items():
+        timing = TimingResult(samples, 1, 0.0)
+        results.add_result(size, timing.mean, timing)
+    return results
+
+
+@pytest.mark.parametrize("first, second, expected_u, expected_p", [
+    # Fully separated: 1 of the 20 orderings in each tail
+    ([1, 2, 3], [4, 5, 6], 0, 2 / 20),
+    ([4, 5, 6], [1, 2, 3], 9, 2 / 20),
+    ([1, 2, 3, 4, 5], [6, 7, 8, 9, 10], 0, 2 / 252),
+    ([1, 3, 5], [2, 4, 6], 3, 14 / 20),                  # P(U <= 3) = (1 + 1 + 2 + 3) / 20
+])
+def test_mann_whitney_exact_known_values(first, second, expected_u, expected_p):
+    u, p_value = mann_whitney_u(first, second)
+    assert u == expected_u
+    assert p_value == pytest.approx(expected_p)
+
+
+def test_mann_whitney_identical_samples_are_not_significant():
+    _, p_value = mann_whitney_u([1, 2, 3, 4], [1, 2, 3, 4])
+    assert p_value == pytest.approx(1.0)
+
+
+def test_mann_whitney_ties_use_corrected_normal_approximation():
+    # Average ranks give U = 3; the tie-corrected variance is 9/12 * (7 - 48/30) = 4.05
+    u, p_value = mann_whitney_u([1, 1, 2], [1, 2, 2])
+    assert u == 3
+    assert p_value == pytest.approx(math.erfc((1.5 - 0.5) / math.sqrt(4.05) / math.sqrt(2)))
+    assert p_value == pytest.approx(0.6193, abs=1e-4)
+
+
+def test_mann_whitney_normal_approximation_agrees_with_exact_distribution():
+    # 21 x 20 is just past the exact limit, so the approximation is used
+    first = list(range(0, 42, 2))
+    second = [value + 5 for value in range(1, 41, 2)]
+    u, p_value = mann_whitney_u(first, second)
+    counts = _exact_u_distribution(len(first), len(second))
+    exact = 2 * list(accumulate(counts))[int(min(u, len(first) * len(second) - u))] / sum(counts)
+    assert p_value == pytest.approx(exact, rel=0.05)
+
+
+def test_mann_whitney_needs_values_on_both_sides():
+    with pytest.raises(ValueError):
+        mann_whitney_u([], [1.0])
+
+
+@pytest.mark.parametrize("first, second, expected", [
+    ([1, 2, 3], [4, 5, 6], -1.0),
+    ([4, 5, 6], [1, 2, 3], 1.0),
+    ([1, 2], [1, 2], 0.0),
+    ([2, 3], [1, 2], 0.75),                              # 3 of 4 pairs greater, 1 tied
+    ([1, 3], [2], 0.0),
+])
+def test_cliffs_delta_known_values(first, second, expected):
+    assert cliffs_delta(first, second) == pytest.approx(expected)
+
+
+def test_slower_cells_are_reported_as_a_regression():
+    baseline = {"Merge Sort": {size: [noisy_samples(size * 1e-6, seed=size)] for size in SIZES}}
+    current = make_results("Merge Sort", {size: noisy_samples(size * 1.5e-6, seed=size + 1)
+                                          for size in SIZES})
+    report = compare_to_baseline([current], baseline)
+    assert report.regressed
+    assert [cell.status for cell in report.cells] == ["slower"] * len(SIZES)
+    assert all(cell.adjusted_p < 0.05 and cell.effect == 1.0 for cell in report.cells)
+    assert not report.complexity_changes
+
+
+def test_unchanged_cells_are_not_a_regression():
+    baseline = {"Merge Sort": {size: [noisy_samples(size * 1e-6, seed=size)] for size in SIZES}}
+    current = make_results("Merge Sort", {size: noisy_samples(size * 1e-6, seed=size + 1)
+                                          for size in SIZES})
+    report = compare_to_baseline([current], baseline)
+    assert not report.regressed
+    assert {cell.status for cell in report.cells} == {"unchanged"}
+
+
+def test_small_slowdowns_are_not_a_regression():
+    # Clearly significant, but only 5% slower, below the 10% minimum slowdown
+    baseline = {"Merge Sort": {size: [noisy_samples(size * 1e-6, spread=0.001, seed=size)]
+                               for size in SIZES}}
+    current = make_results("Merge Sort", {size: noisy_samples(size * 1.05e-6, spread=0.001,
+                                                              seed=size + 1) for size in SIZES})
+    report = compare_to_baseline([current], baseline)
+    assert not report.regressed
+    assert all(cell.adjusted_p < 0.05 for cell in report.cells)
+
+
+def test_faster_cells_are_not_a_regression():
+    baseline = {"Merge Sort": {size: [noisy_samples(size * 1e-6, seed=size)] for size in SIZES}}
+    current = make_results("Merge Sort", {size: noisy_samples(size * 0.5e-6, seed=size + 1)
+                                          for size in SIZES})
+    report = compare_to_baseline([current], baseline)
+    assert not report.regressed
+    assert {cell.status for cell in report.cells} == {"faster"}
+
+
+def test_holm_correction_keeps_adjusted_p_values_ordered():
+    baseline = {"Merge Sort": {size: [noisy_samples(size * 1e-6, seed=size)] for size in SIZES}}
+    current = make_results("Merge Sort", {size: noisy_samples(size * factor * 1e-6, seed=size + 1)
+                                          for size, factor in zip(SIZES, [1.0, 1.005, 1.02, 1.5])})
+    report = compare_to_baseline([current], baseline)
+    ordered = sorted(report.cells, key=lambda cell: cell.p_value)
+    for rank, cell in enumerate(ordered):
+        assert cell.adjusted_p >= min(1.0, cell.p_value * (len(ordered) - rank)) - 1e-12
+    assert [cell.adjusted_p for cell in ordered] == sorted(cell.adjusted_p for cell in ordered)
+
+
+def test_worse_growth_is_reported_as_a_regression():
+    pytest.importorskip("numpy")
+    sizes = [1000, 2000, 4000, 8000, 16000]
+    baseline = {"Quick Sort": {n: [noisy_samples(n * math.log2(n) * 1e-8, seed=n)] for n in sizes}}
+    current = make_results("Quick Sort", {n: noisy_samples(n * n * 1e-9, seed=n + 1)
+                                          for n in sizes})
+    report = compare_to_baseline([current], baseline)
+    assert report.regressed
+    [(algorithm, baseline_fit, current_fit)] = report.complexity_changes
+    assert algorithm == "Quick Sort"
+    assert baseline_fit.model == "n log n"
+    assert current_fit.model == "n^2"
+
+
+def test_growth_is_not_compared_with_too_few_sizes():
+    pytest.importorskip("numpy")
+    sizes = [500, 1000, 2000]
+    baseline = {"Heap Sort": {n: [noisy_samples(n * math.log2(n) * 1e-8, seed=n)] for n in sizes}}
+    current = make_results("Heap Sort", {n: noisy_samples(n ** 1.3 * 1e-8, seed=n + 1)
+                                         for n in sizes})
+    report = compare_to_baseline([current], baseline)
+    assert not report.complexity_changes
+
+
+def test_run_noise_is_the_spread_of_the_repeat_runs():
+    assert run_noise([[1.0, 1.0]]) == DEFAULT_RUN_NOISE
+    assert run_noise([[1.0, 1.02], [1.05], [0.98]]) == DEFAULT_RUN_NOISE
+    assert run_noise([[1.0, 1.02], [1.5], [0.98]]) == pytest.approx(1.5 / 0.98 - 1)
+
+
+def test_run_to_run_drift_is_not_a_regression():
+    # Unchanged code, but this run happened to land 25% slower on every cell
+    baseline = {"Merge Sort": {size: [noisy_samples(size * 1e-6, seed=size)] for size in SIZES}}
+    current = make_results("Merge Sort", {size: noisy_samples(size * 1.25e-6, seed=size + 1)
+                                          for size in SIZES})
+    report = compare_to_baseline([current], baseline)
+    assert not report.regressed
+    assert all(cell.adjusted_p < 0.05 for cell in report.cells)
+
+
+def test_repeat_runs_outvote_one_fast_baseline_run():
+    # One baseline run was 40% faster than the others; the rerun matches the others
+    baseline = {"Merge Sort": {size: [noisy_samples(size * factor * 1e-6, seed=size + k)
+                                      for k, factor in enumerate([0.6, 1.0, 1.02])]
+                               for size in SIZES}}
+    current = make_results("Merge Sort", {size: noisy_samples(size * 1.01e-6, seed=size + 5)
+                                          for size in SIZES})
+    report = compare_to_baseline([current], baseline)
+    assert not report.regressed
+    assert all(cell.noise == pytest.approx(1.02 / 0.6 - 1, rel=0.05) for cell in report.cells)
+
+
+def test_added_runs_are_kept_as_repeats(tmp_path):
+    first = make_results("Merge Sort", {1000: [1.0, 1.1]})
+    second = make_results("Merge Sort", {1000: [2.0, 2.1], 2000: [4.0]})
+    save_baseline([first], "b", str(tmp_path))
+    save_baseline([second], "b", str(tmp_path), add_run=True)
+    assert load_baseline("b", str(tmp_path)) == {"Merge Sort": {1000: [[1.0, 1.1], [2.0, 2.1]],
+                                                                2000: [[4.0]]}}
+    # Saving without add_run starts the baseline again
+    save_baseline([first], "b", str(tmp_path))
+    assert load_baseline("b", str(tmp_path)) == {"Merge Sort": {1000: [[1.0, 1.1]]}}
+
+
+def test_baselines_saved_before_repeat_runs_still_load(tmp_path):
+    (tmp_path / "old.json").write_text(json.dumps({
+        "name": "old", "created": "2025-10-01T12:00:00",
+        "algorithms": {"Merge Sort": {"1000": {"samples": [1.0, 1.1], "loops": 1}}}}))
+    assert load_baseline("old", str(tmp_path)) == {"Merge Sort": {1000: [[1.0, 1.1]]}}
+
+
+def test_rerun_of_unchanged_code_passes_the_baseline_check(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    args = ["--algorithms", "search", "--sizes", "200,400,800", "--no-plot", "--no-database",
+            "--no-checkpoints", "--output", "results.txt", "--baseline-dir", "baselines"]
+    assert main(args + ["--save-baseline", "b1"]) == 0
+    for _ in range(2):
+        assert main(args + ["--add-to-baseline", "b1"]) == 0
+    assert main(args + ["--compare-baseline", "b1"]) == 0
+
+
+def test_cells_missing_from_the_baseline_are_skipped():
+    baseline = {"Merge Sort": {1000: [noisy_samples(1e-3)]}}
+    current = make_results("Heap Sort", {1000: noisy_samples(2e-3)})
+    report = compare_to_baseline([current], baseline)
+    assert report.cells == []
+    assert not report.regressed
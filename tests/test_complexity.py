@@ -0,0 +1,100 @@
+"""
+Tests for complexity-model selection in complexity.py
+CS101 Fall 2025 - Activity 05
+"""
+
+import math
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from complexity import POWER_LAW, fit_complexity, model_exponent  # noqa: E402  (after the NumPy check)
+
+SIZES = [1000, 2000, 4000, 8000, 16000, 32000]
+
+
+def synthetic_times(cost, noise=0.01, seed=0):
+    """Times following cost(n), with up to +-noise relative jitter."""
+    rng = random.Random(seed)
+    return [cost(n) * (1 + rng.uniform(-noise, noise)) for n in SIZES]
+
+
+@pytest.mark.parametrize("model, cost", [
+    ("1", lambda n: 2e-6),
+    ("log n", lambda n: 1e-7 * math.log2(n)),
+    ("n", lambda n: 3e-8 * n),
+    ("n log n", lambda n: 2e-8 * n * math.log2(n)),
+    ("n^2", lambda n: 5e-10 * n * n),
+    ("n^3", lambda n: 1e-13 * n ** 3),
+])
+def test_fit_picks_the_generating_model(model, cost):
+    fit = fit_complexity(SIZES, synthetic_times(cost))
+    assert fit.model == model
+    assert fit.r_squared > 0.95 or model == "1"
+
+
+def test_fit_recovers_the_scale():
+    fit = fit_complexity(SIZES, [5e-10 * n * n for n in SIZES])
+    assert fit.model == "n^2"
+    assert fit.predict(64000) == pytest.approx(5e-10 * 64000 ** 2, rel=1e-3)
+    assert fit.exponent == pytest.approx(2.0, abs=0.01)
+
+
+def test_fit_allows_a_constant_start_up_cost():
+    # A fixed overhead on top of linear work is still linear
+    fit = fit_complexity(SIZES, synthetic_times(lambda n: 1e-4 + 3e-8 * n))
+    assert fit.model == "n"
+    assert fit.coefficients["intercept"] > 0
+
+
+def test_fit_prefers_the_power_law_for_growth_between_named_models():
+    fit = fit_complexity(SIZES, synthetic_times(lambda n: 1e-9 * n ** 1.5, noise=0.001))
+    assert fit.model == POWER_LAW
+    assert fit.exponent == pytest.approx(1.5, abs=0.02)
+    assert fit.label == "O(n^1.50)"
+
+
+def test_fit_confidence_is_a_probability():
+    fit = fit_complexity(SIZES, synthetic_times(lambda n: 3e-8 * n))
+    assert 0 < fit.confidence <= 1
+    assert set(fit.scores) >= {"1", "log n", "n", "n log n", "n^2", "n^3"}
+
+
+def test_fit_needs_two_distinct_sizes():
+    assert fit_complexity([1000, 1000], [1e-3, 1.1e-3]) is None
+    assert fit_complexity([1000], [1e-3]) is None
+
+
+def test_three_points_choose_a_named_model_over_the_power_law():
+    # Bubble sort at the interactive minimum of three sizes: a 2-constant power
+    # law would fit it exactly, so it must not be a candidate
+    fit = fit_complexity([200, 400, 800], [0.003638, 0.016419, 0.082699])
+    assert fit.model == "n^2"
+    assert POWER_LAW not in fit.scores
+    assert fit.confidence > 0.8
+
+
+def test_confidence_is_not_diluted_by_the_power_law():
+    sizes = [200, 400, 800]
+    assert fit_complexity(sizes, [4e-9 * n * n for n in sizes]).confidence > 0.99
+    # With enough points the power law is scored, but a named fit keeps its weight
+    fit = fit_complexity(SIZES, [5e-10 * n * n for n in SIZES])
+    assert POWER_LAW in fit.scores
+    assert fit.confidence > 0.99
+
+
+def test_a_power_law_matches_the_named_model_it_grows_like():
+    fit = fit_complexity(SIZES, synthetic_times(lambda n: 1e-9 * n ** 1.5, noise=0.001))
+    assert not fit.matches("n")
+    assert not fit.matches("n^2")
+    fit.exponent = model_exponent("n log n", min(SIZES), max(SIZES)) + 0.01
+    assert fit.matches("n log n")
+    assert not fit.matches("n")
+
+
+def test_named_fits_match_only_their_own_model():
+    fit = fit_complexity(SIZES, [5e-10 * n * n for n in SIZES])
+    assert fit.matches("n^2")
+    assert not fit.matches("n^3")
@@ -0,0 +1,46 @@
+"""
+Tests for the deterministic operation-counting mode in counting.py
+CS101 Fall 2025 - Activity 05
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from counting import count_cell
+from registry import get_algorithm
+
+COUNT_SCRIPT = "from counting import count_cell; from registry import get_algorithm; " \
+               "import json; print(json.dumps(count_cell(get_algorithm({name!r}), 500)))"
+
+
+@pytest.fixture(autouse=True)
+def dataset_cache_in_tmp(tmp_path, monkeypatch):
+    """Keep the dataset cache the cells build out of the source tree."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize("name", ["Linear Search", "Binary Search"])
+def test_search_counts_are_the_same_on_every_call(name):
+    spec = get_algorithm(name)
+    assert count_cell(spec, 500) == count_cell(spec, 500)
+
+
+@pytest.mark.parametrize("name", ["Linear Search", "Binary Search"])
+def test_search_counts_are_the_same_in_another_process(name):
+    # A new process gets a new string hash seed, which must not change the targets
+    source_dir = sys.modules["counting"].__file__.rsplit(os.sep, 1)[0]
+    env = dict(os.environ, PYTHONHASHSEED="12345", PYTHONPATH=source_dir)
+    output = subprocess.run([sys.executable, "-c", COUNT_SCRIPT.format(name=name)], env=env,
+                            capture_output=True, text=True, check=True).stdout
+    assert json.loads(output.strip().splitlines()[-1]) == count_cell(get_algorithm(name), 500)
+
+
+def test_sort_counts_are_the_same_on_every_call():
+    spec = get_algorithm("Merge Sort")
+    first = count_cell(spec, 200)
+    assert first == count_cell(spec, 200)
+    assert first["comparisons"] > 0 and first["writes"] > 0